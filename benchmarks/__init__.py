@@ -0,0 +1 @@
+# This file is needed for the benchmarks be able to run properly
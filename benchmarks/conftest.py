@@ -0,0 +1,59 @@
+import os
+import json
+import pytest
+
+
+# Measured memory may exceed its baseline by this fraction before a benchmark fails
+MEMORY_TOLERANCE = 0.25
+MEMORY_BASELINES_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'baselines', 'memory.json')
+
+
+def pytest_addoption(parser):
+    parser.addoption('--save-memory-baselines', action='store_true',
+                     help='store the measured memory as the new baselines instead of comparing against them')
+
+
+def pytest_configure(config):
+    # The benchmarks always run headless and qtpy uses the binding selected for pytest-qt
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    os.environ.setdefault('QT_API', config.getini('qt_api'))
+
+
+@pytest.fixture(scope='session')
+def memory_baselines(request) -> dict:
+    """Load the stored memory baselines by binding and write them back
+    at the end of the session if they are being saved"""
+
+    memory_baselines = {}
+    if os.path.exists(MEMORY_BASELINES_PATH):
+        with open(MEMORY_BASELINES_PATH, 'r') as file:
+            memory_baselines = json.load(file)
+
+    yield memory_baselines
+
+    if request.config.getoption('--save-memory-baselines'):
+        with open(MEMORY_BASELINES_PATH, 'w') as file:
+            json.dump(memory_baselines, file, indent=4, sort_keys=True)
+            file.write('\n')
+
+
+@pytest.fixture
+def check_memory(request, memory_baselines):
+    """Get a function that compares a measured memory use of the current
+    binding against its stored baseline, or stores it as the new baseline"""
+
+    import qtpy
+
+    def check(name: str, memory: float):
+        binding_baselines = memory_baselines.setdefault(qtpy.API_NAME, {})
+        if request.config.getoption('--save-memory-baselines'):
+            binding_baselines[name] = round(memory, 2)
+            return
+
+        baseline = binding_baselines.get(name)
+        if baseline is None:
+            pytest.skip('no memory baseline stored for {} with {}'.format(name, qtpy.API_NAME))
+        assert memory <= baseline * (1 + MEMORY_TOLERANCE), \
+            '{} uses {:.2f} KiB, baseline is {:.2f} KiB'.format(name, memory, baseline)
+
+    return check
@@ -0,0 +1,166 @@
+import tracemalloc
+from qtpy.QtCore import QLocale, QStringListModel
+from qtpy.QtWidgets import QApplication, QTableView
+from src.pyqtcountrypicker import CountryPicker, CountryItemDelegate
+from src.pyqtcountrypicker.catalog import get_country_catalog
+from src.pyqtcountrypicker.countries import countries
+
+
+EU_COUNTRIES = [
+    'at', 'be', 'bg', 'hr', 'cy', 'cz', 'dk', 'ee', 'fi',
+    'fr', 'de', 'gr', 'hu', 'ie', 'it', 'lt', 'lu', 'lv',
+    'mt', 'nl', 'pl', 'pt', 'ro', 'sk', 'si', 'es', 'se'
+]
+
+# Renaming every tenth country moves rows all over the list
+RENAMED_COUNTRIES = {country_code: 'Renamed ' + country_code for country_code in list(countries.keys())[::10]}
+
+MEMORY_INSTANCE_COUNT = 500
+
+TABLE_ROW_COUNT = 50000
+
+BATCH_CODE_COUNT = 100000
+
+
+def create_country_picker(qtbot) -> CountryPicker:
+    """Create a picker after the shared models and flags have been created
+
+    :param qtbot: qtbot fixture
+    :return: new picker
+    """
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    return country_picker
+
+
+def test_construction(benchmark, qtbot):
+    """Benchmark creating a picker"""
+
+    create_country_picker(qtbot)
+    benchmark(CountryPicker)
+
+
+def test_set_countries(benchmark, qtbot):
+    """Benchmark limiting all countries to a subset"""
+
+    country_picker = create_country_picker(qtbot)
+    benchmark.pedantic(country_picker.setCountries, args=(EU_COUNTRIES,), rounds=200,
+                       setup=lambda: country_picker.setCountries(list(countries.keys())))
+
+
+def test_set_country_names(benchmark, qtbot):
+    """Benchmark renaming countries that move to other rows"""
+
+    country_picker = create_country_picker(qtbot)
+    benchmark.pedantic(country_picker.setCountryNames, args=(RENAMED_COUNTRIES,), rounds=200,
+                       setup=country_picker.resetCountryNames)
+
+
+def test_set_locale(benchmark, qtbot):
+    """Benchmark switching all names to another locale"""
+
+    country_picker = create_country_picker(qtbot)
+    benchmark.pedantic(country_picker.setLocale, args=(QLocale('de_DE'),), rounds=200,
+                       setup=lambda: country_picker.setLocale(QLocale('en_US')))
+
+
+def test_set_current_country(benchmark, qtbot):
+    """Benchmark selecting countries"""
+
+    country_picker = create_country_picker(qtbot)
+    country_codes = iter(list(countries.keys()) * 1000)
+    benchmark(lambda: country_picker.setCurrentCountry(next(country_codes)))
+
+
+def test_toggle_country_flags(benchmark, qtbot):
+    """Benchmark enabling and disabling the flags"""
+
+    country_picker = create_country_picker(qtbot)
+    benchmark(lambda: country_picker.setCountryFlagsEnabled(not country_picker.isCountryFlagsEnabled()))
+
+
+def test_first_popup_open(benchmark, qtbot):
+    """Benchmark opening the dropdown of a new picker for the first time"""
+
+    country_pickers = []
+
+    def create():
+        country_picker = create_country_picker(qtbot)
+        country_picker.show()
+        country_pickers.append(country_picker)
+        return (country_picker,), {}
+
+    def open_popup(country_picker: CountryPicker):
+        country_picker.showPopup()
+        country_picker.hidePopup()
+
+    benchmark.pedantic(open_popup, setup=create, rounds=20)
+
+
+def test_popup_open(benchmark, qtbot):
+    """Benchmark opening the dropdown again"""
+
+    country_picker = create_country_picker(qtbot)
+    country_picker.show()
+
+    def open_popup():
+        country_picker.showPopup()
+        country_picker.hidePopup()
+
+    benchmark(open_popup)
+
+
+def test_normalize_codes(benchmark):
+    """Benchmark normalizing a batch of codes in mixed formats and cases"""
+
+    country_catalog = get_country_catalog()
+    codes = [code for country_code in countries.keys()
+             for code in [country_code, country_code.upper(), country_catalog.convertCode(country_code, 'alpha3')]]
+    codes = (codes * (BATCH_CODE_COUNT // len(codes) + 1))[:BATCH_CODE_COUNT]
+    benchmark(country_catalog.normalizeCodes, codes)
+
+
+def test_memory_per_instance(qtbot, check_memory, record_property):
+    """Measure the Python memory of a picker while many pickers are alive,
+    the footprint is reported as the picker_memory_kib property"""
+
+    create_country_picker(qtbot)
+
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    country_pickers = [CountryPicker() for _ in range(MEMORY_INSTANCE_COUNT)]
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    memory = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, 'filename'))
+    for country_picker in country_pickers:
+        country_picker.deleteLater()
+    QApplication.processEvents()
+
+    record_property('picker_memory_kib', round(memory / 1024 / MEMORY_INSTANCE_COUNT, 2))
+    check_memory('picker', memory / 1024 / MEMORY_INSTANCE_COUNT)
+
+
+def test_scroll_country_table(benchmark, qtbot):
+    """Benchmark scrolling a table with a country column by a page"""
+
+    # The codes are passed at once, creating an item per row crashes PySide6 6.12 with a refcount error
+    country_codes = list(countries.keys())
+    model = QStringListModel([country_codes[row % len(country_codes)] for row in range(TABLE_ROW_COUNT)])
+
+    table_view = QTableView()
+    qtbot.addWidget(table_view)
+    table_view.setModel(model)
+    table_view.setItemDelegate(CountryItemDelegate(table_view))
+    table_view.resize(400, 600)
+    table_view.show()
+
+    scroll_bar = table_view.verticalScrollBar()
+    scroll_values = iter(list(range(0, scroll_bar.maximum(), scroll_bar.pageStep())) * 100)
+
+    def scroll():
+        scroll_bar.setValue(next(scroll_values))
+        table_view.viewport().repaint()
+
+    benchmark(scroll)
@@ -0,0 +1,67 @@
+"""Compare the cold-start cost of loading all flags from the individual
+PNG files against loading them from the packed flag atlas
+
+Every run happens in a fresh interpreter, so nothing is cached by Qt or
+Python between runs. Run from the repository root:
+
+    python benchmarks/flag_loading_benchmark.py
+"""
+
+import os
+import sys
+import statistics
+import subprocess
+
+
+RUNS = 15
+
+SETUP = '''
+import os, sys, time
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, 'src')
+from qtpy.QtWidgets import QApplication
+from qtpy.QtGui import QIcon, QPixmap
+from pyqtcountrypicker.countries import countries
+app = QApplication([])
+start = time.perf_counter()
+'''
+
+PER_FILE = SETUP + '''
+flags_dir = os.path.join('src', 'pyqtcountrypicker', 'flags')
+icons = [QIcon(os.path.join(flags_dir, '{}.png'.format(code))) for code in countries]
+pixmaps = [icon.pixmap(20, 15) for icon in icons]
+print(time.perf_counter() - start)
+'''
+
+ATLAS = SETUP + '''
+from pyqtcountrypicker.flag_atlas import FlagAtlas
+atlas = FlagAtlas()
+pixmaps = []
+for code in countries:
+    pixmap = QPixmap()
+    pixmap.loadFromData(atlas.getFlagData(code).tobytes(), 'PNG')
+    pixmaps.append(pixmap.scaled(20, 15))
+print(time.perf_counter() - start)
+'''
+
+
+def run(code: str) -> float:
+    """Run a benchmark in a fresh interpreter
+
+    :param code: benchmark code printing its duration
+    :return: median duration in milliseconds
+    """
+
+    durations = []
+    for _ in range(RUNS):
+        output = subprocess.check_output([sys.executable, '-c', code], stderr=subprocess.DEVNULL)
+        durations.append(float(output.decode().strip().splitlines()[-1]) * 1000)
+    return statistics.median(durations)
+
+
+if __name__ == '__main__':
+    os.chdir(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+    per_file = run(PER_FILE)
+    atlas = run(ATLAS)
+    print('per-file QIcon(path): {:8.2f} ms'.format(per_file))
+    print('flag atlas:           {:8.2f} ms'.format(atlas))
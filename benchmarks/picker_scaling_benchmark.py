@@ -0,0 +1,56 @@
+"""Measure how the construction time and the Python memory of CountryPicker
+instances scale with the number of instances alive at the same time
+
+Run from the repository root:
+
+    python benchmarks/picker_scaling_benchmark.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'src'))
+
+from qtpy.QtWidgets import QApplication
+from pyqtcountrypicker import CountryPicker
+
+
+INSTANCE_COUNTS = [1, 10, 100, 1000]
+
+
+def measure(instance_count: int) -> tuple[float, float]:
+    """Create the given number of pickers and measure the cost per instance
+
+    :param instance_count: number of pickers to create
+    :return: construction time in milliseconds and Python memory in KiB per instance
+    """
+
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    country_pickers = [CountryPicker() for _ in range(instance_count)]
+    duration = time.perf_counter() - start
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    memory = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, 'filename'))
+    for country_picker in country_pickers:
+        country_picker.deleteLater()
+    QApplication.processEvents()
+
+    return duration * 1000 / instance_count, memory / 1024 / instance_count
+
+
+if __name__ == '__main__':
+    app = QApplication([])
+
+    # Create the shared models and flags outside of the measurements
+    CountryPicker().deleteLater()
+
+    print('{:>10} {:>16} {:>16}'.format('instances', 'ms / instance', 'KiB / instance'))
+    for instance_count in INSTANCE_COUNTS:
+        duration, memory = measure(instance_count)
+        print('{:>10} {:>16.3f} {:>16.2f}'.format(instance_count, duration, memory))
@@ -0,0 +1,83 @@
+"""Run the benchmark suite headless for every installed Qt binding and
+compare the results against the stored baselines, a benchmark whose median
+time is more than twice its baseline or that uses more than 25% more memory
+than its baseline fails the run
+
+Requires the packages in benchmarks/requirements.txt. Run from the repository root:
+
+    python benchmarks/run_benchmarks.py
+
+To store the current results as the new baselines:
+
+    python benchmarks/run_benchmarks.py --save
+"""
+
+import os
+import sys
+import importlib.util
+import importlib.metadata
+import subprocess
+
+
+BINDINGS = {
+    'pyqt5': 'PyQt5',
+    'pyqt6': 'PyQt6',
+    'pyside6': 'PySide6'
+}
+
+# Binding versions that lose a reference to None for every empty value a Python
+# model returns to Qt, the interpreter aborts after a few thousand calls
+BROKEN_BINDING_VERSIONS = {
+    'PySide6': ['6.12.0']
+}
+
+# Single runs of the same tree differ by up to about 80% in the median on shared machines,
+# so only a median that more than doubles fails, the minimum varies even more
+COMPARE_FAIL = 'median:100%'
+
+BENCHMARKS_DIR = os.path.dirname(os.path.realpath(__file__))
+BASELINES_DIR = os.path.join(BENCHMARKS_DIR, 'baselines')
+
+
+def run_benchmarks(binding: str, save: bool) -> int:
+    """Run the benchmark suite with a binding in a fresh interpreter
+
+    :param binding: qtpy name of the binding
+    :param save: whether to store the results as the new baselines
+    :return: exit code of the run
+    """
+
+    command = [
+        sys.executable, '-m', 'pytest', BENCHMARKS_DIR, '-q',
+        '-o', 'qt_api={}'.format(binding),
+        '--benchmark-storage=file://{}'.format(os.path.join(BASELINES_DIR, binding)),
+        '--benchmark-sort=name'
+    ]
+    if save:
+        command += ['--benchmark-save=baseline', '--save-memory-baselines']
+    else:
+        command += ['--benchmark-compare', '--benchmark-compare-fail={}'.format(COMPARE_FAIL)]
+
+    environment = dict(os.environ, QT_API=binding, QT_QPA_PLATFORM='offscreen')
+    return subprocess.call(command, env=environment)
+
+
+if __name__ == '__main__':
+    save = '--save' in sys.argv[1:]
+    failed_bindings = []
+
+    for binding, module_name in BINDINGS.items():
+        if importlib.util.find_spec(module_name) is None:
+            print('Skipping {}, it is not installed'.format(module_name))
+            continue
+        version = importlib.metadata.version(module_name)
+        if version in BROKEN_BINDING_VERSIONS.get(module_name, []):
+            print('Skipping {} {}, it crashes with a reference counting error'.format(module_name, version))
+            continue
+        print('Running benchmarks with {}'.format(module_name))
+        if run_benchmarks(binding, save) != 0:
+            failed_bindings.append(module_name)
+
+    if failed_bindings:
+        print('Benchmarks failed with {}'.format(', '.join(failed_bindings)))
+        sys.exit(1)
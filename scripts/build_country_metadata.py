@@ -0,0 +1,180 @@
+"""Generate src/pyqtcountrypicker/country_metadata.py, the alpha-3 and numeric codes,
+calling codes, currencies and regions of all countries in countries.py
+
+Requires Babel, phonenumbers and country_converter, as well as the ISO 3166-1
+data of the iso-codes project. Run from the repository root:
+
+    python scripts/build_country_metadata.py --iso-codes /usr/share/iso-codes/json/iso_3166-1.json
+"""
+
+import os
+import sys
+import csv
+import json
+import argparse
+import textwrap
+import itertools
+import importlib.util
+import phonenumbers
+from phonenumbers import PhoneMetadata
+from babel.numbers import get_territory_currencies
+
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+METADATA_PATH = os.path.join(REPOSITORY_DIR, 'src', 'pyqtcountrypicker', 'country_metadata.py')
+DEFAULT_ISO_CODES_PATH = '/usr/share/iso-codes/json/iso_3166-1.json'
+
+# Country codes that are not ISO 3166-1 codes and the ISO codes of other countries without data
+TERRITORY_CODES = {'sh-ac': 'AC', 'sh-hl': 'SH'}
+EXTRA_ALPHA3_CODES = {'xk': 'XKX'}
+EXTRA_REGIONS = {'sh-ac': 'Africa'}
+
+COLUMN_NAMES = ['country_codes', 'alpha3_codes', 'numeric_codes', 'dial_codes', 'currencies', 'regions']
+
+
+def get_territory_code(country_code: str) -> str:
+    """Get the territory code of a country that Babel and phonenumbers use
+
+    :param country_code: country code of the country
+    :return: territory code
+    """
+
+    return TERRITORY_CODES.get(country_code, country_code.upper())
+
+
+def read_iso_countries(iso_codes_path: str) -> dict[str, dict]:
+    """Read the ISO 3166-1 entries of the iso-codes project
+
+    :param iso_codes_path: path of iso_3166-1.json
+    :return: dict containing the entries by alpha-2 code
+    """
+
+    with open(iso_codes_path, 'r', encoding='utf-8') as file:
+        return {entry['alpha_2']: entry for entry in json.load(file)['3166-1']}
+
+
+def read_regions() -> dict[str, str]:
+    """Read the continents of the countries from the data of country_converter
+
+    :return: dict containing the continents by alpha-3 code
+    """
+
+    converter_dir = importlib.util.find_spec('country_converter').submodule_search_locations[0]
+    with open(os.path.join(converter_dir, 'country_data.tsv'), 'r', encoding='utf-8') as file:
+        return {row['ISO3']: row['continent'].replace('America', 'Americas')
+                for row in csv.DictReader(file, delimiter='\t')}
+
+
+def build_columns(country_codes: list[str], iso_countries: dict[str, dict],
+                  regions_by_alpha3: dict[str, str]) -> dict[str, list[str]]:
+    """Collect the metadata of the countries
+
+    :param country_codes: country codes in the order of countries.py
+    :param iso_countries: ISO 3166-1 entries by alpha-2 code
+    :param regions_by_alpha3: continents by alpha-3 code
+    :return: dict containing the column values by column name
+    """
+
+    columns = {name: [] for name in COLUMN_NAMES}
+    for country_code in country_codes:
+        territory_code = get_territory_code(country_code)
+        iso_country = iso_countries.get(territory_code, {})
+        alpha3_code = iso_country.get('alpha_3', EXTRA_ALPHA3_CODES.get(country_code, ''))
+        columns['country_codes'].append(country_code)
+        columns['alpha3_codes'].append(alpha3_code)
+        columns['numeric_codes'].append(iso_country.get('numeric', ''))
+        columns['dial_codes'].append(str(phonenumbers.country_code_for_region(territory_code)))
+        columns['currencies'].append(get_territory_currencies(territory_code, tender=True)[0])
+        columns['regions'].append(EXTRA_REGIONS.get(country_code, regions_by_alpha3.get(alpha3_code, '')))
+    return columns
+
+
+def expand_leading_digits(pattern: str) -> list[str]:
+    """Expand the leading digits pattern of phonenumbers into prefixes, the
+    patterns of the shared calling codes only consist of alternatives of
+    digits and digit classes
+
+    :param pattern: leading digits pattern
+    :return: prefixes matching the pattern
+    """
+
+    prefixes = []
+    for alternative in pattern.split('|'):
+        digit_sets = []
+        for index, part in enumerate(alternative.split('[')):
+            if index > 0:
+                digit_class, part = part.split(']')
+                digit_sets.append([digit for digit in '0123456789' if digit in digit_class])
+            digit_sets += [[digit] for digit in part]
+        prefixes += [''.join(digits) for digits in itertools.product(*digit_sets)]
+    return prefixes
+
+
+def build_dial_prefixes(columns: dict[str, list[str]]) -> dict[str, tuple[str, ...]]:
+    """Map the calling codes shared by several countries to their countries, main country
+    first, and the longer prefixes that belong to one of them, such as the NANP area codes
+
+    :param columns: column values by column name
+    :return: dict containing the country codes by dialing prefix
+    """
+
+    dial_prefixes = {}
+    for dial_code in sorted(set(columns['dial_codes']), key=int):
+        country_codes = [country_code for country_code, country_dial_code
+                         in zip(columns['country_codes'], columns['dial_codes']) if country_dial_code == dial_code]
+        if len(country_codes) == 1:
+            continue
+        region_codes = phonenumbers.COUNTRY_CODE_TO_REGION_CODE[int(dial_code)]
+        country_codes.sort(key=lambda country_code: region_codes.index(get_territory_code(country_code)))
+        dial_prefixes[dial_code] = tuple(country_codes)
+
+        for country_code in country_codes[1:]:
+            territory_code = get_territory_code(country_code)
+            leading_digits = PhoneMetadata.metadata_for_region(territory_code).leading_digits
+            if leading_digits is not None:
+                for prefix in expand_leading_digits(leading_digits):
+                    dial_prefixes[dial_code + prefix] = (country_code,)
+            elif dial_code == '1':
+                for area_code in range(200, 1000):
+                    number = phonenumbers.parse('+1{}5550100'.format(area_code))
+                    if phonenumbers.region_code_for_number(number) == territory_code:
+                        dial_prefixes['1{}'.format(area_code)] = (country_code,)
+    return dial_prefixes
+
+
+def write_metadata(columns: dict[str, list[str]], dial_prefixes: dict[str, tuple[str, ...]], path: str):
+    """Write the metadata module
+
+    :param columns: column values by column name
+    :param dial_prefixes: country codes by dialing prefix
+    :param path: path of the module to write
+    """
+
+    with open(path, 'w') as file:
+        file.write('# Metadata of the countries in the order of countries.py, one column per\n')
+        file.write('# attribute, generated with scripts/build_country_metadata.py\n')
+        for name, column in columns.items():
+            values = ', '.join(repr(value) for value in column)
+            file.write('\n{} = (\n{}\n)\n'.format(name, textwrap.fill(values, 100, initial_indent='    ',
+                                                                       subsequent_indent='    ')))
+
+        file.write('\n# Countries of the calling codes shared by several countries, main country first,\n')
+        file.write('# and of the longer dialing prefixes that belong to a single country\n')
+        file.write('dial_prefixes = {\n')
+        for prefix, country_codes in sorted(dial_prefixes.items()):
+            file.write('    {!r}: {!r},\n'.format(prefix, country_codes))
+        file.write('}\n')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate the country metadata module')
+    parser.add_argument('--iso-codes', default=DEFAULT_ISO_CODES_PATH,
+                        help='path of iso_3166-1.json of the iso-codes project')
+    parser.add_argument('--output', default=METADATA_PATH, help='path of the module to write')
+    arguments = parser.parse_args()
+
+    sys.path.insert(0, os.path.join(REPOSITORY_DIR, 'src'))
+    from pyqtcountrypicker.countries import countries
+
+    metadata_columns = build_columns(list(countries.keys()), read_iso_countries(arguments.iso_codes), read_regions())
+    write_metadata(metadata_columns, build_dial_prefixes(metadata_columns), arguments.output)
@@ -0,0 +1,61 @@
+"""Generate src/pyqtcountrypicker/country_names.tables, the translated country names
+of the bundled locales, from the CLDR territory names of Babel. Only names that
+differ from the English names in countries.py are stored. Run from the repository root:
+
+    python scripts/build_country_names.py
+"""
+
+import os
+import sys
+import argparse
+from babel import Locale
+
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# Locales the bundled tables are generated for, mapped to the CLDR locale they are taken from
+BUNDLED_LOCALES = {
+    'ar': 'ar', 'bg': 'bg', 'bn': 'bn', 'ca': 'ca', 'cs': 'cs', 'da': 'da', 'de': 'de',
+    'el': 'el', 'es': 'es', 'et': 'et', 'fa': 'fa', 'fi': 'fi', 'fr': 'fr', 'he': 'he',
+    'hi': 'hi', 'hr': 'hr', 'hu': 'hu', 'id': 'id', 'it': 'it', 'ja': 'ja', 'ko': 'ko',
+    'lt': 'lt', 'lv': 'lv', 'ms': 'ms', 'nb': 'nb', 'nl': 'nl', 'pl': 'pl', 'pt': 'pt',
+    'pt_PT': 'pt_PT', 'ro': 'ro', 'ru': 'ru', 'sk': 'sk', 'sl': 'sl', 'sr': 'sr', 'sv': 'sv',
+    'th': 'th', 'tr': 'tr', 'uk': 'uk', 'vi': 'vi', 'zh': 'zh', 'zh_HK': 'zh_Hant_HK',
+    'zh_TW': 'zh_Hant'
+}
+
+# Country codes that are not territory codes in CLDR
+CLDR_TERRITORY_CODES = {
+    'sh-ac': 'AC',
+    'sh-hl': 'SH'
+}
+
+
+def get_translated_names(countries: dict[str, str]) -> dict[str, dict[str, str]]:
+    """Get the country names of every bundled locale that differ from the English names
+
+    :param countries: English country names by country code
+    :return: dicts containing the country names by country code by locale name
+    """
+
+    names_by_locale = {}
+    for locale_name, cldr_locale_name in BUNDLED_LOCALES.items():
+        territories = Locale.parse(cldr_locale_name).territories
+        names_by_locale[locale_name] = {}
+        for country_code in countries:
+            territory_code = CLDR_TERRITORY_CODES.get(country_code, country_code.upper())
+            if territories.get(territory_code, countries[country_code]) != countries[country_code]:
+                names_by_locale[locale_name][country_code] = territories[territory_code]
+    return names_by_locale
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.join(REPOSITORY_DIR, 'src'))
+    from pyqtcountrypicker.countries import countries
+    from pyqtcountrypicker.country_names import DEFAULT_TABLES_PATH, build_name_tables
+
+    parser = argparse.ArgumentParser(description='Generate the country name tables')
+    parser.add_argument('--output', default=DEFAULT_TABLES_PATH, help='path of the name tables file to write')
+    arguments = parser.parse_args()
+
+    build_name_tables(list(countries.keys()), get_translated_names(countries), tables_path=arguments.output)
@@ -0,0 +1,25 @@
+"""Pack the flag images in src/pyqtcountrypicker/flags into src/pyqtcountrypicker/flags.atlas,
+in the order of countries.py. Run from the repository root after changing a flag:
+
+    python scripts/build_flag_atlas.py
+"""
+
+import os
+import sys
+import argparse
+
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.join(REPOSITORY_DIR, 'src'))
+    from pyqtcountrypicker.countries import countries
+    from pyqtcountrypicker.flag_atlas import DEFAULT_SOURCE_DIR, DEFAULT_ATLAS_PATH, build_flag_atlas
+
+    parser = argparse.ArgumentParser(description='Pack the flag images into the flag atlas')
+    parser.add_argument('--source-dir', default=DEFAULT_SOURCE_DIR, help='directory containing the flags as <code>.png')
+    parser.add_argument('--output', default=DEFAULT_ATLAS_PATH, help='path of the atlas file to write')
+    arguments = parser.parse_args()
+
+    build_flag_atlas(list(countries.keys()), source_dir=arguments.source_dir, atlas_path=arguments.output)
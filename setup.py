@@ -10,15 +10,18 @@ setup(
     author='Niklas Henning',
     author_email='business@niklashenning.com',
     license='MIT',
-    packages=find_namespace_packages(where='src'),
+    packages=find_namespace_packages(where='src', exclude=['pyqtcountrypicker.flags']),
     package_dir={'': 'src'},
     package_data={
-        'pyqtcountrypicker.flags': ['*.png'],
+        'pyqtcountrypicker': ['flags.atlas', 'country_names.tables'],
         'pyqtcountrypicker.hooks': ['*.py']
     },
     install_requires=[
         'QtPy>=2.4.1'
     ],
+    extras_require={
+        'numpy': ['numpy']
+    },
     python_requires='>=3.7',
     description='A simple, yet highly customizable country picker widget for PyQt and PySide',
     long_description=readme,
@@ -1 +1,34 @@
-from .country_picker import CountryPicker
+from importlib import import_module
+
+
+# Public classes and the modules they are imported from on first access,
+# so importing the package neither imports Qt nor loads any country data
+_lazy_attributes = {
+    'CountryPicker': '.country_picker',
+    'CountryModel': '.country_model',
+    'CountrySearchIndex': '.search_index',
+    'CountryMetadataStore': '.metadata_store',
+    'DialCodeTrie': '.dial_code_trie',
+    'CountryItemDelegate': '.country_item_delegate',
+    'CountryCatalog': '.catalog'
+}
+
+# Modules with country data that are imported on first access
+_lazy_submodules = ['countries', 'country_aliases', 'country_metadata', 'country_names']
+
+__all__ = list(_lazy_attributes.keys()) + _lazy_submodules
+
+
+def __getattr__(name: str):
+    if name in _lazy_submodules:
+        return import_module('.' + name, __name__)
+    if name not in _lazy_attributes:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    value = getattr(import_module(_lazy_attributes[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals().keys()) | set(__all__))
@@ -0,0 +1,151 @@
+from .metadata_store import CODE_FORMAT_ALPHA2, CODE_FORMAT_ALPHA3, CODE_FORMAT_NUMERIC, get_metadata_store
+
+
+# Shared catalog, created on first use
+_country_catalog = None
+
+
+class CountryCatalog:
+
+    def __init__(self):
+        """Create a new CountryCatalog instance that normalizes, validates and maps
+        country codes with the same rules as the pickers, without importing Qt,
+        so the rules can be shared with servers and batch jobs
+
+        Codes are accepted as alpha-2, alpha-3 or numeric codes, case-insensitive
+        and with surrounding whitespace. The batch methods accept lists of codes
+        and, if NumPy is installed, NumPy arrays, which are mapped per unique code
+        """
+
+        # Codes are looked up in the index of the metadata store, so both follow the same rules
+        self.__metadata_store = get_metadata_store()
+
+    def getCountryCodes(self) -> list[str]:
+        """Get the alpha-2 codes of all countries
+
+        :return: country codes
+        """
+
+        return [country.getCode() for country in self.__metadata_store.getCountries()]
+
+    def normalizeCode(self, code: str) -> str:
+        """Normalize a country code in any format to its alpha-2 code
+
+        :param code: code of the country in any format
+        :return: alpha-2 country code or None if no country has the code
+        """
+
+        return self.__metadata_store.findCountry(code)
+
+    def isValidCode(self, code: str) -> bool:
+        """Get whether a country has a code
+
+        :param code: code of the country in any format
+        :return: whether the code is valid
+        """
+
+        return self.normalizeCode(code) is not None
+
+    def convertCode(self, code: str, code_format: str) -> str:
+        """Convert a country code to another format, countries without
+        a code in that format keep their alpha-2 code
+
+        :param code: code of the country in any format
+        :param code_format: alpha2, alpha3 or numeric
+        :return: converted code or None if no country has the code
+        """
+
+        country_code = self.normalizeCode(code)
+        if country_code is None:
+            return None
+        if code_format == CODE_FORMAT_ALPHA2:
+            return country_code
+        return self.__metadata_store.convertCode(country_code, code_format)
+
+    def getValue(self, code: str, column_name: str) -> str:
+        """Get a metadata value of a country, code formats are converted like convertCode()
+
+        :param code: code of the country in any format
+        :param column_name: alpha2, alpha3, numeric, dial_code, currency or region
+        :return: value of the country or None if no country has the code
+        """
+
+        if column_name in [CODE_FORMAT_ALPHA2, CODE_FORMAT_ALPHA3, CODE_FORMAT_NUMERIC]:
+            return self.convertCode(code, column_name)
+        country_code = self.normalizeCode(code)
+        if country_code is None:
+            return None
+        return self.__metadata_store.getValue(country_code, column_name)
+
+    def normalizeCodes(self, codes):
+        """Normalize many country codes to their alpha-2 codes
+
+        :param codes: list or NumPy array of codes in any format
+        :return: list of alpha-2 codes with None for invalid codes, or
+                 a NumPy string array with empty strings for invalid codes
+        """
+
+        if _is_numpy_array(codes):
+            return self.__map_array(codes, self.normalizeCode)
+        return [self.normalizeCode(code) for code in codes]
+
+    def validateCodes(self, codes):
+        """Get whether many country codes are valid
+
+        :param codes: list or NumPy array of codes in any format
+        :return: list or NumPy array of bools
+        """
+
+        if _is_numpy_array(codes):
+            return self.__map_array(codes, self.normalizeCode) != ''
+        return [self.normalizeCode(code) is not None for code in codes]
+
+    def mapCodes(self, codes, column_name: str):
+        """Map many country codes to a code format or metadata column
+
+        :param codes: list or NumPy array of codes in any format
+        :param column_name: alpha2, alpha3, numeric, dial_code, currency or region
+        :return: list of values with None for invalid codes, or
+                 a NumPy string array with empty strings for invalid codes
+        """
+
+        if _is_numpy_array(codes):
+            return self.__map_array(codes, lambda code: self.getValue(code, column_name))
+        return [self.getValue(code, column_name) for code in codes]
+
+    def __map_array(self, codes, function):
+        """Map a NumPy array of codes by mapping each unique code once
+
+        :param codes: NumPy array of codes
+        :param function: function mapping a code to a string or None
+        :return: NumPy string array of the same shape with empty strings for None
+        """
+
+        import numpy
+
+        unique_codes, inverse = numpy.unique(numpy.asarray(codes, dtype=str), return_inverse=True)
+        values = numpy.array([function(str(code)) or '' for code in unique_codes], dtype=str)
+        return values[inverse].reshape(numpy.shape(codes))
+
+
+def _is_numpy_array(value) -> bool:
+    """Get whether a value is a NumPy array without importing NumPy
+
+    :param value: value to check
+    :return: whether the value is a NumPy array
+    """
+
+    return type(value).__name__ == 'ndarray' and type(value).__module__ == 'numpy'
+
+
+def get_country_catalog() -> CountryCatalog:
+    """Get the catalog that is shared by all pickers
+
+    :return: shared country catalog
+    """
+
+    global _country_catalog
+
+    if _country_catalog is None:
+        _country_catalog = CountryCatalog()
+    return _country_catalog
@@ -0,0 +1,59 @@
+from qtpy.QtCore import QCollator, QCollatorSortKey, QLocale
+
+
+# Shared collations by locale name, created on first use
+_name_collations = {}
+
+
+class NameCollation:
+
+    def __init__(self, locale: QLocale):
+        """Create a new NameCollation instance that sorts names locale-aware
+        and caches the collation key of every name it has seen
+
+        :param locale: locale to sort by
+        """
+
+        self.__collator = QCollator(locale)
+        self.__sort_keys = {}
+
+    def getLocale(self) -> QLocale:
+        """Get the locale the names are sorted by
+
+        :return: locale of the collation
+        """
+
+        return self.__collator.locale()
+
+    def getSortKey(self, name: str) -> QCollatorSortKey:
+        """Get the collation key of a name, equal names always get the same key object
+
+        :param name: name to get the key of
+        :return: collation key
+        """
+
+        sort_key = self.__sort_keys.get(name)
+        if sort_key is None:
+            sort_key = self.__sort_keys[name] = self.__collator.sortKey(name)
+        return sort_key
+
+
+def get_name_collation(locale: QLocale = None) -> NameCollation:
+    """Get the collation for a locale that is shared by all models
+
+    The C locale only compares code points, so English
+    collation is used instead to sort the default names
+
+    :param locale: locale to sort by, defaults to the default locale
+    :return: shared collation
+    """
+
+    if locale is None:
+        locale = QLocale()
+    if locale.language() == QLocale.Language.C:
+        locale = QLocale('en_US')
+
+    locale_name = locale.name()
+    if locale_name not in _name_collations:
+        _name_collations[locale_name] = NameCollation(locale)
+    return _name_collations[locale_name]
@@ -0,0 +1,49 @@
+
+country_aliases = {
+    'ae': ['UAE', 'Emirates'],
+    'at': ['Österreich'],
+    'ba': ['Bosnia'],
+    'bl': ['Saint Barthélemy', 'Saint Barts'],
+    'bo': ['Plurinational State of Bolivia'],
+    'bq': ['Bonaire', 'Sint Eustatius', 'Saba'],
+    'ch': ['Schweiz', 'Suisse', 'Svizzera'],
+    'cd': ['DRC', 'DR Congo', 'Democratic Republic of the Congo', 'Zaire'],
+    'cg': ['Republic of the Congo'],
+    'ci': ['Ivory Coast'],
+    'cn': ['PRC', 'People\'s Republic of China'],
+    'cv': ['Cabo Verde'],
+    'cz': ['Czech Republic'],
+    'de': ['Deutschland', 'Federal Republic of Germany'],
+    'es': ['España'],
+    'fi': ['Suomi'],
+    'fk': ['Malvinas'],
+    'fm': ['Federated States of Micronesia'],
+    'gb': ['UK', 'Great Britain', 'Britain', 'England', 'Scotland', 'Wales', 'Northern Ireland'],
+    'gr': ['Hellas'],
+    'hr': ['Hrvatska'],
+    'ir': ['Persia'],
+    'kn': ['Saint Kitts and Nevis'],
+    'kp': ['DPRK'],
+    'kr': ['Korea', 'Republic of Korea'],
+    'la': ['Lao PDR'],
+    'lc': ['Saint Lucia'],
+    'mf': ['Saint Martin'],
+    'mk': ['Macedonia'],
+    'mm': ['Burma'],
+    'mo': ['Macau'],
+    'nl': ['Holland', 'Nederland'],
+    'pm': ['Saint Pierre and Miquelon'],
+    'ru': ['Russian Federation'],
+    'sh-hl': ['Saint Helena'],
+    'st': ['Sao Tome and Principe'],
+    'sz': ['Swaziland'],
+    'tl': ['East Timor'],
+    'tr': ['Turkey'],
+    'tt': ['Trinidad and Tobago'],
+    'tw': ['Republic of China'],
+    'us': ['USA', 'America', 'United States of America'],
+    'va': ['Holy See', 'Vatican'],
+    'vc': ['Saint Vincent and the Grenadines'],
+    'vn': ['Viet Nam'],
+    'wf': ['Wallis and Futuna'],
+}
@@ -0,0 +1,137 @@
+from qtpy.QtWidgets import QWidget, QStyledItemDelegate, QStyleOptionViewItem, QAbstractItemView
+from qtpy.QtCore import Qt, QObject, QModelIndex, QAbstractItemModel, QLocale
+from .country_names import get_country_names
+from .country_picker import CountryPicker
+from .flag_cache import get_default_country_flags, get_flag_loader
+from .catalog import get_country_catalog
+from .metadata_store import CODE_FORMAT_ALPHA2
+
+
+class CountryItemDelegate(QStyledItemDelegate):
+
+    def __init__(self, parent: QObject = None):
+        """Create a new CountryItemDelegate instance that shows the flag and name of
+        the country code stored in an item, painting from the shared names and flag
+        cache without keeping any state per row, and only creates a CountryPicker
+        when an item is edited
+
+        :param parent: parent object, usually the view the delegate is set on
+        """
+
+        super(CountryItemDelegate, self).__init__(parent)
+
+        # Attributes
+        self.__country_code_role = Qt.ItemDataRole.EditRole
+        self.__country_names = get_country_names(QLocale('en_US'))
+        self.__locale = QLocale('en_US')
+        self.__code_format = CODE_FORMAT_ALPHA2
+        self.__country_flags_enabled = True
+
+        # Flags decoded in the background only repaint the visible items
+        get_flag_loader().flagLoaded.connect(self.__flag_loaded)
+
+    def getCountryCodeRole(self) -> int:
+        """Get the role the country codes are stored in
+
+        :return: item data role
+        """
+
+        return self.__country_code_role
+
+    def setCountryCodeRole(self, role: int):
+        """Set the role the country codes are stored in, codes are read in
+        any format and written in the format of the editor
+
+        :param role: item data role
+        """
+
+        self.__country_code_role = role
+
+    def getLocale(self) -> QLocale:
+        """Get the locale of the country names
+
+        :return: locale of the names
+        """
+
+        return self.__locale
+
+    def setLocale(self, locale: QLocale):
+        """Set the locale of the country names
+
+        :param locale: new locale
+        """
+
+        self.__locale = locale
+        self.__country_names = get_country_names(locale)
+
+    def getCountryCodeFormat(self) -> str:
+        """Get the format of the country codes written by the editor
+
+        :return: alpha2, alpha3 or numeric
+        """
+
+        return self.__code_format
+
+    def setCountryCodeFormat(self, code_format: str):
+        """Set the format of the country codes written by the editor
+
+        :param code_format: alpha2, alpha3 or numeric
+        """
+
+        self.__code_format = code_format
+
+    def isCountryFlagsEnabled(self) -> bool:
+        """Get whether the country flag icons are shown
+
+        :return: whether the country flags are enabled
+        """
+
+        return self.__country_flags_enabled
+
+    def setCountryFlagsEnabled(self, enabled: bool):
+        """Set whether the country flag icons should be shown
+
+        :param enabled: whether the country flags should be enabled
+        """
+
+        self.__country_flags_enabled = enabled
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex):
+        super(CountryItemDelegate, self).initStyleOption(option, index)
+
+        country_code = get_country_catalog().normalizeCode(index.data(self.__country_code_role))
+        if country_code is None:
+            return
+
+        option.text = self.__country_names[country_code]
+        if self.__country_flags_enabled:
+            option.icon = get_default_country_flags()[country_code]
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDecoration
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> QWidget:
+        country_picker = CountryPicker(parent)
+        country_picker.setLocale(self.__locale)
+        country_picker.setCountryCodeFormat(self.__code_format)
+        country_picker.setCountryFlagsEnabled(self.__country_flags_enabled)
+
+        # Only countries picked by the user are committed, not the ones set from the model
+        country_picker.activated.connect(lambda: self.commitData.emit(country_picker))
+        return country_picker
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex):
+        code = index.data(self.__country_code_role)
+        if isinstance(code, str):
+            editor.setCurrentCountry(code)
+
+    def setModelData(self, editor: QWidget, model: QAbstractItemModel, index: QModelIndex):
+        model.setData(index, editor.getCurrentCountry(), self.__country_code_role)
+
+    def __flag_loaded(self, country_code: str):
+        """Repaint the visible items once a flag has been decoded in the background
+
+        :param country_code: country code of the flag
+        """
+
+        view = self.parent()
+        if isinstance(view, QAbstractItemView):
+            view.viewport().update()
@@ -0,0 +1,234 @@
+# Metadata of the countries in the order of countries.py, one column per
+# attribute, generated with scripts/build_country_metadata.py
+
+country_codes = (
+    'af', 'al', 'dz', 'as', 'ad', 'ao', 'ai', 'ag', 'ar', 'am', 'aw', 'sh-ac', 'au', 'at', 'az',
+    'bs', 'bh', 'bd', 'bb', 'by', 'be', 'bz', 'bj', 'bm', 'bt', 'bo', 'ba', 'bw', 'br', 'io', 'vg',
+    'bn', 'bg', 'bf', 'bi', 'kh', 'cm', 'ca', 'cv', 'bq', 'ky', 'cf', 'td', 'cl', 'cn', 'co', 'km',
+    'cg', 'cd', 'ck', 'cr', 'ci', 'hr', 'cu', 'cw', 'cy', 'cz', 'dk', 'dj', 'dm', 'do', 'ec', 'eg',
+    'sv', 'gq', 'er', 'ee', 'sz', 'et', 'fk', 'fo', 'fj', 'fi', 'fr', 'gf', 'pf', 'ga', 'gm', 'ge',
+    'de', 'gh', 'gi', 'gr', 'gl', 'gd', 'gp', 'gu', 'gt', 'gn', 'gw', 'gy', 'ht', 'hn', 'hk', 'hu',
+    'is', 'in', 'id', 'ir', 'iq', 'ie', 'il', 'it', 'jm', 'jp', 'jo', 'kz', 'ke', 'ki', 'xk', 'kw',
+    'kg', 'la', 'lv', 'lb', 'ls', 'lr', 'ly', 'li', 'lt', 'lu', 'mo', 'mg', 'mw', 'my', 'mv', 'ml',
+    'mt', 'mh', 'mq', 'mr', 'mu', 'mx', 'fm', 'md', 'mc', 'mn', 'me', 'ms', 'ma', 'mz', 'mm', 'na',
+    'nr', 'np', 'nl', 'nc', 'nz', 'ni', 'ne', 'ng', 'nu', 'nf', 'kp', 'mk', 'mp', 'no', 'om', 'pk',
+    'pw', 'ps', 'pa', 'pg', 'py', 'pe', 'ph', 'pl', 'pt', 'pr', 'qa', 're', 'ro', 'ru', 'rw', 'ws',
+    'sm', 'st', 'sa', 'sn', 'rs', 'sc', 'sl', 'sg', 'sx', 'sk', 'si', 'sb', 'so', 'za', 'kr', 'ss',
+    'es', 'lk', 'bl', 'sh-hl', 'kn', 'lc', 'mf', 'pm', 'vc', 'sd', 'sr', 'se', 'ch', 'sy', 'tw',
+    'tj', 'tz', 'th', 'tl', 'tg', 'tk', 'to', 'tt', 'tn', 'tr', 'tm', 'tc', 'tv', 'vi', 'ug', 'ua',
+    'ae', 'gb', 'us', 'uy', 'uz', 'vu', 'va', 've', 'vn', 'wf', 'ye', 'zm', 'zw'
+)
+
+alpha3_codes = (
+    'AFG', 'ALB', 'DZA', 'ASM', 'AND', 'AGO', 'AIA', 'ATG', 'ARG', 'ARM', 'ABW', '', 'AUS', 'AUT',
+    'AZE', 'BHS', 'BHR', 'BGD', 'BRB', 'BLR', 'BEL', 'BLZ', 'BEN', 'BMU', 'BTN', 'BOL', 'BIH',
+    'BWA', 'BRA', 'IOT', 'VGB', 'BRN', 'BGR', 'BFA', 'BDI', 'KHM', 'CMR', 'CAN', 'CPV', 'BES',
+    'CYM', 'CAF', 'TCD', 'CHL', 'CHN', 'COL', 'COM', 'COG', 'COD', 'COK', 'CRI', 'CIV', 'HRV',
+    'CUB', 'CUW', 'CYP', 'CZE', 'DNK', 'DJI', 'DMA', 'DOM', 'ECU', 'EGY', 'SLV', 'GNQ', 'ERI',
+    'EST', 'SWZ', 'ETH', 'FLK', 'FRO', 'FJI', 'FIN', 'FRA', 'GUF', 'PYF', 'GAB', 'GMB', 'GEO',
+    'DEU', 'GHA', 'GIB', 'GRC', 'GRL', 'GRD', 'GLP', 'GUM', 'GTM', 'GIN', 'GNB', 'GUY', 'HTI',
+    'HND', 'HKG', 'HUN', 'ISL', 'IND', 'IDN', 'IRN', 'IRQ', 'IRL', 'ISR', 'ITA', 'JAM', 'JPN',
+    'JOR', 'KAZ', 'KEN', 'KIR', 'XKX', 'KWT', 'KGZ', 'LAO', 'LVA', 'LBN', 'LSO', 'LBR', 'LBY',
+    'LIE', 'LTU', 'LUX', 'MAC', 'MDG', 'MWI', 'MYS', 'MDV', 'MLI', 'MLT', 'MHL', 'MTQ', 'MRT',
+    'MUS', 'MEX', 'FSM', 'MDA', 'MCO', 'MNG', 'MNE', 'MSR', 'MAR', 'MOZ', 'MMR', 'NAM', 'NRU',
+    'NPL', 'NLD', 'NCL', 'NZL', 'NIC', 'NER', 'NGA', 'NIU', 'NFK', 'PRK', 'MKD', 'MNP', 'NOR',
+    'OMN', 'PAK', 'PLW', 'PSE', 'PAN', 'PNG', 'PRY', 'PER', 'PHL', 'POL', 'PRT', 'PRI', 'QAT',
+    'REU', 'ROU', 'RUS', 'RWA', 'WSM', 'SMR', 'STP', 'SAU', 'SEN', 'SRB', 'SYC', 'SLE', 'SGP',
+    'SXM', 'SVK', 'SVN', 'SLB', 'SOM', 'ZAF', 'KOR', 'SSD', 'ESP', 'LKA', 'BLM', 'SHN', 'KNA',
+    'LCA', 'MAF', 'SPM', 'VCT', 'SDN', 'SUR', 'SWE', 'CHE', 'SYR', 'TWN', 'TJK', 'TZA', 'THA',
+    'TLS', 'TGO', 'TKL', 'TON', 'TTO', 'TUN', 'TUR', 'TKM', 'TCA', 'TUV', 'VIR', 'UGA', 'UKR',
+    'ARE', 'GBR', 'USA', 'URY', 'UZB', 'VUT', 'VAT', 'VEN', 'VNM', 'WLF', 'YEM', 'ZMB', 'ZWE'
+)
+
+numeric_codes = (
+    '004', '008', '012', '016', '020', '024', '660', '028', '032', '051', '533', '', '036', '040',
+    '031', '044', '048', '050', '052', '112', '056', '084', '204', '060', '064', '068', '070',
+    '072', '076', '086', '092', '096', '100', '854', '108', '116', '120', '124', '132', '535',
+    '136', '140', '148', '152', '156', '170', '174', '178', '180', '184', '188', '384', '191',
+    '192', '531', '196', '203', '208', '262', '212', '214', '218', '818', '222', '226', '232',
+    '233', '748', '231', '238', '234', '242', '246', '250', '254', '258', '266', '270', '268',
+    '276', '288', '292', '300', '304', '308', '312', '316', '320', '324', '624', '328', '332',
+    '340', '344', '348', '352', '356', '360', '364', '368', '372', '376', '380', '388', '392',
+    '400', '398', '404', '296', '', '414', '417', '418', '428', '422', '426', '430', '434', '438',
+    '440', '442', '446', '450', '454', '458', '462', '466', '470', '584', '474', '478', '480',
+    '484', '583', '498', '492', '496', '499', '500', '504', '508', '104', '516', '520', '524',
+    '528', '540', '554', '558', '562', '566', '570', '574', '408', '807', '580', '578', '512',
+    '586', '585', '275', '591', '598', '600', '604', '608', '616', '620', '630', '634', '638',
+    '642', '643', '646', '882', '674', '678', '682', '686', '688', '690', '694', '702', '534',
+    '703', '705', '090', '706', '710', '410', '728', '724', '144', '652', '654', '659', '662',
+    '663', '666', '670', '729', '740', '752', '756', '760', '158', '762', '834', '764', '626',
+    '768', '772', '776', '780', '788', '792', '795', '796', '798', '850', '800', '804', '784',
+    '826', '840', '858', '860', '548', '336', '862', '704', '876', '887', '894', '716'
+)
+
+dial_codes = (
+    '93', '355', '213', '1', '376', '244', '1', '1', '54', '374', '297', '247', '61', '43', '994',
+    '1', '973', '880', '1', '375', '32', '501', '229', '1', '975', '591', '387', '267', '55', '246',
+    '1', '673', '359', '226', '257', '855', '237', '1', '238', '599', '1', '236', '235', '56', '86',
+    '57', '269', '242', '243', '682', '506', '225', '385', '53', '599', '357', '420', '45', '253',
+    '1', '1', '593', '20', '503', '240', '291', '372', '268', '251', '500', '298', '679', '358',
+    '33', '594', '689', '241', '220', '995', '49', '233', '350', '30', '299', '1', '590', '1',
+    '502', '224', '245', '592', '509', '504', '852', '36', '354', '91', '62', '98', '964', '353',
+    '972', '39', '1', '81', '962', '7', '254', '686', '383', '965', '996', '856', '371', '961',
+    '266', '231', '218', '423', '370', '352', '853', '261', '265', '60', '960', '223', '356', '692',
+    '596', '222', '230', '52', '691', '373', '377', '976', '382', '1', '212', '258', '95', '264',
+    '674', '977', '31', '687', '64', '505', '227', '234', '683', '672', '850', '389', '1', '47',
+    '968', '92', '680', '970', '507', '675', '595', '51', '63', '48', '351', '1', '974', '262',
+    '40', '7', '250', '685', '378', '239', '966', '221', '381', '248', '232', '65', '1', '421',
+    '386', '677', '252', '27', '82', '211', '34', '94', '590', '290', '1', '1', '590', '508', '1',
+    '249', '597', '46', '41', '963', '886', '992', '255', '66', '670', '228', '690', '676', '1',
+    '216', '90', '993', '1', '688', '1', '256', '380', '971', '44', '1', '598', '998', '678', '39',
+    '58', '84', '681', '967', '260', '263'
+)
+
+currencies = (
+    'AFN', 'ALL', 'DZD', 'USD', 'EUR', 'AOA', 'XCD', 'XCD', 'ARS', 'AMD', 'AWG', 'SHP', 'AUD',
+    'EUR', 'AZN', 'BSD', 'BHD', 'BDT', 'BBD', 'BYN', 'EUR', 'BZD', 'XOF', 'BMD', 'INR', 'BOB',
+    'BAM', 'BWP', 'BRL', 'USD', 'USD', 'BND', 'BGN', 'XOF', 'BIF', 'KHR', 'XAF', 'CAD', 'CVE',
+    'USD', 'KYD', 'XAF', 'XAF', 'CLP', 'CNY', 'COP', 'KMF', 'XAF', 'CDF', 'NZD', 'CRC', 'XOF',
+    'EUR', 'CUP', 'XCG', 'EUR', 'CZK', 'DKK', 'DJF', 'XCD', 'DOP', 'USD', 'EGP', 'USD', 'XAF',
+    'ERN', 'EUR', 'SZL', 'ETB', 'FKP', 'DKK', 'FJD', 'EUR', 'EUR', 'EUR', 'XPF', 'XAF', 'GMD',
+    'GEL', 'EUR', 'GHS', 'GIP', 'EUR', 'DKK', 'XCD', 'EUR', 'USD', 'GTQ', 'GNF', 'XOF', 'GYD',
+    'HTG', 'HNL', 'HKD', 'HUF', 'ISK', 'INR', 'IDR', 'IRR', 'IQD', 'EUR', 'ILS', 'EUR', 'JMD',
+    'JPY', 'JOD', 'KZT', 'KES', 'AUD', 'EUR', 'KWD', 'KGS', 'LAK', 'EUR', 'LBP', 'ZAR', 'LRD',
+    'LYD', 'CHF', 'EUR', 'EUR', 'MOP', 'MGA', 'MWK', 'MYR', 'MVR', 'XOF', 'EUR', 'USD', 'EUR',
+    'MRU', 'MUR', 'MXN', 'USD', 'MDL', 'EUR', 'MNT', 'EUR', 'XCD', 'MAD', 'MZN', 'MMK', 'ZAR',
+    'AUD', 'NPR', 'EUR', 'XPF', 'NZD', 'NIO', 'XOF', 'NGN', 'NZD', 'AUD', 'KPW', 'MKD', 'USD',
+    'NOK', 'OMR', 'PKR', 'USD', 'ILS', 'PAB', 'PGK', 'PYG', 'PEN', 'PHP', 'PLN', 'EUR', 'USD',
+    'QAR', 'EUR', 'RON', 'RUB', 'RWF', 'WST', 'EUR', 'STN', 'SAR', 'XOF', 'RSD', 'SCR', 'SLE',
+    'SGD', 'XCG', 'EUR', 'EUR', 'SBD', 'SOS', 'ZAR', 'KRW', 'SSP', 'EUR', 'LKR', 'EUR', 'SHP',
+    'XCD', 'XCD', 'EUR', 'EUR', 'XCD', 'SDG', 'SRD', 'SEK', 'CHF', 'SYP', 'TWD', 'TJS', 'TZS',
+    'THB', 'USD', 'XOF', 'NZD', 'TOP', 'TTD', 'TND', 'TRY', 'TMT', 'USD', 'AUD', 'USD', 'UGX',
+    'UAH', 'AED', 'GBP', 'USD', 'UYU', 'UZS', 'VUV', 'EUR', 'VES', 'VND', 'XPF', 'YER', 'ZMW', 'USD'
+)
+
+regions = (
+    'Asia', 'Europe', 'Africa', 'Oceania', 'Europe', 'Africa', 'Americas', 'Americas', 'Americas',
+    'Asia', 'Americas', 'Africa', 'Oceania', 'Europe', 'Asia', 'Americas', 'Asia', 'Asia',
+    'Americas', 'Europe', 'Europe', 'Americas', 'Africa', 'Americas', 'Asia', 'Americas', 'Europe',
+    'Africa', 'Americas', 'Africa', 'Americas', 'Asia', 'Europe', 'Africa', 'Africa', 'Asia',
+    'Africa', 'Americas', 'Africa', 'Americas', 'Americas', 'Africa', 'Africa', 'Americas', 'Asia',
+    'Americas', 'Africa', 'Africa', 'Africa', 'Oceania', 'Americas', 'Africa', 'Europe', 'Americas',
+    'Americas', 'Asia', 'Europe', 'Europe', 'Africa', 'Americas', 'Americas', 'Americas', 'Africa',
+    'Americas', 'Africa', 'Africa', 'Europe', 'Africa', 'Africa', 'Americas', 'Europe', 'Oceania',
+    'Europe', 'Europe', 'Americas', 'Oceania', 'Africa', 'Africa', 'Asia', 'Europe', 'Africa',
+    'Europe', 'Europe', 'Americas', 'Americas', 'Americas', 'Oceania', 'Americas', 'Africa',
+    'Africa', 'Americas', 'Americas', 'Americas', 'Asia', 'Europe', 'Europe', 'Asia', 'Asia',
+    'Asia', 'Asia', 'Europe', 'Asia', 'Europe', 'Americas', 'Asia', 'Asia', 'Asia', 'Africa',
+    'Oceania', 'Europe', 'Asia', 'Asia', 'Asia', 'Europe', 'Asia', 'Africa', 'Africa', 'Africa',
+    'Europe', 'Europe', 'Europe', 'Asia', 'Africa', 'Africa', 'Asia', 'Asia', 'Africa', 'Europe',
+    'Oceania', 'Americas', 'Africa', 'Africa', 'Americas', 'Oceania', 'Europe', 'Europe', 'Asia',
+    'Europe', 'Americas', 'Africa', 'Africa', 'Asia', 'Africa', 'Oceania', 'Asia', 'Europe',
+    'Oceania', 'Oceania', 'Americas', 'Africa', 'Africa', 'Oceania', 'Oceania', 'Asia', 'Europe',
+    'Oceania', 'Europe', 'Asia', 'Asia', 'Oceania', 'Asia', 'Americas', 'Oceania', 'Americas',
+    'Americas', 'Asia', 'Europe', 'Europe', 'Americas', 'Asia', 'Africa', 'Europe', 'Europe',
+    'Africa', 'Oceania', 'Europe', 'Africa', 'Asia', 'Africa', 'Europe', 'Africa', 'Africa', 'Asia',
+    'Americas', 'Europe', 'Europe', 'Oceania', 'Africa', 'Africa', 'Asia', 'Africa', 'Europe',
+    'Asia', 'Americas', 'Africa', 'Americas', 'Americas', 'Americas', 'Americas', 'Americas',
+    'Africa', 'Americas', 'Europe', 'Europe', 'Asia', 'Asia', 'Asia', 'Africa', 'Asia', 'Asia',
+    'Africa', 'Oceania', 'Oceania', 'Americas', 'Africa', 'Asia', 'Asia', 'Americas', 'Oceania',
+    'Americas', 'Africa', 'Europe', 'Asia', 'Europe', 'Americas', 'Americas', 'Asia', 'Oceania',
+    'Europe', 'Americas', 'Asia', 'Oceania', 'Asia', 'Africa', 'Africa'
+)
+
+# Countries of the calling codes shared by several countries, main country first,
+# and of the longer dialing prefixes that belong to a single country
+dial_prefixes = {
+    '1': ('us', 'ag', 'ai', 'as', 'bb', 'bm', 'bs', 'ca', 'dm', 'do', 'gd', 'gu', 'jm', 'kn', 'ky', 'lc', 'mp', 'ms', 'pr', 'sx', 'tc', 'tt', 'vc', 'vg', 'vi'),
+    '1204': ('ca',),
+    '1226': ('ca',),
+    '1236': ('ca',),
+    '1242': ('bs',),
+    '1246': ('bb',),
+    '1249': ('ca',),
+    '1250': ('ca',),
+    '1257': ('ca',),
+    '1263': ('ca',),
+    '1264': ('ai',),
+    '1268': ('ag',),
+    '1273': ('ca',),
+    '1284': ('vg',),
+    '1289': ('ca',),
+    '1306': ('ca',),
+    '1340': ('vi',),
+    '1343': ('ca',),
+    '1345': ('ky',),
+    '1354': ('ca',),
+    '1365': ('ca',),
+    '1367': ('ca',),
+    '1368': ('ca',),
+    '1382': ('ca',),
+    '1403': ('ca',),
+    '1416': ('ca',),
+    '1418': ('ca',),
+    '1428': ('ca',),
+    '1431': ('ca',),
+    '1437': ('ca',),
+    '1438': ('ca',),
+    '1441': ('bm',),
+    '1450': ('ca',),
+    '1468': ('ca',),
+    '1473': ('gd',),
+    '1474': ('ca',),
+    '1506': ('ca',),
+    '1514': ('ca',),
+    '1519': ('ca',),
+    '1548': ('ca',),
+    '1579': ('ca',),
+    '1581': ('ca',),
+    '1584': ('ca',),
+    '1587': ('ca',),
+    '1600': ('ca',),
+    '1604': ('ca',),
+    '1613': ('ca',),
+    '1622': ('ca',),
+    '1633': ('ca',),
+    '1639': ('ca',),
+    '1647': ('ca',),
+    '1649': ('tc',),
+    '1658': ('jm',),
+    '1664': ('ms',),
+    '1670': ('mp',),
+    '1671': ('gu',),
+    '1672': ('ca',),
+    '1683': ('ca',),
+    '1684': ('as',),
+    '1705': ('ca',),
+    '1709': ('ca',),
+    '1721': ('sx',),
+    '1742': ('ca',),
+    '1753': ('ca',),
+    '1758': ('lc',),
+    '1767': ('dm',),
+    '1778': ('ca',),
+    '1780': ('ca',),
+    '1782': ('ca',),
+    '1784': ('vc',),
+    '1787': ('pr',),
+    '18001': ('do',),
+    '1807': ('ca',),
+    '1809': ('do',),
+    '1819': ('ca',),
+    '1825': ('ca',),
+    '1829': ('do',),
+    '1849': ('do',),
+    '1867': ('ca',),
+    '1868': ('tt',),
+    '1869': ('kn',),
+    '1873': ('ca',),
+    '1876': ('jm',),
+    '1879': ('ca',),
+    '1902': ('ca',),
+    '1905': ('ca',),
+    '1939': ('pr',),
+    '1942': ('ca',),
+    '39': ('it', 'va'),
+    '3906698': ('va',),
+    '590': ('gp', 'bl', 'mf'),
+    '599': ('cw', 'bq'),
+    '5993': ('bq',),
+    '5994': ('bq',),
+    '5997': ('bq',),
+    '7': ('ru', 'kz'),
+    '77': ('kz',),
+}
@@ -0,0 +1,897 @@
+from time import perf_counter
+from qtpy.QtCore import Qt, QObject, QAbstractItemModel, QAbstractListModel, QAbstractProxyModel, QModelIndex, QLocale
+from qtpy.QtGui import QIcon
+from .countries import countries
+from .collation import NameCollation, get_name_collation
+from .country_names import get_country_names
+from .flag_cache import get_default_country_flags, get_flag_loader
+from .instrumentation import get_instrumentation
+from .catalog import get_country_catalog
+
+
+# Shared source model, created on first use
+_country_source_model = None
+
+
+class CountrySourceModel(QAbstractListModel):
+
+    def __init__(self, parent: QObject = None):
+        """Create a new CountrySourceModel instance holding the default
+        codes, names and flags of all countries
+
+        :param parent: parent object
+        """
+
+        super(CountrySourceModel, self).__init__(parent)
+
+        # Attributes, the default state of every CountryModel is shared from here
+        self.__rows = tuple(get_country_catalog().getCountryCodes())
+        self.__row_by_country = {country_code: row for row, country_code in enumerate(self.__rows)}
+        self.__country_set = frozenset(self.__rows)
+        self.__name_collation = get_name_collation()
+        self.__sorted_country_codes = sorted(
+            self.__rows, key=lambda country_code: self.__name_collation.getSortKey(countries[country_code]))
+        self.__sorted_row_by_country = {country_code: row for row, country_code
+                                        in enumerate(self.__sorted_country_codes)}
+
+        # Flags decoded in the background only update their own rows
+        get_flag_loader().flagLoaded.connect(self.__flag_loaded)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.__rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.__rows):
+            return None
+
+        country_code = self.__rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
+            return countries[country_code]
+        if role == Qt.ItemDataRole.DecorationRole:
+            return get_default_country_flags()[country_code]
+        if role == Qt.ItemDataRole.UserRole:
+            return country_code
+        return None
+
+    def getCountryRow(self, country_code: str) -> int:
+        """Get the row of a country by country code
+
+        :param country_code: country code of the country
+        :return: row of the country or -1 if the country does not exist
+        """
+
+        return self.__row_by_country.get(country_code, -1)
+
+    def getCountryCode(self, row: int) -> str:
+        """Get the country code of a row
+
+        :param row: row of the country
+        :return: country code of the country
+        """
+
+        return self.__rows[row]
+
+    def getNameCollation(self) -> NameCollation:
+        """Get the collation the country names are sorted by
+
+        :return: shared name collation
+        """
+
+        return self.__name_collation
+
+    def getCountryCodes(self) -> tuple[str, ...]:
+        """Get the codes of all countries
+
+        :return: shared country codes in the order of the rows
+        """
+
+        return self.__rows
+
+    def getCountrySet(self) -> frozenset[str]:
+        """Get the codes of all countries as a set
+
+        :return: shared set of country codes
+        """
+
+        return self.__country_set
+
+    def getSortedCountryCodes(self) -> list[str]:
+        """Get the codes of all countries sorted by their default name,
+        the order is only computed once and shared by all models
+
+        :return: shared list of sorted country codes that must not be modified
+        """
+
+        return self.__sorted_country_codes
+
+    def getSortedRowIndex(self) -> dict[str, int]:
+        """Get the positions of all countries in the sorted country codes
+
+        :return: shared dict containing the sorted rows by country code that must not be modified
+        """
+
+        return self.__sorted_row_by_country
+
+    def __flag_loaded(self, country_code: str):
+        """Update the row of a flag that has been decoded in the background
+
+        :param country_code: country code of the flag
+        """
+
+        index = self.index(self.getCountryRow(country_code))
+        if index.isValid():
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+
+def get_country_source_model() -> CountrySourceModel:
+    """Get the source model that is shared by all CountryModel instances
+
+    :return: shared country source model
+    """
+
+    global _country_source_model
+
+    if _country_source_model is None:
+        _country_source_model = CountrySourceModel()
+    return _country_source_model
+
+
+class CountryModel(QAbstractProxyModel):
+
+    def __init__(self, parent: QObject = None):
+        """Create a new CountryModel instance that shows the countries of the
+        shared source model with its own available countries, names and flags
+
+        :param parent: parent object
+        """
+
+        super(CountryModel, self).__init__(parent)
+
+        # Attributes, only names and flags that differ from the defaults are stored,
+        # the available countries and rows are shared with the source model until changed
+        source_model = get_country_source_model()
+        self.__countries = source_model.getCountryCodes()
+        self.__countries_set = source_model.getCountrySet()
+        self.__country_name_overrides = {}
+        self.__country_flag_overrides = {}
+        self.__country_flags_enabled = True
+        self.__dial_codes_shown = False
+
+        # Countries pinned above the other rows and the available ones shown as pinned rows,
+        # followed by a separator row while there are any
+        self.__pinned_countries = []
+        self.__pinned_rows = []
+        self.__separator_shown = False
+
+        # Locale of the names, the default names and collation are shared with the source model
+        self.__locale = QLocale('en_US')
+        self.__locale_names = countries
+        self.__name_collation = get_name_collation()
+
+        # Batch update state
+        self.__update_depth = 0
+        self.__rows_outdated = False
+        self.__data_outdated = False
+
+        self.setSourceModel(source_model)
+        source_model.dataChanged.connect(self.__source_data_changed)
+
+        # Country codes of the rows in display order and the row of each country code
+        self.__rows = None
+        self.__row_by_country = None
+        self.__set_rows(self.__get_sorted_rows())
+
+    def index(self, row: int, column: int = 0, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if parent.isValid() or column != 0 or row < 0 or row >= self.getRowOffset() + len(self.__rows):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        return QModelIndex()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self.getRowOffset() + len(self.__rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self.rowCount() > 0
+
+    def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+        if not proxy_index.isValid():
+            return QModelIndex()
+        country_code = self.__get_row_country(proxy_index.row())
+        if country_code is None:
+            return QModelIndex()
+        source_model = self.sourceModel()
+        return source_model.index(source_model.getCountryRow(country_code))
+
+    def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+        if not source_index.isValid():
+            return QModelIndex()
+        row = self.getCountryRow(self.sourceModel().getCountryCode(source_index.row()))
+        if row == -1:
+            return QModelIndex()
+        return self.index(row)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        country_code = self.__get_row_country(index.row())
+        if country_code is None:
+            # The separator is drawn as a line by the dropdown
+            if role == Qt.ItemDataRole.AccessibleDescriptionRole and self.__is_separator_row(index.row()):
+                return 'separator'
+            return None
+        if role == Qt.ItemDataRole.DisplayRole and self.__dial_codes_shown:
+            return '{} (+{})'.format(self.__get_country_name(country_code),
+                                     get_country_catalog().getValue(country_code, 'dial_code'))
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
+            return self.__get_country_name(country_code)
+        if role == Qt.ItemDataRole.DecorationRole:
+            if not self.__country_flags_enabled:
+                return None
+            if country_code in self.__country_flag_overrides:
+                return self.__country_flag_overrides[country_code]
+        # The source model is asked directly, since an empty value passed back through
+        # QAbstractProxyModel.data() loses a reference to None with some PySide6 versions
+        return self.sourceModel().data(self.mapToSource(index), role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if index.isValid() and self.__is_separator_row(index.row()):
+            return Qt.ItemFlag.NoItemFlags
+        return super(CountryModel, self).flags(index)
+
+    def itemData(self, index: QModelIndex) -> dict:
+        # Collect the data through data() instead of from the source model
+        return QAbstractItemModel.itemData(self, index)
+
+    def beginUpdate(self):
+        """Begin a batch update, all changes until the matching call
+        of endUpdate() are applied to the rows at once"""
+
+        self.__update_depth += 1
+
+    def endUpdate(self):
+        """End a batch update and apply all changes made during it"""
+
+        self.__update_depth -= 1
+        if self.__update_depth > 0:
+            return
+
+        # Changed rows or order are applied with a single reset, changed names
+        # or flags without changed rows with a single dataChanged signal
+        if self.__rows_outdated:
+            instrumentation = get_instrumentation()
+            start_time = perf_counter() if instrumentation is not None else 0
+            rows = self.__get_sorted_rows()
+            if rows != self.__rows:
+                self.beginResetModel()
+                self.__set_rows(rows)
+                self.__pinned_rows = self.__get_pinned_rows()
+                self.__separator_shown = len(self.__pinned_rows) > 0
+                self.endResetModel()
+                self.__data_outdated = False
+                if instrumentation is not None:
+                    instrumentation.increment('model.resets')
+                    instrumentation.recordTiming('model.reset', perf_counter() - start_time)
+            else:
+                self.__data_outdated = True
+
+        # Pinned rows are updated one by one, since at most a few of them change
+        self.__update_pinned_rows()
+
+        if self.__data_outdated and self.rowCount() > 0:
+            self.dataChanged.emit(self.index(0), self.index(self.rowCount() - 1))
+
+        self.__rows_outdated = False
+        self.__data_outdated = False
+
+    def isUpdating(self) -> bool:
+        """Get whether a batch update is in progress
+
+        :return: whether changes are currently deferred
+        """
+
+        return self.__update_depth > 0
+
+    def isCountryAvailable(self, country_code: str) -> bool:
+        """Get whether a country is available, including changes
+        of a batch update that have not been applied yet
+
+        :param country_code: country code of the country
+        :return: whether the country is available
+        """
+
+        country_code = country_code.lower()
+        return country_code in self.__countries_set and country_code in countries
+
+    def getCountryRow(self, country_code: str) -> int:
+        """Get the row of a country by country code, pinned countries
+        are found in their row among the other countries
+
+        :param country_code: country code of the country
+        :return: row of the country or -1 if the country is not available
+        """
+
+        row = self.__row_by_country.get(country_code.lower(), -1)
+        if row == -1:
+            return -1
+        return self.getRowOffset() + row
+
+    def getPinnedCountries(self) -> list[str]:
+        """Get the countries pinned above the other countries
+
+        :return: pinned countries
+        """
+
+        return list(self.__pinned_countries)
+
+    def setPinnedCountries(self, countries: list[str]):
+        """Set the countries pinned above the other countries, separated
+        from them by a separator row, unavailable countries are not shown
+
+        Only the pinned rows that change are inserted, removed or moved,
+        the other rows are never reset
+
+        :param countries: countries to pin, in display order
+        """
+
+        self.__pinned_countries = [country_code.lower() for country_code in countries]
+        if self.__update_depth == 0:
+            self.__update_pinned_rows()
+
+    def getRowOffset(self) -> int:
+        """Get the number of pinned and separator rows above the other countries
+
+        :return: row of the first country that is not pinned
+        """
+
+        return len(self.__pinned_rows) + (1 if self.__separator_shown else 0)
+
+    def hasCustomCountryNames(self) -> bool:
+        """Get whether any country has a name different from its default English name
+
+        :return: whether any country names have been changed or translated
+        """
+
+        return len(self.__country_name_overrides) > 0 or self.__locale_names is not countries
+
+    def getLocale(self) -> QLocale:
+        """Get the locale of the country names
+
+        :return: locale of the country names
+        """
+
+        return self.__locale
+
+    def setLocale(self, locale: QLocale):
+        """Set the locale of the country names, the names are taken from the
+        bundled name table of the locale and sorted by its collation in a
+        single batch update, names set with setCountryNames() are kept
+
+        :param locale: new locale of the country names
+        """
+
+        self.__locale = locale
+        locale_names = get_country_names(locale)
+        name_collation = get_name_collation(locale)
+        if locale_names is self.__locale_names and name_collation is self.__name_collation:
+            return
+
+        instrumentation = get_instrumentation()
+        start_time = perf_counter() if instrumentation is not None else 0
+
+        self.beginUpdate()
+        self.__locale_names = locale_names
+        self.__name_collation = name_collation
+        self.__country_name_overrides = {country_code: country_name
+                                         for country_code, country_name in self.__country_name_overrides.items()
+                                         if country_name != locale_names[country_code]}
+        self.__rows_outdated = True
+        self.__data_outdated = True
+        self.endUpdate()
+
+        if instrumentation is not None:
+            instrumentation.recordTiming('model.set_locale', perf_counter() - start_time)
+
+    def getCountryName(self, country_code: str) -> str:
+        """Get the name of a country by country code
+
+        :param country_code: country code of the country
+        :return: name of the country
+        """
+
+        country_code = country_code.lower()
+        if country_code not in countries:
+            return ''
+        return self.__get_country_name(country_code)
+
+    def setCountryName(self, country_code: str, country_name: str):
+        """Set the name of a country by country code
+
+        :param country_code: country code of the country
+        :param country_name: new name of the country
+        """
+
+        self.setCountryNames({country_code: country_name})
+
+    def getCountryNames(self) -> dict[str, str]:
+        """Get the country names
+
+        :return: dict containing the country names by country code
+        """
+
+        country_names = self.__locale_names.copy()
+        country_names.update(self.__country_name_overrides)
+        return country_names
+
+    def setCountryNames(self, country_names: dict[str, str]):
+        """Set the country names
+
+        :param country_names: dict containing the country names by country code
+        """
+
+        instrumentation = get_instrumentation()
+        start_time = perf_counter() if instrumentation is not None else 0
+
+        # Rename all valid countries one by one, moving each
+        # renamed row to its new sorted position
+        for country_code, country_name in country_names.items():
+            country_code = country_code.lower()
+            if country_code not in countries:
+                continue
+            if self.__get_country_name(country_code) == country_name:
+                continue
+            if country_name == self.__locale_names[country_code]:
+                del self.__country_name_overrides[country_code]
+            else:
+                self.__country_name_overrides[country_code] = country_name
+
+            if self.__update_depth > 0:
+                self.__rows_outdated = True
+            elif country_code in self.__countries_set:
+                self.__move_row_to_sorted_position(country_code)
+                self.__emit_rows_changed([country_code], [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+
+        if instrumentation is not None:
+            instrumentation.recordTiming('model.set_country_names', perf_counter() - start_time)
+
+    def resetCountryNames(self):
+        """Reset the country names to the names of the current locale"""
+
+        self.setCountryNames({country_code: self.__locale_names[country_code]
+                              for country_code in self.__country_name_overrides})
+
+    def isCountryFlagsEnabled(self) -> bool:
+        """Get whether the country flag icons are enabled
+
+        :return: whether the country flags are enabled
+        """
+
+        return self.__country_flags_enabled
+
+    def setCountryFlagsEnabled(self, enabled: bool):
+        """Set whether the country flag icons should be enabled
+
+        :param enabled: whether the country flags should be enabled
+        """
+
+        if enabled == self.__country_flags_enabled:
+            return
+
+        self.__country_flags_enabled = enabled
+        if self.__update_depth > 0:
+            self.__data_outdated = True
+        elif self.rowCount() > 0:
+            self.dataChanged.emit(self.index(0), self.index(self.rowCount() - 1),
+                                  [Qt.ItemDataRole.DecorationRole])
+
+    def isDialCodesShown(self) -> bool:
+        """Get whether the calling codes are shown next to the country names
+
+        :return: whether the dial codes are shown
+        """
+
+        return self.__dial_codes_shown
+
+    def setDialCodesShown(self, shown: bool):
+        """Set whether the calling codes should be shown next to the country names
+
+        :param shown: whether the dial codes should be shown
+        """
+
+        if shown == self.__dial_codes_shown:
+            return
+
+        self.__dial_codes_shown = shown
+        if self.__update_depth > 0:
+            self.__data_outdated = True
+        elif self.rowCount() > 0:
+            self.dataChanged.emit(self.index(0), self.index(self.rowCount() - 1),
+                                  [Qt.ItemDataRole.DisplayRole])
+
+    def getCountryFlag(self, country_code: str) -> QIcon:
+        """Get the flag of a country by country code
+
+        :param country_code: country code of the country
+        :return: flag of the country
+        """
+
+        country_code = country_code.lower()
+        if country_code not in countries:
+            return QIcon()
+        if country_code in self.__country_flag_overrides:
+            return self.__country_flag_overrides[country_code]
+        return get_default_country_flags()[country_code]
+
+    def setCountryFlag(self, country_code: str, icon: QIcon):
+        """Set the flag of a country by country code
+
+        :param country_code: country code of the country
+        :param icon: new flag of the country
+        """
+
+        self.setCountryFlags({country_code: icon})
+
+    def getCountryFlags(self) -> dict[str, QIcon]:
+        """Get the country flags
+
+        :return: dict containing the country flags by country code
+        """
+
+        country_flags = get_default_country_flags().copy()
+        country_flags.update(self.__country_flag_overrides)
+        return country_flags
+
+    def setCountryFlags(self, country_flags: dict[str, QIcon]):
+        """Set the country flags
+
+        :param country_flags: dict containing the country flags by country code
+        """
+
+        changed_countries = []
+        for country_code, flag_icon in country_flags.items():
+            country_code = country_code.lower()
+            if country_code not in countries:
+                continue
+            if self.getCountryFlag(country_code).cacheKey() == flag_icon.cacheKey():
+                continue
+            self.__country_flag_overrides[country_code] = flag_icon
+            changed_countries.append(country_code)
+
+        if self.__country_flags_enabled:
+            self.__emit_rows_changed(changed_countries, [Qt.ItemDataRole.DecorationRole])
+
+    def resetCountryFlags(self):
+        """Reset the country flags to the default flags"""
+
+        changed_countries = list(self.__country_flag_overrides.keys())
+        self.__country_flag_overrides = {}
+
+        if self.__country_flags_enabled:
+            self.__emit_rows_changed(changed_countries, [Qt.ItemDataRole.DecorationRole])
+
+    def getCountries(self) -> list[str]:
+        """Get the available countries
+
+        :return: available countries
+        """
+
+        return list(self.__countries)
+
+    def setCountries(self, countries: list[str]):
+        """Set the available countries
+
+        :param countries: new available countries
+        """
+
+        instrumentation = get_instrumentation()
+        start_time = perf_counter() if instrumentation is not None else 0
+
+        countries_set = set(country_code.lower() for country_code in countries)
+        removed_countries = self.__countries_set - countries_set
+        added_countries = countries_set - self.__countries_set
+        self.__countries = list(countries)
+        self.__countries_set = countries_set
+
+        if self.__update_depth > 0:
+            self.__rows_outdated = True
+            return
+        if removed_countries or added_countries:
+            self.__detach_rows()
+
+        # Remove the rows of countries that are no longer available, back to front
+        removed_rows = sorted((self.__row_by_country[country_code] for country_code in removed_countries
+                               if country_code in self.__row_by_country), reverse=True)
+        while removed_rows:
+            end = start = removed_rows.pop(0)
+            while removed_rows and removed_rows[0] == start - 1:
+                start = removed_rows.pop(0)
+            row_offset = self.getRowOffset()
+            self.beginRemoveRows(QModelIndex(), row_offset + start, row_offset + end)
+            for country_code in self.__rows[start:end + 1]:
+                del self.__row_by_country[country_code]
+            del self.__rows[start:end + 1]
+            self.__update_row_index(start)
+            self.endRemoveRows()
+            if instrumentation is not None:
+                instrumentation.increment('model.rows_removed', end - start + 1)
+
+        # Insert the rows of newly available countries at their sorted positions,
+        # countries that end up next to each other are inserted together
+        source_model = self.sourceModel()
+        added_rows = sorted((country_code for country_code in added_countries
+                             if source_model.getCountryRow(country_code) != -1), key=self.__get_sort_key)
+        insert_positions = [self.__get_insert_row(country_code) for country_code in added_rows]
+        while added_rows:
+            position = insert_positions[-1]
+            start = len(added_rows) - 1
+            while start > 0 and insert_positions[start - 1] == position:
+                start -= 1
+            row_offset = self.getRowOffset()
+            self.beginInsertRows(QModelIndex(), row_offset + position,
+                                 row_offset + position + len(added_rows) - start - 1)
+            self.__rows[position:position] = added_rows[start:]
+            self.__update_row_index(position)
+            self.endInsertRows()
+            if instrumentation is not None:
+                instrumentation.increment('model.rows_inserted', len(added_rows) - start)
+            del added_rows[start:]
+            del insert_positions[start:]
+
+        # Pinned countries that are no longer available are hidden and shown again once they are
+        self.__update_pinned_rows()
+
+        if instrumentation is not None:
+            instrumentation.recordTiming('model.set_countries', perf_counter() - start_time)
+
+    def __get_country_name(self, country_code: str) -> str:
+        """Get the name of a country, preferring the overridden name
+
+        :param country_code: country code of the country
+        :return: name of the country
+        """
+
+        return self.__country_name_overrides.get(country_code, self.__locale_names[country_code])
+
+    def __get_sort_key(self, country_code: str) -> tuple[str, int]:
+        """Get the key that the rows are sorted by, which is the cached
+        collation key of the name, countries with the same name keep
+        the order of the source model
+
+        :param country_code: country code of the country
+        :return: sort key of the country
+        """
+
+        return (self.__name_collation.getSortKey(self.__get_country_name(country_code)),
+                self.sourceModel().getCountryRow(country_code))
+
+    def __get_insert_row(self, country_code: str) -> int:
+        """Get the row a country has to be inserted at to keep the rows sorted
+
+        :param country_code: country code of the country
+        :return: row to insert the country at
+        """
+
+        sort_key = self.__get_sort_key(country_code)
+        low, high = 0, len(self.__rows)
+        while low < high:
+            middle = (low + high) // 2
+            if self.__get_sort_key(self.__rows[middle]) < sort_key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def __get_sorted_rows(self) -> list[str]:
+        """Get the codes of the available countries sorted by name
+
+        :return: sorted country codes
+        """
+
+        # With the default names and collation the order of the source model can be reused
+        source_model = self.sourceModel()
+        if (not self.__country_name_overrides and self.__locale_names is countries
+                and self.__name_collation is source_model.getNameCollation()):
+            if self.__countries_set == source_model.getCountrySet():
+                return source_model.getSortedCountryCodes()
+            return [country_code for country_code in source_model.getSortedCountryCodes()
+                    if country_code in self.__countries_set]
+
+        rows = [country_code for country_code in countries.keys()
+                if country_code in self.__countries_set]
+        rows.sort(key=self.__get_sort_key)
+        return rows
+
+    def __move_row_to_sorted_position(self, country_code: str):
+        """Move the row of a renamed country to its new sorted position,
+        all other rows must already be sorted
+
+        :param country_code: country code of the renamed country
+        """
+
+        self.__detach_rows()
+        old_row = self.__row_by_country[country_code]
+        del self.__rows[old_row]
+        new_row = self.__get_insert_row(country_code)
+        self.__rows.insert(old_row, country_code)
+        if new_row == old_row:
+            return
+
+        # The destination of a move is given as the row before which the row is inserted
+        destination_row = new_row + 1 if new_row > old_row else new_row
+        row_offset = self.getRowOffset()
+        self.beginMoveRows(QModelIndex(), row_offset + old_row, row_offset + old_row,
+                           QModelIndex(), row_offset + destination_row)
+        del self.__rows[old_row]
+        self.__rows.insert(new_row, country_code)
+        self.__update_row_index(min(old_row, new_row), max(old_row, new_row) + 1)
+        self.endMoveRows()
+
+        instrumentation = get_instrumentation()
+        if instrumentation is not None:
+            instrumentation.increment('model.rows_moved')
+
+    def __get_row_country(self, row: int) -> str:
+        """Get the country shown in a row
+
+        :param row: row of the model
+        :return: country code or None if the row is the separator or does not exist
+        """
+
+        if row < len(self.__pinned_rows):
+            return self.__pinned_rows[row]
+        row -= self.getRowOffset()
+        if row < 0 or row >= len(self.__rows):
+            return None
+        return self.__rows[row]
+
+    def __is_separator_row(self, row: int) -> bool:
+        """Get whether a row is the separator below the pinned countries
+
+        :param row: row of the model
+        :return: whether the row is the separator
+        """
+
+        return self.__separator_shown and row == len(self.__pinned_rows)
+
+    def __get_pinned_row(self, country_code: str) -> int:
+        """Get the pinned row of a country
+
+        :param country_code: country code of the country
+        :return: pinned row of the country or -1 if the country is not pinned
+        """
+
+        if country_code not in self.__pinned_rows:
+            return -1
+        return self.__pinned_rows.index(country_code)
+
+    def __get_pinned_rows(self) -> list[str]:
+        """Get the pinned countries that are available, in display order
+
+        :return: country codes of the pinned rows
+        """
+
+        pinned_rows = []
+        for country_code in self.__pinned_countries:
+            if self.isCountryAvailable(country_code) and country_code not in pinned_rows:
+                pinned_rows.append(country_code)
+        return pinned_rows
+
+    def __update_pinned_rows(self):
+        """Insert, remove and move only the pinned rows that differ from the pinned
+        countries, the separator is added and removed with the pinned section"""
+
+        pinned_rows = self.__get_pinned_rows()
+        if pinned_rows == self.__pinned_rows:
+            return
+
+        if not self.__separator_shown:
+            self.beginInsertRows(QModelIndex(), 0, len(pinned_rows))
+            self.__pinned_rows = pinned_rows
+            self.__separator_shown = True
+            self.endInsertRows()
+            return
+        if not pinned_rows:
+            self.beginRemoveRows(QModelIndex(), 0, len(self.__pinned_rows))
+            self.__pinned_rows = []
+            self.__separator_shown = False
+            self.endRemoveRows()
+            return
+
+        # Remove the countries that are no longer pinned, back to front
+        for row in reversed(range(len(self.__pinned_rows))):
+            if self.__pinned_rows[row] not in pinned_rows:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self.__pinned_rows[row]
+                self.endRemoveRows()
+
+        # Move the remaining countries up to their new rows and insert the newly pinned ones
+        for row, country_code in enumerate(pinned_rows):
+            if row < len(self.__pinned_rows) and self.__pinned_rows[row] == country_code:
+                continue
+            if country_code in self.__pinned_rows:
+                old_row = self.__pinned_rows.index(country_code)
+                self.beginMoveRows(QModelIndex(), old_row, old_row, QModelIndex(), row)
+                self.__pinned_rows.insert(row, self.__pinned_rows.pop(old_row))
+                self.endMoveRows()
+            else:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self.__pinned_rows.insert(row, country_code)
+                self.endInsertRows()
+
+    def __set_rows(self, rows: list[str]):
+        """Replace the rows, the sorted rows of all countries are shared
+        with the source model and only copied once they are changed
+
+        :param rows: country codes of the rows in display order
+        """
+
+        source_model = self.sourceModel()
+        self.__rows = rows
+        if rows is source_model.getSortedCountryCodes():
+            self.__row_by_country = source_model.getSortedRowIndex()
+        else:
+            self.__row_by_country = {}
+            self.__update_row_index(0)
+
+    def __detach_rows(self):
+        """Copy the rows shared with the source model before they are changed"""
+
+        if self.__rows is self.sourceModel().getSortedCountryCodes():
+            self.__rows = list(self.__rows)
+            self.__row_by_country = dict(self.__row_by_country)
+
+    def __update_row_index(self, start: int, end: int = None):
+        """Update the row index of the country codes between two rows
+
+        :param start: first row to update
+        :param end: row after the last row to update, defaults to the row count
+        """
+
+        if end is None:
+            end = len(self.__rows)
+        for row in range(start, end):
+            self.__row_by_country[self.__rows[row]] = row
+
+    def __emit_rows_changed(self, country_codes: list[str], roles: list[int]):
+        """Emit the dataChanged signal for the rows of the given countries
+        or defer it until the end of the current batch update
+
+        :param country_codes: country codes of the changed countries
+        :param roles: changed roles
+        """
+
+        if self.__update_depth > 0:
+            self.__data_outdated = self.__data_outdated or len(country_codes) > 0
+            return
+
+        for country_code in country_codes:
+            for row in [self.__get_pinned_row(country_code), self.getCountryRow(country_code)]:
+                if row != -1:
+                    self.dataChanged.emit(self.index(row), self.index(row), roles)
+
+    def __source_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: list[int]):
+        """Forward changes of the shared source model to the rows of this model
+
+        :param top_left: first changed index of the source model
+        :param bottom_right: last changed index of the source model
+        :param roles: changed roles
+        """
+
+        for source_row in range(top_left.row(), bottom_right.row() + 1):
+            index = self.mapFromSource(self.sourceModel().index(source_row))
+            if index.isValid():
+                self.dataChanged.emit(index, index, roles)
+                pinned_row = self.__get_pinned_row(self.sourceModel().getCountryCode(source_row))
+                if pinned_row != -1:
+                    self.dataChanged.emit(self.index(pinned_row), self.index(pinned_row), roles)
@@ -0,0 +1,149 @@
+import os
+import mmap
+import zlib
+import struct
+from qtpy.QtCore import QLocale
+from .countries import countries
+
+
+# Name table file layout:
+#   header:  magic (8 bytes), number of countries (uint32), number of locales (uint32)
+#   codes:   code length (uint8), code (ascii), in the order of the names of every table
+#   locales: locale length (uint8), locale name (ascii), offset (uint32), length (uint32)
+#   data:    zlib compressed tables of newline separated utf-8 names, back to back,
+#            empty names are untranslated and fall back to the default name
+TABLES_MAGIC = b'PQCPNAME'
+TABLES_HEADER = struct.Struct('<8sII')
+TABLES_ENTRY = struct.Struct('<II')
+
+DEFAULT_TABLES_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'country_names.tables')
+
+# Shared name tables and the names of every locale that has been requested, loaded on first use
+_name_tables = None
+_country_names_by_locale = {}
+
+
+class NameTables:
+
+    def __init__(self, path: str = DEFAULT_TABLES_PATH):
+        """Open the country name tables by memory-mapping them and reading
+        their index, the tables themselves are only decompressed when requested
+
+        :param path: path of the name tables file
+        """
+
+        with open(path, 'rb') as file:
+            self.__buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, country_count, locale_count = TABLES_HEADER.unpack_from(self.__buffer, 0)
+        if magic != TABLES_MAGIC:
+            raise ValueError('{} is not a name tables file'.format(path))
+
+        position = TABLES_HEADER.size
+        self.__country_codes = []
+        for _ in range(country_count):
+            code_length = self.__buffer[position]
+            self.__country_codes.append(self.__buffer[position + 1:position + 1 + code_length].decode('ascii'))
+            position += 1 + code_length
+
+        self.__entries = {}
+        for _ in range(locale_count):
+            locale_length = self.__buffer[position]
+            locale_name = self.__buffer[position + 1:position + 1 + locale_length].decode('ascii')
+            position += 1 + locale_length
+            self.__entries[locale_name] = TABLES_ENTRY.unpack_from(self.__buffer, position)
+            position += TABLES_ENTRY.size
+
+    def getLocales(self) -> list[str]:
+        """Get the names of all locales that have a name table
+
+        :return: locale names
+        """
+
+        return list(self.__entries.keys())
+
+    def getCountryNames(self, locale_name: str) -> dict[str, str]:
+        """Decompress the name table of a locale
+
+        :param locale_name: name of the locale
+        :return: dict containing the translated country names by country code,
+                 countries without translation are left out
+        """
+
+        offset, length = self.__entries[locale_name]
+        names = zlib.decompress(self.__buffer[offset:offset + length]).decode('utf-8').split('\n')
+        return {country_code: name for country_code, name in zip(self.__country_codes, names) if name}
+
+    def __contains__(self, locale_name: str) -> bool:
+        return locale_name in self.__entries
+
+
+def build_name_tables(country_codes: list[str], names_by_locale: dict[str, dict[str, str]],
+                      tables_path: str = DEFAULT_TABLES_PATH):
+    """Pack the country names of multiple locales into a single name tables file
+
+    :param country_codes: country codes of the names to pack
+    :param names_by_locale: dicts containing the country names by country code by locale name
+    :param tables_path: path of the name tables file to write
+    """
+
+    tables = [zlib.compress('\n'.join(names.get(country_code, '') for country_code in country_codes)
+                            .encode('utf-8'), 9)
+              for names in names_by_locale.values()]
+
+    codes_size = sum(1 + len(country_code) for country_code in country_codes)
+    index_size = sum(1 + len(locale_name) + TABLES_ENTRY.size for locale_name in names_by_locale)
+    offset = TABLES_HEADER.size + codes_size + index_size
+
+    with open(tables_path, 'wb') as file:
+        file.write(TABLES_HEADER.pack(TABLES_MAGIC, len(country_codes), len(names_by_locale)))
+        for country_code in country_codes:
+            file.write(struct.pack('<B', len(country_code)) + country_code.encode('ascii'))
+        for locale_name, table in zip(names_by_locale, tables):
+            file.write(struct.pack('<B', len(locale_name)) + locale_name.encode('ascii'))
+            file.write(TABLES_ENTRY.pack(offset, len(table)))
+            offset += len(table)
+        for table in tables:
+            file.write(table)
+
+
+def get_name_tables() -> NameTables:
+    """Get the bundled name tables that are shared by all models
+
+    :return: shared name tables
+    """
+
+    global _name_tables
+
+    if _name_tables is None:
+        _name_tables = NameTables()
+    return _name_tables
+
+
+def get_country_names(locale: QLocale) -> dict[str, str]:
+    """Get the country names of a locale, falling back to the table of its
+    language and to the default English names of untranslated countries
+
+    The names of a locale are loaded on first request and shared afterwards
+
+    :param locale: locale of the names
+    :return: shared dict containing the country names by country code that must not be modified
+    """
+
+    locale_name = locale.name()
+    if locale_name not in _country_names_by_locale:
+        name_tables = get_name_tables()
+        language_name = locale_name.split('_')[0]
+        table_name = locale_name if locale_name in name_tables else language_name
+
+        if table_name not in name_tables:
+            country_names = countries
+        elif table_name in _country_names_by_locale:
+            country_names = _country_names_by_locale[table_name]
+        else:
+            country_names = countries.copy()
+            country_names.update(name_tables.getCountryNames(table_name))
+            _country_names_by_locale[table_name] = country_names
+        _country_names_by_locale[locale_name] = country_names
+    return _country_names_by_locale[locale_name]
+
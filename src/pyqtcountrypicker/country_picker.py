@@ -1,8 +1,17 @@
-import os
-from qtpy.QtWidgets import QWidget, QComboBox
-from qtpy.QtGui import QIcon
-from qtpy.QtCore import Qt, Signal
-from .countries import countries
+from contextlib import contextmanager
+from qtpy.QtWidgets import QWidget, QComboBox, QCompleter, QLineEdit, QListView
+from qtpy.QtGui import QIcon, QStandardItem, QStandardItemModel
+from qtpy.QtCore import Qt, Signal, QModelIndex, QLocale, QSettings
+from .country_model import CountryModel
+from .dial_code_trie import get_dial_code_trie
+from .recent_countries import DEFAULT_RECENT_COUNTRIES_SIZE, RecentCountries
+from .catalog import get_country_catalog
+from .metadata_store import CODE_FORMAT_ALPHA2, CODE_FORMAT_ALPHA3, CODE_FORMAT_NUMERIC
+from .search_index import CountrySearchIndex, get_default_search_index
+
+
+# Number of rows the popup lays out at a time while the rest of the layout is done in the event loop
+POPUP_BATCH_SIZE = 32
 
 
 class CountryPicker(QComboBox):
@@ -19,18 +28,48 @@ class CountryPicker(QComboBox):
         super(CountryPicker, self).__init__(parent)
 
         # Attributes
-        self.__countries = list(countries.keys())
-        self.__country_names = countries.copy()
-        self.__country_flags = self.__get_default_country_flags()
-        self.__country_flags_enabled = True
+        self.__country_model = CountryModel(self)
+        self.__change_depth = 0
+        self.__country_before_change = None
+        self.__search_enabled = False
+        self.__search_index = None
+        self.__search_results_model = None
+        self.__code_format = CODE_FORMAT_ALPHA2
+        self.__phone_number_edit = None
+        self.__recent_countries = None
+        self.__recent_countries_limit = DEFAULT_RECENT_COUNTRIES_SIZE
+        self.__recent_countries_settings = None
+        self.__recent_countries_settings_key = None
+
+        # Init dropdown items, the popup view only measures and paints the visible rows,
+        # the default view is kept, since the combo box sets its own delegate on it
+        self.setModel(self.__country_model)
+        self.view().setUniformItemSizes(True)
+        self.view().setLayoutMode(QListView.LayoutMode.Batched)
+        self.view().setBatchSize(POPUP_BATCH_SIZE)
+        self.__current_country = self.currentData()
+        self.currentIndexChanged.connect(self.__current_index_changed)
+
+    def getCountryCodeFormat(self) -> str:
+        """Get the format of the country codes returned by the picker
+
+        :return: alpha2, alpha3 or numeric
+        """
 
-        self.__countries_set = set(self.__countries)
-        self.__current_country = next(iter(self.__country_names.keys()))
-        self.__blocking_signals = False
+        return self.__code_format
 
-        # Init dropdown items
-        self.__update_dropdown_items()
-        self.currentTextChanged.connect(self.__current_text_changed)
+    def setCountryCodeFormat(self, code_format: str):
+        """Set the format of the country codes returned by the picker, codes
+        passed to the picker are accepted in any format regardless of this setting
+
+        Countries without a code in the format keep their alpha-2 code
+
+        :param code_format: alpha2, alpha3 or numeric
+        """
+
+        if code_format not in [CODE_FORMAT_ALPHA2, CODE_FORMAT_ALPHA3, CODE_FORMAT_NUMERIC]:
+            raise ValueError('Unknown country code format: {}'.format(code_format))
+        self.__code_format = code_format
 
     def getCurrentCountry(self) -> str:
         """Get the currently selected country
@@ -38,7 +77,7 @@ class CountryPicker(QComboBox):
         :return: country code
         """
 
-        return self.__current_country
+        return self.__from_country_code(self.__current_country)
 
     def setCurrentCountry(self, country_code: str):
         """Set the currently selected country
@@ -46,15 +85,19 @@ class CountryPicker(QComboBox):
         :param country_code: country to select
         """
 
-        country_code = country_code.lower()
-        if country_code not in self.__country_names:
+        country_code = self.__to_country_code(country_code)
+
+        # The rows are only updated at the end of a batch update
+        if self.__country_model.isUpdating():
+            if self.__country_model.isCountryAvailable(country_code):
+                self.__current_country = country_code.lower()
             return
 
-        if country_code not in self.__countries:
+        row = self.__country_model.getCountryRow(country_code)
+        if row == -1:
             return
 
-        self.__current_country = country_code
-        self.setCurrentIndex(self.findText(self.__country_names[country_code]))
+        self.setCurrentIndex(row)
 
     def getCountryName(self, country_code) -> str:
         """Get the name of a country by country code
@@ -63,10 +106,7 @@ class CountryPicker(QComboBox):
         :return: name of the country
         """
 
-        country_code = country_code.lower()
-        if country_code not in self.__country_names:
-            return ''
-        return self.__country_names[country_code]
+        return self.__country_model.getCountryName(self.__to_country_code(country_code))
 
     def setCountryName(self, country_code: str, country_name: str):
         """Set the name of a country by country code
@@ -75,15 +115,8 @@ class CountryPicker(QComboBox):
         :param country_name: new name of the country
         """
 
-        country_code = country_code.lower()
-        if country_code not in self.__country_names:
-            return
-
-        # Rename dropdown item and sort again
-        item_index = self.findText(self.__country_names[country_code])
-        self.setItemText(item_index, country_name)
-        self.model().sort(self.modelColumn(), Qt.SortOrder.AscendingOrder)
-        self.__country_names[country_code] = country_name
+        self.__country_model.setCountryName(self.__to_country_code(country_code), country_name)
+        self.__update_search_index()
 
     def getCountryNames(self) -> dict[str, str]:
         """Get the country names
@@ -91,7 +124,8 @@ class CountryPicker(QComboBox):
         :return: dict containing the country names by country code
         """
 
-        return self.__country_names
+        return {self.__from_country_code(country_code): country_name
+                for country_code, country_name in self.__country_model.getCountryNames().items()}
 
     def setCountryNames(self, country_names: dict[str, str]):
         """Set the country names
@@ -99,20 +133,28 @@ class CountryPicker(QComboBox):
         :param country_names: dict containing the country names by country code
         """
 
-        # Rename all valid countries and update dropdown items
-        for country_code, country_name in country_names.items():
-            country_code = country_code.lower()
-            if country_code not in self.__country_names:
-                continue
-            self.__country_names[country_code] = country_name
-
-        self.__update_dropdown_items()
+        self.__country_model.setCountryNames({self.__to_country_code(country_code): country_name
+                                              for country_code, country_name in country_names.items()})
+        self.__update_search_index()
 
     def resetCountryNames(self):
         """Reset the country names to the default names"""
 
-        self.__country_names = countries.copy()
-        self.__update_dropdown_items()
+        self.__country_model.resetCountryNames()
+        self.__update_search_index()
+
+    def setLocale(self, locale: QLocale):
+        """Set the locale of the picker and show the country names of that locale,
+        the names of the locale are loaded on first use and applied in one batch
+
+        :param locale: new locale
+        """
+
+        super(CountryPicker, self).setLocale(locale)
+        self.__begin_changes()
+        self.__country_model.setLocale(locale)
+        self.__end_changes()
+        self.__update_search_index()
 
     def isCountryFlagsEnabled(self) -> bool:
         """Get whether the country flag icons are enabled
@@ -120,7 +162,7 @@ class CountryPicker(QComboBox):
         :return: whether the country flags are enabled
         """
 
-        return self.__country_flags_enabled
+        return self.__country_model.isCountryFlagsEnabled()
 
     def setCountryFlagsEnabled(self, enabled: bool):
         """Set whether the country flag icons should be enabled
@@ -128,8 +170,7 @@ class CountryPicker(QComboBox):
         :param enabled: whether the country flags should be enabled
         """
 
-        self.__country_flags_enabled = enabled
-        self.__update_dropdown_items()
+        self.__country_model.setCountryFlagsEnabled(enabled)
 
     def getCountryFlag(self, country_code: str) -> QIcon:
         """Get the flag of a country by country code
@@ -138,10 +179,7 @@ class CountryPicker(QComboBox):
         :return: flag of the country
         """
 
-        country_code = country_code.lower()
-        if country_code not in self.__country_names:
-            return QIcon()
-        return self.__country_flags[country_code]
+        return self.__country_model.getCountryFlag(self.__to_country_code(country_code))
 
     def setCountryFlag(self, country_code: str, icon: QIcon):
         """Set the flag of a country by country code
@@ -150,11 +188,7 @@ class CountryPicker(QComboBox):
         :param icon: new flag of the country
         """
 
-        country_code = country_code.lower()
-        if country_code not in self.__country_names:
-            return
-        self.__country_flags[country_code] = icon
-        self.__update_dropdown_items()
+        self.__country_model.setCountryFlag(self.__to_country_code(country_code), icon)
 
     def getCountryFlags(self) -> dict[str, QIcon]:
         """Get the country flags
@@ -162,7 +196,8 @@ class CountryPicker(QComboBox):
         :return: dict containing the country flags by country code
         """
 
-        return self.__country_flags
+        return {self.__from_country_code(country_code): icon
+                for country_code, icon in self.__country_model.getCountryFlags().items()}
 
     def setCountryFlags(self, country_flags: dict[str, QIcon]):
         """Set the country flags
@@ -170,18 +205,13 @@ class CountryPicker(QComboBox):
         :param country_flags: dict containing the country flags by country code
         """
 
-        for country_code, flag_icon in country_flags.items():
-            country_code = country_code.lower()
-            if country_code not in self.__country_names:
-                continue
-            self.__country_flags[country_code] = flag_icon
-        self.__update_dropdown_items()
+        self.__country_model.setCountryFlags({self.__to_country_code(country_code): icon
+                                              for country_code, icon in country_flags.items()})
 
     def resetCountryFlags(self):
         """Reset the country flags to the default flags"""
 
-        self.__country_flags = self.__get_default_country_flags()
-        self.__update_dropdown_items()
+        self.__country_model.resetCountryFlags()
 
     def getCountries(self) -> list[str]:
         """Get the available countries
@@ -189,7 +219,7 @@ class CountryPicker(QComboBox):
         :return: available countries
         """
 
-        return self.__countries
+        return [self.__from_country_code(country_code) for country_code in self.__country_model.getCountries()]
 
     def setCountries(self, countries: list[str]):
         """Set the available countries
@@ -197,51 +227,378 @@ class CountryPicker(QComboBox):
         :param countries: new available countries
         """
 
-        self.__countries = countries
-        self.__countries_set = set(self.__countries)
-        self.__update_dropdown_items()
+        # The model only inserts and removes the affected rows, so the
+        # current country stays selected unless it is no longer available
+        self.__begin_changes()
+        normalized_countries = get_country_catalog().normalizeCodes(countries)
+        self.__country_model.setCountries([country_code or code for country_code, code
+                                           in zip(normalized_countries, countries)])
+        self.__end_changes()
 
-    def __update_dropdown_items(self):
-        """Update the items of the dropdown by clearing and repopulating it"""
+    def isSearchEnabled(self) -> bool:
+        """Get whether countries can be searched by typing into the picker
 
-        self.__blocking_signals = True
-        self.clear()
+        :return: whether search is enabled
+        """
 
-        # Add available countries
-        for country_code, country_name in self.__country_names.items():
-            if country_code not in self.__countries_set:
-                continue
+        return self.__search_enabled
 
-            # Only add country flag icons if enabled
-            if self.__country_flags_enabled:
-                self.addItem(self.__country_flags[country_code], country_name, userData=country_code)
-            else:
-                self.addItem(country_name, userData=country_code)
+    def setSearchEnabled(self, enabled: bool):
+        """Set whether countries can be searched by typing into the picker,
+        matching countries are shown in a popup while typing
+
+        :param enabled: whether search should be enabled
+        """
+
+        if enabled == self.__search_enabled:
+            return
+
+        self.__search_enabled = enabled
+        self.setEditable(enabled)
+        if not enabled:
+            self.__search_results_model = None
+            return
+
+        self.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.__search_results_model = QStandardItemModel(self)
+        completer = QCompleter(self.__search_results_model, self)
+        completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        completer.activated[QModelIndex].connect(self.__search_result_activated)
+        self.setCompleter(completer)
+        self.lineEdit().textEdited.connect(self.__search_text_edited)
+        self.lineEdit().editingFinished.connect(self.__search_editing_finished)
+
+    def findCountries(self, query: str, limit: int = 10) -> list[str]:
+        """Find available countries by name, country code or common alias
+
+        :param query: text to search for
+        :param limit: maximum number of results
+        :return: country codes of the matching countries, best matches first
+        """
+
+        country_codes = self.__get_search_index().search(query, limit=len(self.__country_model.getCountryNames()))
+        return [self.__from_country_code(country_code) for country_code in country_codes
+                if self.__country_model.isCountryAvailable(country_code)][:limit]
+
+    def isPhoneModeEnabled(self) -> bool:
+        """Get whether the calling codes are shown next to the country names
+
+        :return: whether phone mode is enabled
+        """
+
+        return self.__country_model.isDialCodesShown()
+
+    def setPhoneModeEnabled(self, enabled: bool):
+        """Set whether the calling codes should be shown next to the country names,
+        e.g. "Germany (+49)", for picking the country of a phone number
+
+        :param enabled: whether phone mode should be enabled
+        """
+
+        self.__country_model.setDialCodesShown(enabled)
+
+    def getPhoneNumberEdit(self) -> QLineEdit:
+        """Get the line edit the country is selected from
+
+        :return: phone number line edit or None if there is none
+        """
+
+        return self.__phone_number_edit
+
+    def setPhoneNumberEdit(self, line_edit: QLineEdit):
+        """Set a line edit for phone numbers in international format, the country
+        of the number is selected automatically while the user types it
+
+        :param line_edit: phone number line edit or None to stop following a line edit
+        """
+
+        if self.__phone_number_edit is not None:
+            self.__phone_number_edit.textEdited.disconnect(self.selectCountryByPhoneNumber)
+        self.__phone_number_edit = line_edit
+        if line_edit is not None:
+            line_edit.textEdited.connect(self.selectCountryByPhoneNumber)
+
+    def selectCountryByPhoneNumber(self, number: str) -> bool:
+        """Select the country of a phone number by the longest dialing prefix it starts with,
+        the current country is kept if it is one of the countries sharing that prefix
+
+        :param number: phone number in international format
+        :return: whether an available country matches the number
+        """
+
+        countries = [country_code for country_code in get_dial_code_trie().match(number)
+                     if self.__country_model.isCountryAvailable(country_code)]
+        if not countries:
+            return False
+        if self.__current_country not in countries:
+            self.setCurrentCountry(countries[0])
+        return True
+
+    def isRecentCountriesEnabled(self) -> bool:
+        """Get whether the recently selected countries are pinned at the top of the dropdown
+
+        :return: whether recent countries are enabled
+        """
+
+        return self.__recent_countries is not None
+
+    def setRecentCountriesEnabled(self, enabled: bool):
+        """Set whether the recently selected countries should be pinned at the top
+        of the dropdown, above a separator, most recently selected first
+
+        :param enabled: whether recent countries should be enabled
+        """
+
+        if enabled == self.isRecentCountriesEnabled():
+            return
+
+        if not enabled:
+            self.__recent_countries = None
+            self.__set_pinned_countries([])
+            return
+
+        self.__recent_countries = RecentCountries(self.__recent_countries_limit)
+        if self.__recent_countries_settings is not None:
+            self.__load_recent_countries()
+        self.__set_pinned_countries(self.__recent_countries.getCountries())
+
+    def getRecentCountriesLimit(self) -> int:
+        """Get the maximum number of recently selected countries
+
+        :return: maximum number of recent countries
+        """
+
+        return self.__recent_countries_limit
+
+    def setRecentCountriesLimit(self, limit: int):
+        """Set the maximum number of recently selected countries
+
+        :param limit: maximum number of recent countries
+        """
 
-        # Sort dropdown and make sure previously selected country is selected again
-        self.model().sort(self.modelColumn(), Qt.SortOrder.AscendingOrder)
-        self.setCurrentCountry(self.__current_country)
-        self.__blocking_signals = False
+        self.__recent_countries_limit = limit
+        if self.__recent_countries is not None:
+            self.__recent_countries.setMaxSize(limit)
+            self.__set_pinned_countries(self.__recent_countries.getCountries())
 
-    def __current_text_changed(self, text: str):
-        """Handle the currentTextChanged signal by emitting the
-        countryChanged signal if the country has been manually changed
+    def getRecentCountries(self) -> list[str]:
+        """Get the recently selected countries
 
-        :param text: text of currently selected item
+        :return: country codes, most recently selected first
         """
 
-        if not self.__blocking_signals:
+        if self.__recent_countries is None:
+            return []
+        return [self.__from_country_code(country_code) for country_code in self.__recent_countries.getCountries()]
+
+    def setRecentCountries(self, countries: list[str]):
+        """Set the recently selected countries, e.g. to pin the most used ones
+
+        :param countries: country codes, most recently selected first
+        """
+
+        if self.__recent_countries is None:
+            return
+
+        self.__recent_countries.setCountries([self.__to_country_code(country_code).lower()
+                                              for country_code in countries])
+        self.__set_pinned_countries(self.__recent_countries.getCountries())
+        self.__save_recent_countries()
+
+    def setRecentCountriesSettings(self, settings: QSettings, key: str = 'recentCountries'):
+        """Set the settings the recently selected countries are loaded from and stored in,
+        the countries are stored as a single comma-separated value on every change
+
+        :param settings: settings of the application or None to stop storing the countries
+        :param key: key of the recent countries in the settings
+        """
+
+        self.__recent_countries_settings = settings
+        self.__recent_countries_settings_key = key
+        if settings is not None and self.__recent_countries is not None:
+            self.__load_recent_countries()
+            self.__set_pinned_countries(self.__recent_countries.getCountries())
+
+    def beginUpdate(self):
+        """Begin a batch update, all changes until the matching call of
+        endUpdate() are applied to the dropdown at once and the countryChanged
+        signal is emitted at most once"""
+
+        self.__begin_changes()
+        self.__country_model.beginUpdate()
+
+    def endUpdate(self):
+        """End a batch update and apply all changes made during it"""
+
+        self.__country_model.endUpdate()
+        self.__end_changes()
+
+    @contextmanager
+    def batchUpdate(self):
+        """Context manager that wraps its block in beginUpdate() and endUpdate()"""
+
+        self.beginUpdate()
+        try:
+            yield self
+        finally:
+            self.endUpdate()
+
+    def __begin_changes(self):
+        """Begin changes to the rows during which the countryChanged signal is held back"""
+
+        if self.__change_depth == 0:
+            self.__country_before_change = self.__current_country
+        self.__change_depth += 1
+
+    def __end_changes(self):
+        """End changes to the rows by selecting the row of the current country among the
+        other countries again, or the first country below the pinned ones if it is no longer
+        available, and emit the countryChanged signal once if the selected country is
+        different from before the changes
+        """
+
+        if self.__change_depth == 1 and self.count() > 0:
+            row = self.__country_model.getCountryRow(self.__current_country)
+            self.setCurrentIndex(row if row != -1 else self.__country_model.getRowOffset())
             self.__current_country = self.currentData()
-            self.countryChanged.emit(self.__current_country)
 
-    def __get_default_country_flags(self) -> dict[str, QIcon]:
-        """Get a dict of the default country flag icons by country code
+        self.__change_depth -= 1
+        if self.__change_depth == 0 and self.__current_country != self.__country_before_change:
+            self.__emit_country_changed()
+
+    def __emit_country_changed(self):
+        """Emit the countryChanged signal for the current country
+        and pin it as the most recently selected country"""
+
+        if self.__recent_countries is not None and self.__current_country is not None:
+            self.__recent_countries.add(self.__current_country)
+            self.__set_pinned_countries(self.__recent_countries.getCountries())
+            self.__save_recent_countries()
+
+        self.countryChanged.emit(self.__from_country_code(self.__current_country))
+
+    def __set_pinned_countries(self, countries: list[str]):
+        """Pin countries at the top of the dropdown, the selection stays
+        on the row of the current country among the other countries
+
+        :param countries: countries to pin, most recently selected first
+        """
+
+        self.__begin_changes()
+        self.__country_model.setPinnedCountries(countries)
+        self.__end_changes()
+
+    def __load_recent_countries(self):
+        """Load the recently selected countries from the settings"""
+
+        value = self.__recent_countries_settings.value(self.__recent_countries_settings_key, '')
+        if not isinstance(value, str):
+            return
+
+        # Codes stored in another format or case are normalized and unknown codes are dropped
+        country_codes = [self.__to_country_code(code).lower() for code in value.split(',')]
+        self.__recent_countries.setCountries([country_code for country_code in country_codes
+                                              if get_country_catalog().isValidCode(country_code)])
 
-        :return: default country flag dict
+    def __save_recent_countries(self):
+        """Store the recently selected countries in the settings"""
+
+        if self.__recent_countries_settings is not None:
+            self.__recent_countries_settings.setValue(self.__recent_countries_settings_key,
+                                                      ','.join(self.__recent_countries.getCountries()))
+
+    def __to_country_code(self, code: str) -> str:
+        """Convert a country code in any format to the alpha-2 code the model uses
+
+        :param code: code of the country in any format
+        :return: alpha-2 country code, unknown codes are returned unchanged
+        """
+
+        if code is None:
+            return None
+        return get_country_catalog().normalizeCode(code) or code
+
+    def __from_country_code(self, country_code: str) -> str:
+        """Convert an alpha-2 country code to the format returned by the picker
+
+        :param country_code: alpha-2 country code
+        :return: country code in the format of the picker
+        """
+
+        if self.__code_format == CODE_FORMAT_ALPHA2 or country_code is None:
+            return country_code
+        return get_country_catalog().convertCode(country_code, self.__code_format) or country_code
+
+    def __get_search_index(self) -> CountrySearchIndex:
+        """Get the search index, the shared index is used until the
+        country names of this picker are changed
+
+        :return: search index matching the current country names
+        """
+
+        if self.__search_index is None:
+            if not self.__country_model.hasCustomCountryNames():
+                return get_default_search_index()
+            self.__search_index = CountrySearchIndex(self.__country_model.getCountryNames())
+        return self.__search_index
+
+    def __update_search_index(self):
+        """Reindex the changed country names if this picker has its own search index"""
+
+        if self.__search_index is not None:
+            self.__search_index.setCountryNames(self.__country_model.getCountryNames())
+
+    def __search_text_edited(self, text: str):
+        """Show the countries matching the text typed into the picker
+
+        :param text: text typed into the picker
+        """
+
+        self.__search_results_model.clear()
+        for country_code in self.findCountries(text):
+            item = QStandardItem(self.getCountryName(country_code))
+            if self.isCountryFlagsEnabled():
+                item.setIcon(self.getCountryFlag(country_code))
+            item.setData(country_code, Qt.ItemDataRole.UserRole)
+            self.__search_results_model.appendRow(item)
+
+        if self.__search_results_model.rowCount() > 0:
+            self.completer().complete()
+
+    def __search_result_activated(self, index: QModelIndex):
+        """Select the country of an activated search result
+
+        :param index: index of the search result
+        """
+
+        self.setCurrentCountry(index.data(Qt.ItemDataRole.UserRole))
+        self.lineEdit().setText(self.itemText(self.currentIndex()))
+
+    def __search_editing_finished(self):
+        """Show the name of the current country again after searching"""
+
+        self.lineEdit().setText(self.itemText(self.currentIndex()))
+
+    def __current_index_changed(self, index: int):
+        """Handle the currentIndexChanged signal by emitting the
+        countryChanged signal if the selected country has changed
+
+        :param index: index of the currently selected item
         """
 
-        current_dir = os.path.dirname(os.path.realpath(__file__))
-        return {
-            country_code: QIcon(current_dir + '/flags/{}.png'.format(country_code))
-            for country_code in countries.keys()
-        }
+        if self.__change_depth > 0 or index == -1:
+            return
+
+        # A pinned row selects its country, but the selection moves to
+        # the row of the country among the other countries
+        country_code = self.itemData(index)
+        if index < self.__country_model.getRowOffset():
+            self.__begin_changes()
+            if country_code is not None:
+                self.__current_country = country_code
+            self.__end_changes()
+            return
+
+        if country_code != self.__current_country:
+            self.__current_country = country_code
+            self.__emit_country_changed()
@@ -0,0 +1,92 @@
+from .country_metadata import country_codes, dial_codes, dial_prefixes
+
+
+# Shared dial code trie, created on first use
+_dial_code_trie = None
+
+
+class _DialCodeNode:
+
+    __slots__ = ('children', 'countries')
+
+    def __init__(self):
+        self.children = {}
+        self.countries = ()
+
+
+class DialCodeTrie:
+
+    def __init__(self, prefixes: dict[str, tuple[str, ...]] = None):
+        """Create a new DialCodeTrie instance that finds the country of a phone
+        number by the longest dialing prefix the number starts with
+
+        :param prefixes: dict containing the country codes by dialing prefix, most likely country
+                         first, defaults to the bundled calling codes and prefixes of shared codes
+        """
+
+        self.__root = _DialCodeNode()
+
+        if prefixes is None:
+            prefixes = {}
+            for country_code, dial_code in zip(country_codes, dial_codes):
+                prefixes.setdefault(dial_code, (country_code,))
+            prefixes.update(dial_prefixes)
+
+        for prefix, countries in prefixes.items():
+            self.addPrefix(prefix, countries)
+
+    def addPrefix(self, prefix: str, countries: tuple[str, ...]):
+        """Add a dialing prefix, replacing the countries of an existing prefix
+
+        :param prefix: digits of the prefix including the calling code
+        :param countries: country codes of the prefix, most likely country first
+        """
+
+        node = self.__root
+        for digit in prefix:
+            child = node.children.get(digit)
+            if child is None:
+                child = node.children[digit] = _DialCodeNode()
+            node = child
+        node.countries = tuple(countries)
+
+    def match(self, number: str) -> tuple[str, ...]:
+        """Find the countries of the longest dialing prefix a phone number starts with,
+        walking the digits once so the cost only depends on the length of the number
+
+        :param number: phone number in international format, a leading + or 00 and
+                       spaces, dashes, dots and parentheses are ignored
+        :return: country codes of the matching prefix, most likely country first,
+                 empty if the number does not start with a known prefix
+        """
+
+        number = number.lstrip()
+        if number.startswith('+'):
+            number = number[1:]
+        elif number.startswith('00'):
+            number = number[2:]
+
+        node = self.__root
+        countries = ()
+        for character in number:
+            if character in ' -.()':
+                continue
+            node = node.children.get(character)
+            if node is None:
+                break
+            if node.countries:
+                countries = node.countries
+        return countries
+
+
+def get_dial_code_trie() -> DialCodeTrie:
+    """Get the dial code trie that is shared by all pickers
+
+    :return: shared dial code trie
+    """
+
+    global _dial_code_trie
+
+    if _dial_code_trie is None:
+        _dial_code_trie = DialCodeTrie()
+    return _dial_code_trie
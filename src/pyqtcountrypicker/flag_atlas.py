@@ -0,0 +1,113 @@
+import os
+import mmap
+import struct
+
+
+# Atlas file layout:
+#   header:  magic (8 bytes), number of entries (uint32)
+#   entries: code length (uint8), code (ascii), offset (uint32),
+#            length (uint32), width (uint16), height (uint16)
+#   data:    encoded images, back to back
+ATLAS_MAGIC = b'PQCPFLAG'
+ATLAS_HEADER = struct.Struct('<8sI')
+ATLAS_ENTRY = struct.Struct('<IIHH')
+
+DEFAULT_SOURCE_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'flags')
+DEFAULT_ATLAS_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'flags.atlas')
+
+
+class FlagAtlas:
+
+    def __init__(self, path: str = DEFAULT_ATLAS_PATH):
+        """Open a flag atlas by memory-mapping it and reading its index
+
+        :param path: path of the atlas file
+        """
+
+        with open(path, 'rb') as file:
+            self.__buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, entry_count = ATLAS_HEADER.unpack_from(self.__buffer, 0)
+        if magic != ATLAS_MAGIC:
+            raise ValueError('{} is not a flag atlas'.format(path))
+
+        self.__entries = {}
+        position = ATLAS_HEADER.size
+        for _ in range(entry_count):
+            code_length = self.__buffer[position]
+            code = self.__buffer[position + 1:position + 1 + code_length].decode('ascii')
+            position += 1 + code_length
+            self.__entries[code] = ATLAS_ENTRY.unpack_from(self.__buffer, position)
+            position += ATLAS_ENTRY.size
+
+    def getCountryCodes(self) -> list[str]:
+        """Get the country codes of all flags in the atlas
+
+        :return: country codes in atlas order
+        """
+
+        return list(self.__entries.keys())
+
+    def getFlagSize(self, country_code: str) -> tuple[int, int]:
+        """Get the size of a flag without decoding it
+
+        :param country_code: country code of the flag
+        :return: width and height of the flag
+        """
+
+        offset, length, width, height = self.__entries[country_code]
+        return width, height
+
+    def getFlagData(self, country_code: str) -> memoryview:
+        """Get the encoded image of a flag as a view into the atlas
+
+        :param country_code: country code of the flag
+        :return: encoded image data, not copied out of the atlas
+        """
+
+        offset, length, width, height = self.__entries[country_code]
+        return memoryview(self.__buffer)[offset:offset + length]
+
+    def __contains__(self, country_code: str) -> bool:
+        return country_code in self.__entries
+
+
+def build_flag_atlas(country_codes: list[str], source_dir: str = DEFAULT_SOURCE_DIR,
+                     atlas_path: str = DEFAULT_ATLAS_PATH):
+    """Pack the flag images of the given countries into a single atlas file
+
+    :param country_codes: country codes of the flags to pack
+    :param source_dir: directory containing the flag images as <code>.png
+    :param atlas_path: path of the atlas file to write
+    """
+
+    images = []
+    for country_code in country_codes:
+        with open(os.path.join(source_dir, '{}.png'.format(country_code)), 'rb') as file:
+            images.append(file.read())
+
+    index_size = sum(1 + len(country_code) + ATLAS_ENTRY.size for country_code in country_codes)
+    offset = ATLAS_HEADER.size + index_size
+
+    with open(atlas_path, 'wb') as file:
+        file.write(ATLAS_HEADER.pack(ATLAS_MAGIC, len(country_codes)))
+        for country_code, image in zip(country_codes, images):
+            width, height = _read_png_size(image)
+            file.write(struct.pack('<B', len(country_code)) + country_code.encode('ascii'))
+            file.write(ATLAS_ENTRY.pack(offset, len(image), width, height))
+            offset += len(image)
+        for image in images:
+            file.write(image)
+
+
+def _read_png_size(image: bytes) -> tuple[int, int]:
+    """Read the size of a PNG image from its IHDR chunk
+
+    :param image: encoded PNG image
+    :return: width and height of the image
+    """
+
+    if image[:8] != b'\x89PNG\r\n\x1a\n' or image[12:16] != b'IHDR':
+        raise ValueError('flag image is not a PNG')
+    return struct.unpack('>II', image[16:24])
+
@@ -0,0 +1,453 @@
+from time import perf_counter
+from collections import OrderedDict
+from qtpy.QtWidgets import QApplication, QStyleOption
+from qtpy.QtGui import QIcon, QIconEngine, QPixmap, QPainter, QImage, QColor
+from qtpy.QtCore import Qt, QSize, QRect, QObject, QRunnable, QThreadPool, Signal
+from .countries import countries
+from .flag_atlas import FlagAtlas
+from .svg_flags import SvgFlagRenderer
+from .instrumentation import get_instrumentation
+
+
+# Shared flag atlas, default flags and pixmap cache, created on first use
+_flag_atlas = None
+_default_country_flags = None
+_flag_pixmap_cache = None
+
+# Renderer of the optional SVG flags that replace the bundled flags
+_svg_flag_renderer = None
+
+# Shared loader of the flags and whether it decodes them in the background
+_flag_loader = None
+_async_flag_loading = False
+
+# Color of the placeholders shown while flags are loaded in the background
+PLACEHOLDER_COLOR = QColor(128, 128, 128, 64)
+
+# Number of pixmaps kept by the shared pixmap cache, decoded flags included
+DEFAULT_PIXMAP_CACHE_SIZE = 512
+
+
+class FlagPixmapCache:
+
+    def __init__(self, max_size: int = DEFAULT_PIXMAP_CACHE_SIZE):
+        """Create a new FlagPixmapCache instance that keeps flags scaled to
+        the exact size and device pixel ratio they are painted at and
+        evicts the least recently used pixmaps once it is full
+
+        :param max_size: maximum number of cached pixmaps
+        """
+
+        self.__max_size = max_size
+        self.__pixmaps = OrderedDict()
+
+    def getPixmap(self, country_code: str, size: QSize, device_pixel_ratio: float, mode: QIcon.Mode) -> QPixmap:
+        """Get a flag scaled to fit a size, creating and caching it if necessary
+
+        :param country_code: country code of the flag
+        :param size: logical size the flag has to fit in
+        :param device_pixel_ratio: device pixel ratio the flag is painted at
+        :param mode: mode of the icon
+        :return: scaled flag with the device pixel ratio set
+        """
+
+        key = (country_code, size.width(), size.height(), device_pixel_ratio, mode)
+        pixmap = self.__get_cached_pixmap(key)
+        instrumentation = get_instrumentation()
+        if instrumentation is not None:
+            instrumentation.increment('flags.cache_hits' if pixmap is not None else 'flags.cache_misses')
+
+        if pixmap is None:
+            device_size = QSize(round(size.width() * device_pixel_ratio), round(size.height() * device_pixel_ratio))
+            if _svg_flag_renderer is not None and _svg_flag_renderer.hasFlag(country_code):
+                # Vector flags are rasterized at exactly the requested size
+                start_time = perf_counter() if instrumentation is not None else 0
+                pixmap = QPixmap.fromImage(_svg_flag_renderer.renderFlag(country_code, device_size))
+                if instrumentation is not None:
+                    instrumentation.increment('flags.rasterized')
+                    instrumentation.recordTiming('flags.rasterize', perf_counter() - start_time)
+            else:
+                source_pixmap = self.__get_source_pixmap(country_code)
+                if source_pixmap is None:
+                    return self.__create_placeholder_pixmap(country_code, device_size, device_pixel_ratio)
+                pixmap = source_pixmap.scaled(
+                    source_pixmap.size().scaled(device_size, Qt.AspectRatioMode.KeepAspectRatio)
+                    .boundedTo(source_pixmap.size()),
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+            if mode == QIcon.Mode.Disabled and QApplication.style() is not None:
+                pixmap = QApplication.style().generatedIconPixmap(mode, pixmap, QStyleOption())
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            self.__insert_pixmap(key, pixmap)
+        return pixmap
+
+    def setSourcePixmap(self, country_code: str, pixmap: QPixmap):
+        """Cache the decoded flag the scaled pixmaps are created from
+
+        :param country_code: country code of the flag
+        :param pixmap: flag at its original size
+        """
+
+        self.__insert_pixmap((country_code,), pixmap)
+
+    def getMaxSize(self) -> int:
+        """Get the maximum number of cached pixmaps
+
+        :return: maximum number of cached pixmaps
+        """
+
+        return self.__max_size
+
+    def setMaxSize(self, max_size: int):
+        """Set the maximum number of cached pixmaps, evicting pixmaps if necessary
+
+        :param max_size: new maximum number of cached pixmaps
+        """
+
+        self.__max_size = max_size
+        self.__evict()
+
+    def clear(self):
+        """Remove all cached pixmaps"""
+
+        self.__pixmaps.clear()
+
+    def __len__(self) -> int:
+        return len(self.__pixmaps)
+
+    def __get_source_pixmap(self, country_code: str) -> QPixmap:
+        """Get the decoded flag the scaled pixmaps are created from
+
+        :param country_code: country code of the flag
+        :return: flag at its original size
+        """
+
+        key = (country_code,)
+        pixmap = self.__get_cached_pixmap(key)
+        if pixmap is None:
+            if _async_flag_loading:
+                get_flag_loader().loadFlag(country_code)
+                return None
+
+            instrumentation = get_instrumentation()
+            start_time = perf_counter() if instrumentation is not None else 0
+            pixmap = _load_flag_pixmap(country_code)
+            self.__insert_pixmap(key, pixmap)
+            if instrumentation is not None:
+                instrumentation.increment('flags.decoded')
+                instrumentation.recordTiming('flags.decode', perf_counter() - start_time)
+        return pixmap
+
+    def __create_placeholder_pixmap(self, country_code: str, device_size: QSize,
+                                    device_pixel_ratio: float) -> QPixmap:
+        """Create the placeholder shown until a flag has been loaded in the background,
+        placeholders are not cached so the flag replaces it on the next paint
+
+        :param country_code: country code of the flag
+        :param device_size: size in device pixels the flag has to fit in
+        :param device_pixel_ratio: device pixel ratio the flag is painted at
+        :return: placeholder with the size of the flag
+        """
+
+        flag_size = QSize(*get_flag_atlas().getFlagSize(country_code))
+        pixmap = QPixmap(flag_size.scaled(device_size, Qt.AspectRatioMode.KeepAspectRatio).boundedTo(flag_size))
+        pixmap.fill(PLACEHOLDER_COLOR)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
+
+    def __get_cached_pixmap(self, key: tuple) -> QPixmap:
+        """Get a cached pixmap and mark it as most recently used
+
+        :param key: key of the pixmap
+        :return: cached pixmap or None if it is not cached
+        """
+
+        pixmap = self.__pixmaps.get(key)
+        if pixmap is not None:
+            self.__pixmaps.move_to_end(key)
+        return pixmap
+
+    def __insert_pixmap(self, key: tuple, pixmap: QPixmap):
+        """Cache a pixmap as most recently used
+
+        :param key: key of the pixmap
+        :param pixmap: pixmap to cache
+        """
+
+        self.__pixmaps[key] = pixmap
+        self.__evict()
+
+    def __evict(self):
+        """Remove the least recently used pixmaps until the cache is within its maximum size"""
+
+        while len(self.__pixmaps) > self.__max_size:
+            self.__pixmaps.popitem(last=False)
+
+
+class FlagLoader(QObject):
+
+    # Signals
+    flagLoaded = Signal(str)
+    imageLoaded = Signal(str, QImage, float)
+
+    def __init__(self, parent: QObject = None):
+        """Create a new FlagLoader instance that decodes flags on its own thread pool
+        and puts them into the shared pixmap cache on the GUI thread
+
+        :param parent: parent object
+        """
+
+        super(FlagLoader, self).__init__(parent)
+
+        self.__thread_pool = QThreadPool(self)
+        self.__loading_flags = set()
+
+        # Emitted by the worker threads and received on the thread of the loader
+        self.imageLoaded.connect(self.__image_loaded)
+
+    def loadFlag(self, country_code: str):
+        """Start decoding a flag in the background unless it is already being decoded,
+        the flagLoaded signal is emitted once it is in the pixmap cache
+
+        :param country_code: country code of the flag
+        """
+
+        if country_code in self.__loading_flags:
+            return
+
+        self.__loading_flags.add(country_code)
+        self.__thread_pool.start(_FlagLoadTask(country_code, self))
+
+    def isLoading(self, country_code: str) -> bool:
+        """Get whether a flag is currently being decoded
+
+        :param country_code: country code of the flag
+        :return: whether the flag is being decoded
+        """
+
+        return country_code in self.__loading_flags
+
+    def waitForDone(self, msecs: int = -1) -> bool:
+        """Wait until all flags have been decoded, the decoded flags are
+        only put into the pixmap cache once the event loop runs again
+
+        :param msecs: maximum time to wait in milliseconds, -1 to wait without limit
+        :return: whether all flags have been decoded in time
+        """
+
+        return self.__thread_pool.waitForDone(msecs)
+
+    def __image_loaded(self, country_code: str, image: QImage, duration: float):
+        """Put a decoded flag into the pixmap cache and emit the flagLoaded signal
+
+        :param country_code: country code of the flag
+        :param image: decoded flag
+        :param duration: time it took to decode the flag in seconds, measured
+                         on the worker thread if instrumentation was turned on
+        """
+
+        self.__loading_flags.discard(country_code)
+        get_flag_pixmap_cache().setSourcePixmap(country_code, QPixmap.fromImage(image))
+
+        instrumentation = get_instrumentation()
+        if instrumentation is not None:
+            instrumentation.increment('flags.decoded')
+            if duration >= 0:
+                instrumentation.recordTiming('flags.decode', duration)
+        self.flagLoaded.emit(country_code)
+
+
+class _FlagLoadTask(QRunnable):
+
+    def __init__(self, country_code: str, flag_loader: FlagLoader):
+        """Create a new task that decodes a flag on a worker thread
+
+        :param country_code: country code of the flag
+        :param flag_loader: loader that receives the decoded flag
+        """
+
+        super(_FlagLoadTask, self).__init__()
+
+        self.__country_code = country_code
+        self.__flag_loader = flag_loader
+
+    def run(self):
+        # Timings are only recorded on the GUI thread, so the duration is passed along
+        start_time = perf_counter() if get_instrumentation() is not None else -1
+        image = _read_flag_image(self.__country_code)
+        duration = perf_counter() - start_time if start_time >= 0 else -1
+        self.__flag_loader.imageLoaded.emit(self.__country_code, image, duration)
+
+
+class CountryFlagIconEngine(QIconEngine):
+
+    def __init__(self, country_code: str, size: QSize):
+        """Create a new icon engine that only decodes the flag of
+        a country once the icon is actually painted, the pixmaps are
+        taken from the shared pixmap cache
+
+        :param country_code: country code of the flag
+        :param size: size of the flag image
+        """
+
+        super(CountryFlagIconEngine, self).__init__()
+
+        self.__country_code = country_code
+        self.__size = size
+
+    def isNull(self) -> bool:
+        return False
+
+    def actualSize(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QSize:
+        actual_size = self.__size.scaled(size, Qt.AspectRatioMode.KeepAspectRatio)
+        if _svg_flag_renderer is not None:
+            return actual_size
+        return actual_size.boundedTo(self.__size)
+
+    def pixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QPixmap:
+        # Qt asks for the size in device pixels, so no further scaling is needed
+        return get_flag_pixmap_cache().getPixmap(self.__country_code, size, 1.0, mode)
+
+    def paint(self, painter: QPainter, rect: QRect, mode: QIcon.Mode, state: QIcon.State):
+        device_pixel_ratio = painter.device().devicePixelRatioF()
+        pixmap = get_flag_pixmap_cache().getPixmap(self.__country_code, rect.size(), device_pixel_ratio, mode)
+        painter.drawPixmap(rect, pixmap)
+
+    def clone(self) -> QIconEngine:
+        return CountryFlagIconEngine(self.__country_code, self.__size)
+
+
+def get_flag_atlas() -> FlagAtlas:
+    """Get the shared atlas containing the bundled flag images
+
+    :return: shared flag atlas
+    """
+
+    global _flag_atlas
+
+    if _flag_atlas is None:
+        _flag_atlas = FlagAtlas()
+    return _flag_atlas
+
+
+def get_flag_pixmap_cache() -> FlagPixmapCache:
+    """Get the pixmap cache that is shared by all flag icons
+
+    :return: shared flag pixmap cache
+    """
+
+    global _flag_pixmap_cache
+
+    if _flag_pixmap_cache is None:
+        _flag_pixmap_cache = FlagPixmapCache()
+    return _flag_pixmap_cache
+
+
+def get_flag_loader() -> FlagLoader:
+    """Get the loader that decodes flags in the background
+
+    :return: shared flag loader
+    """
+
+    global _flag_loader
+
+    if _flag_loader is None:
+        _flag_loader = FlagLoader()
+    return _flag_loader
+
+
+def is_async_flag_loading() -> bool:
+    """Get whether flags are decoded in the background
+
+    :return: whether flags are decoded in the background
+    """
+
+    return _async_flag_loading
+
+
+def set_async_flag_loading(enabled: bool):
+    """Set whether flags are decoded on a thread pool instead of the GUI thread,
+    a placeholder is painted until a flag is decoded and only the rows of that
+    flag are updated afterwards. SVG flags are always rasterized on the GUI thread
+
+    :param enabled: whether flags should be decoded in the background
+    """
+
+    global _async_flag_loading
+
+    # The atlas has to be opened before any worker thread reads from it
+    get_flag_atlas()
+    _async_flag_loading = enabled
+
+
+def get_svg_flag_renderer() -> SvgFlagRenderer:
+    """Get the renderer of the SVG flags used instead of the bundled flags
+
+    :return: renderer of the SVG flags or None if the bundled flags are used
+    """
+
+    return _svg_flag_renderer
+
+
+def set_svg_flag_dir(svg_dir: str, cache_dir: str = None):
+    """Use SVG flags instead of the bundled flags, so flags stay sharp
+    at any icon size. Countries without an SVG flag keep the bundled flag
+
+    :param svg_dir: directory containing the flags as <code>.svg or None to use the bundled flags
+    :param cache_dir: directory to store the rasterized flags in, so later launches
+                      do not have to parse the SVG files again
+    """
+
+    global _svg_flag_renderer
+
+    if svg_dir is None:
+        _svg_flag_renderer = None
+    else:
+        _svg_flag_renderer = SvgFlagRenderer(svg_dir, cache_dir)
+    get_flag_pixmap_cache().clear()
+
+
+def get_default_country_flags() -> dict[str, QIcon]:
+    """Get the default country flag icons by country code
+
+    The icons are only created once per process and are shared between
+    all CountryPicker instances, so the returned dict must not be modified.
+    Creating the icons only reads the atlas index, each flag is only
+    decoded the first time its icon is painted
+
+    :return: shared default country flag dict
+    """
+
+    global _default_country_flags
+
+    if _default_country_flags is None:
+        flag_atlas = get_flag_atlas()
+        _default_country_flags = {
+            country_code: QIcon(CountryFlagIconEngine(country_code, QSize(*flag_atlas.getFlagSize(country_code))))
+            for country_code in countries.keys()
+        }
+    return _default_country_flags
+
+
+def _load_flag_pixmap(country_code: str) -> QPixmap:
+    """Decode a flag from the flag atlas
+
+    :param country_code: country code of the flag
+    :return: decoded flag
+    """
+
+    return QPixmap.fromImage(_read_flag_image(country_code))
+
+
+def _read_flag_image(country_code: str) -> QImage:
+    """Decode a flag from the flag atlas into an image, which unlike
+    decoding into a pixmap is safe outside of the GUI thread
+
+    :param country_code: country code of the flag
+    :return: decoded flag
+    """
+
+    image = QImage()
+    image.loadFromData(get_flag_atlas().getFlagData(country_code).tobytes(), 'PNG')
+    return image
@@ -1,3 +1,6 @@
-from PyInstaller.utils.hooks import collect_data_files
+from PyInstaller.utils.hooks import collect_data_files, collect_submodules
 
-datas = collect_data_files('pyqtcountrypicker', excludes=['hooks'])
+datas = collect_data_files('pyqtcountrypicker', excludes=['hooks', 'flags'])
+
+# The package imports its modules lazily on first attribute access
+hiddenimports = collect_submodules('pyqtcountrypicker', filter=lambda name: not name.startswith('pyqtcountrypicker.hooks'))
@@ -0,0 +1,195 @@
+import bisect
+from qtpy.QtCore import QObject, Signal
+
+
+# Active instrumentation, None while instrumentation is turned off so
+# instrumented code only has to compare a global against None
+_instrumentation = None
+
+# Upper bounds of the timing histogram buckets in seconds, the last bucket has no upper bound
+TIMING_BUCKETS = [0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0]
+
+
+class TimingHistogram:
+
+    def __init__(self, buckets: list[float] = TIMING_BUCKETS):
+        """Create a new TimingHistogram instance that counts durations
+        by bucket and keeps their count, total and maximum
+
+        :param buckets: upper bounds of the buckets in seconds
+        """
+
+        self.__buckets = buckets
+        self.__bucket_counts = [0] * (len(buckets) + 1)
+        self.__count = 0
+        self.__total = 0.0
+        self.__max = 0.0
+
+    def record(self, duration: float):
+        """Record a duration
+
+        :param duration: duration in seconds
+        """
+
+        self.__bucket_counts[bisect.bisect_left(self.__buckets, duration)] += 1
+        self.__count += 1
+        self.__total += duration
+        self.__max = max(self.__max, duration)
+
+    def getBuckets(self) -> list[tuple[float, int]]:
+        """Get the number of durations per bucket
+
+        :return: upper bound in seconds and count of every bucket, the last upper bound is infinite
+        """
+
+        return list(zip(self.__buckets + [float('inf')], self.__bucket_counts))
+
+    def getCount(self) -> int:
+        """Get the number of recorded durations
+
+        :return: number of durations
+        """
+
+        return self.__count
+
+    def getTotal(self) -> float:
+        """Get the sum of all recorded durations
+
+        :return: total duration in seconds
+        """
+
+        return self.__total
+
+    def getMean(self) -> float:
+        """Get the mean of all recorded durations
+
+        :return: mean duration in seconds
+        """
+
+        return self.__total / self.__count if self.__count > 0 else 0.0
+
+    def getMax(self) -> float:
+        """Get the longest recorded duration
+
+        :return: maximum duration in seconds
+        """
+
+        return self.__max
+
+
+class Instrumentation(QObject):
+
+    # Signals
+    counterIncremented = Signal(str, int)
+    timingRecorded = Signal(str, float)
+
+    def __init__(self, parent: QObject = None):
+        """Create a new Instrumentation instance that counts events and records
+        timings of the pickers, models and flag loading
+
+        Counters: model.resets, model.rows_inserted, model.rows_removed, model.rows_moved,
+        flags.decoded, flags.rasterized, flags.cache_hits, flags.cache_misses
+
+        Timings: model.reset, model.set_countries, model.set_country_names,
+        model.set_locale, flags.decode, flags.rasterize
+
+        :param parent: parent object
+        """
+
+        super(Instrumentation, self).__init__(parent)
+
+        self.__counters = {}
+        self.__histograms = {}
+
+    def increment(self, name: str, count: int = 1):
+        """Increment a counter and emit the counterIncremented signal
+
+        :param name: name of the counter
+        :param count: amount to increment the counter by
+        """
+
+        self.__counters[name] = self.__counters.get(name, 0) + count
+        self.counterIncremented.emit(name, count)
+
+    def recordTiming(self, name: str, duration: float):
+        """Record a duration in the histogram of a timing and emit the timingRecorded signal
+
+        :param name: name of the timing
+        :param duration: duration in seconds
+        """
+
+        histogram = self.__histograms.get(name)
+        if histogram is None:
+            histogram = self.__histograms[name] = TimingHistogram()
+        histogram.record(duration)
+        self.timingRecorded.emit(name, duration)
+
+    def getCounter(self, name: str) -> int:
+        """Get the value of a counter
+
+        :param name: name of the counter
+        :return: value of the counter, 0 if it has never been incremented
+        """
+
+        return self.__counters.get(name, 0)
+
+    def getCounters(self) -> dict[str, int]:
+        """Get the values of all counters
+
+        :return: dict containing the counter values by name
+        """
+
+        return self.__counters.copy()
+
+    def getHistogram(self, name: str) -> TimingHistogram:
+        """Get the histogram of a timing
+
+        :param name: name of the timing
+        :return: histogram of the timing or None if it has never been recorded
+        """
+
+        return self.__histograms.get(name)
+
+    def getHistograms(self) -> dict[str, TimingHistogram]:
+        """Get the histograms of all timings
+
+        :return: dict containing the histograms by timing name
+        """
+
+        return self.__histograms.copy()
+
+    def reset(self):
+        """Reset all counters and histograms"""
+
+        self.__counters = {}
+        self.__histograms = {}
+
+
+def get_instrumentation() -> Instrumentation:
+    """Get the active instrumentation
+
+    :return: active instrumentation or None if instrumentation is turned off
+    """
+
+    return _instrumentation
+
+
+def enable_instrumentation() -> Instrumentation:
+    """Turn on instrumentation, counters and histograms are kept until it is turned off
+
+    :return: active instrumentation, its signals can be connected to profilers or telemetry
+    """
+
+    global _instrumentation
+
+    if _instrumentation is None:
+        _instrumentation = Instrumentation()
+    return _instrumentation
+
+
+def disable_instrumentation():
+    """Turn off instrumentation and discard all counters and histograms"""
+
+    global _instrumentation
+
+    _instrumentation = None
@@ -0,0 +1,270 @@
+import sys
+from .countries import countries
+from .country_metadata import (country_codes, alpha3_codes, numeric_codes,
+                               dial_codes, currencies, regions)
+
+
+# Formats of the codes a country can be identified by
+CODE_FORMAT_ALPHA2 = 'alpha2'
+CODE_FORMAT_ALPHA3 = 'alpha3'
+CODE_FORMAT_NUMERIC = 'numeric'
+
+# Shared metadata store, created on first use
+_metadata_store = None
+
+
+class Country:
+
+    __slots__ = ('__code', '__name', '__alpha3_code', '__numeric_code', '__dial_code', '__currency', '__region')
+
+    def __init__(self, code: str, name: str, alpha3_code: str, numeric_code: str,
+                 dial_code: str, currency: str, region: str):
+        """Create a new Country record, the strings are interned so
+        records and lookup tables share a single copy of every value
+
+        :param code: alpha-2 country code
+        :param name: default English name
+        :param alpha3_code: ISO 3166-1 alpha-3 code, empty if there is none
+        :param numeric_code: ISO 3166-1 numeric code, empty if there is none
+        :param dial_code: international calling code without a leading plus sign
+        :param currency: ISO 4217 code of the currency
+        :param region: continent of the country
+        """
+
+        self.__code = sys.intern(code)
+        self.__name = sys.intern(name)
+        self.__alpha3_code = sys.intern(alpha3_code)
+        self.__numeric_code = sys.intern(numeric_code)
+        self.__dial_code = sys.intern(dial_code)
+        self.__currency = sys.intern(currency)
+        self.__region = sys.intern(region)
+
+    def getCode(self) -> str:
+        """Get the alpha-2 country code
+
+        :return: country code
+        """
+
+        return self.__code
+
+    def getName(self) -> str:
+        """Get the default English name of the country
+
+        :return: name of the country
+        """
+
+        return self.__name
+
+    def getAlpha3Code(self) -> str:
+        """Get the ISO 3166-1 alpha-3 code of the country
+
+        :return: alpha-3 code, empty if there is none
+        """
+
+        return self.__alpha3_code
+
+    def getNumericCode(self) -> str:
+        """Get the ISO 3166-1 numeric code of the country
+
+        :return: numeric code, empty if there is none
+        """
+
+        return self.__numeric_code
+
+    def getDialCode(self) -> str:
+        """Get the international calling code of the country
+
+        :return: calling code without a leading plus sign
+        """
+
+        return self.__dial_code
+
+    def getCurrency(self) -> str:
+        """Get the currency of the country
+
+        :return: ISO 4217 currency code
+        """
+
+        return self.__currency
+
+    def getRegion(self) -> str:
+        """Get the continent of the country
+
+        :return: Africa, Americas, Antarctica, Asia, Europe or Oceania
+        """
+
+        return self.__region
+
+    def __repr__(self) -> str:
+        return 'Country({!r}, {!r})'.format(self.__code, self.__name)
+
+
+class CountryMetadataStore:
+
+    def __init__(self):
+        """Create a new CountryMetadataStore instance that keeps the metadata of all
+        countries in columns and indexes every column for constant-time lookups"""
+
+        self.__columns = {
+            CODE_FORMAT_ALPHA2: country_codes,
+            CODE_FORMAT_ALPHA3: alpha3_codes,
+            CODE_FORMAT_NUMERIC: numeric_codes,
+            'dial_code': dial_codes,
+            'currency': currencies,
+            'region': regions
+        }
+
+        # Rows by code in every format, codes are unique across the formats and
+        # are found as they are usually written without normalizing them first
+        self.__row_by_code = {}
+        for column in [country_codes, alpha3_codes, numeric_codes]:
+            for row, code in enumerate(column):
+                if code:
+                    self.__row_by_code[code.lower()] = row
+                    self.__row_by_code[code.upper()] = row
+
+        # Country codes by the values of the columns that are shared by multiple countries
+        self.__countries_by_value = {}
+        for column_name in ['dial_code', 'currency', 'region']:
+            countries_by_value = self.__countries_by_value[column_name] = {}
+            for row, value in enumerate(self.__columns[column_name]):
+                countries_by_value.setdefault(value, []).append(country_codes[row])
+
+        # Immutable records of all countries, built once and shared by all pickers
+        self.__country_records = tuple(
+            Country(country_code, countries[country_code], *values) for country_code, *values
+            in zip(country_codes, alpha3_codes, numeric_codes, dial_codes, currencies, regions))
+
+    def getColumnNames(self) -> list[str]:
+        """Get the names of all metadata columns
+
+        :return: column names
+        """
+
+        return list(self.__columns.keys())
+
+    def findCountry(self, code: str) -> str:
+        """Find a country by its alpha-2, alpha-3 or numeric code
+
+        :param code: code of the country in any format, case-insensitive and with surrounding whitespace
+        :return: alpha-2 country code or None if no country has the code
+        """
+
+        row = self.__get_row(code)
+        if row is None:
+            return None
+        return country_codes[row]
+
+    def getCountry(self, code: str) -> Country:
+        """Get the record of a country
+
+        :param code: code of the country in any format
+        :return: shared country record or None if no country has the code
+        """
+
+        row = self.__get_row(code)
+        if row is None:
+            return None
+        return self.__country_records[row]
+
+    def getCountries(self) -> tuple[Country, ...]:
+        """Get the records of all countries
+
+        :return: shared country records in the order of the default country codes
+        """
+
+        return self.__country_records
+
+    def convertCode(self, code: str, code_format: str) -> str:
+        """Convert a country code to another format, countries without
+        a code in that format keep their alpha-2 code
+
+        :param code: code of the country in any format
+        :param code_format: format to convert the code to
+        :return: converted code or None if no country has the code
+        """
+
+        row = self.__get_row(code)
+        if row is None:
+            return None
+        return self.__columns[code_format][row] or country_codes[row]
+
+    def getValue(self, code: str, column_name: str) -> str:
+        """Get a metadata value of a country
+
+        :param code: code of the country in any format
+        :param column_name: name of the column
+        :return: value of the country, empty if it is unknown, or None if no country has the code
+        """
+
+        row = self.__get_row(code)
+        if row is None:
+            return None
+        return self.__columns[column_name][row]
+
+    def getMetadata(self, code: str) -> dict[str, str]:
+        """Get all metadata values of a country
+
+        :param code: code of the country in any format
+        :return: dict containing the values by column name or None if no country has the code
+        """
+
+        row = self.__get_row(code)
+        if row is None:
+            return None
+        return {column_name: column[row] for column_name, column in self.__columns.items()}
+
+    def getCountriesByDialCode(self, dial_code: str) -> list[str]:
+        """Get the countries sharing an international calling code
+
+        :param dial_code: calling code without a leading plus sign
+        :return: alpha-2 country codes
+        """
+
+        return list(self.__countries_by_value['dial_code'].get(dial_code.lstrip('+'), []))
+
+    def getCountriesByCurrency(self, currency: str) -> list[str]:
+        """Get the countries using a currency
+
+        :param currency: ISO 4217 currency code
+        :return: alpha-2 country codes
+        """
+
+        return list(self.__countries_by_value['currency'].get(currency.upper(), []))
+
+    def getCountriesByRegion(self, region: str) -> list[str]:
+        """Get the countries of a region
+
+        :param region: Africa, Americas, Antarctica, Asia, Europe or Oceania
+        :return: alpha-2 country codes
+        """
+
+        return list(self.__countries_by_value['region'].get(region, []))
+
+    def __get_row(self, code: str) -> int:
+        """Get the row of a country, all lookups by code normalize the code the same way
+
+        :param code: code of the country in any format, case-insensitive and with surrounding whitespace
+        :return: row of the country or None if no country has the code
+        """
+
+        if not isinstance(code, str):
+            return None
+        row = self.__row_by_code.get(code)
+        if row is None:
+            row = self.__row_by_code.get(code.strip().lower())
+        return row
+
+
+def get_metadata_store() -> CountryMetadataStore:
+    """Get the metadata store that is shared by all pickers
+
+    :return: shared metadata store
+    """
+
+    global _metadata_store
+
+    if _metadata_store is None:
+        _metadata_store = CountryMetadataStore()
+    return _metadata_store
+
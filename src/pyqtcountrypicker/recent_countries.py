@@ -0,0 +1,81 @@
+from collections import OrderedDict
+
+
+# Number of countries kept as recently selected
+DEFAULT_RECENT_COUNTRIES_SIZE = 5
+
+
+class RecentCountries:
+
+    def __init__(self, max_size: int = DEFAULT_RECENT_COUNTRIES_SIZE):
+        """Create a new RecentCountries instance that keeps the most recently
+        selected countries and forgets the least recently selected ones once
+        it is full, every update takes constant time
+
+        :param max_size: maximum number of countries
+        """
+
+        self.__max_size = max_size
+        self.__countries = OrderedDict()
+
+    def add(self, country_code: str):
+        """Mark a country as the most recently selected one
+
+        :param country_code: country code of the country
+        """
+
+        self.__countries[country_code] = None
+        self.__countries.move_to_end(country_code, last=False)
+        self.__evict()
+
+    def getCountries(self) -> list[str]:
+        """Get the recently selected countries
+
+        :return: country codes, most recently selected first
+        """
+
+        return list(self.__countries.keys())
+
+    def setCountries(self, countries: list[str]):
+        """Replace the recently selected countries
+
+        :param countries: country codes, most recently selected first
+        """
+
+        self.__countries = OrderedDict.fromkeys(countries)
+        self.__evict()
+
+    def getMaxSize(self) -> int:
+        """Get the maximum number of countries
+
+        :return: maximum number of countries
+        """
+
+        return self.__max_size
+
+    def setMaxSize(self, max_size: int):
+        """Set the maximum number of countries, forgetting the least
+        recently selected countries that no longer fit
+
+        :param max_size: new maximum number of countries
+        """
+
+        self.__max_size = max_size
+        self.__evict()
+
+    def clear(self):
+        """Forget all recently selected countries"""
+
+        self.__countries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__countries)
+
+    def __contains__(self, country_code: str) -> bool:
+        return country_code in self.__countries
+
+    def __evict(self):
+        """Remove the least recently selected countries until the maximum size is kept"""
+
+        while len(self.__countries) > self.__max_size:
+            self.__countries.popitem(last=True)
@@ -0,0 +1,156 @@
+import re
+import unicodedata
+from .countries import countries
+from .country_aliases import country_aliases
+
+
+# Shared index of the default names, created on first use
+_default_search_index = None
+
+# Ranks of the ways a query can match a country, lower is better
+RANK_EXACT = 0
+RANK_NAME_PREFIX = 1
+RANK_ALIAS_PREFIX = 2
+RANK_WORD_PREFIX = 3
+
+
+class CountrySearchIndex:
+
+    def __init__(self, country_names: dict[str, str] = countries,
+                 aliases: dict[str, list[str]] = country_aliases):
+        """Create a new CountrySearchIndex instance that finds countries by prefixes
+        of the words of their names, their country codes and their aliases
+
+        :param country_names: dict containing the country names by country code
+        :param aliases: dict containing lists of alternative names by country code
+        """
+
+        # Folded names, codes and aliases by country code
+        self.__names = {}
+        self.__codes = {}
+        self.__aliases = {country_code: [fold_text(alias) for alias in alias_list]
+                          for country_code, alias_list in aliases.items()}
+
+        # Word prefixes mapping to the codes of all countries having a word with that prefix
+        self.__countries_by_prefix = {}
+        self.__prefixes_by_country = {}
+
+        for country_code, country_name in country_names.items():
+            self.__names[country_code] = fold_text(country_name)
+            self.__codes[country_code] = fold_text(country_code)
+            self.__index_country(country_code)
+
+    def search(self, query: str, limit: int = 10) -> list[str]:
+        """Find the countries matching a query
+
+        Every word of the query has to be the prefix of a word of the name,
+        the country code or an alias of a country. Exact code and alias matches
+        are ranked first, followed by names and aliases starting with the query
+
+        :param query: text to search for
+        :param limit: maximum number of results
+        :return: country codes of the matching countries, best matches first
+        """
+
+        folded_query = fold_text(query)
+        words = folded_query.split()
+        if not words:
+            return []
+
+        # Countries that have a word starting with each of the query words
+        matches = None
+        for word in sorted(words, key=len, reverse=True):
+            countries_with_prefix = self.__countries_by_prefix.get(word)
+            if not countries_with_prefix:
+                return []
+            matches = set(countries_with_prefix) if matches is None else matches & countries_with_prefix
+
+        ranked_matches = sorted(
+            matches,
+            key=lambda country_code: (self.__get_rank(country_code, folded_query), self.__names[country_code])
+        )
+        return ranked_matches[:limit]
+
+    def setCountryName(self, country_code: str, country_name: str):
+        """Update the name of a country, only the words of that country are reindexed
+
+        :param country_code: country code of the country
+        :param country_name: new name of the country
+        """
+
+        folded_name = fold_text(country_name)
+        if country_code not in self.__names or self.__names[country_code] == folded_name:
+            return
+
+        self.__names[country_code] = folded_name
+        self.__index_country(country_code)
+
+    def setCountryNames(self, country_names: dict[str, str]):
+        """Update the names of multiple countries, only changed names are reindexed
+
+        :param country_names: dict containing the country names by country code
+        """
+
+        for country_code, country_name in country_names.items():
+            self.setCountryName(country_code, country_name)
+
+    def __get_rank(self, country_code: str, folded_query: str) -> int:
+        """Get how well a country matches a query
+
+        :param country_code: country code of the country
+        :param folded_query: folded query
+        :return: rank of the match, lower is better
+        """
+
+        aliases = self.__aliases.get(country_code, [])
+        if folded_query == self.__codes[country_code] or folded_query in aliases:
+            return RANK_EXACT
+        if self.__names[country_code].startswith(folded_query):
+            return RANK_NAME_PREFIX
+        if any(alias.startswith(folded_query) for alias in aliases):
+            return RANK_ALIAS_PREFIX
+        return RANK_WORD_PREFIX
+
+    def __index_country(self, country_code: str):
+        """Update the prefixes of a country so they match its current terms
+
+        :param country_code: country code of the country
+        """
+
+        terms = [self.__names[country_code], self.__codes[country_code]] + self.__aliases.get(country_code, [])
+        prefixes = set()
+        for term in terms:
+            for word in term.split():
+                prefixes.update(word[:length] for length in range(1, len(word) + 1))
+
+        old_prefixes = self.__prefixes_by_country.get(country_code, set())
+        for prefix in old_prefixes - prefixes:
+            self.__countries_by_prefix[prefix].discard(country_code)
+        for prefix in prefixes - old_prefixes:
+            self.__countries_by_prefix.setdefault(prefix, set()).add(country_code)
+        self.__prefixes_by_country[country_code] = prefixes
+
+
+def fold_text(text: str) -> str:
+    """Fold text for searching by removing accents, case and punctuation
+
+    :param text: text to fold
+    :return: folded text with words separated by single spaces
+    """
+
+    decomposed = unicodedata.normalize('NFKD', text)
+    without_accents = ''.join(character for character in decomposed if not unicodedata.combining(character))
+    return ' '.join(re.sub(r'[^\w]+', ' ', without_accents.casefold()).split())
+
+
+def get_default_search_index() -> CountrySearchIndex:
+    """Get the search index of the default names that is shared by all pickers
+
+    :return: shared search index
+    """
+
+    global _default_search_index
+
+    if _default_search_index is None:
+        _default_search_index = CountrySearchIndex()
+    return _default_search_index
@@ -0,0 +1,98 @@
+import os
+from qtpy.QtGui import QImage, QPainter
+from qtpy.QtCore import Qt, QSize, QRectF
+
+
+class SvgFlagRenderer:
+
+    def __init__(self, svg_dir: str, cache_dir: str = None):
+        """Create a new SvgFlagRenderer instance that rasterizes vector flags
+        at exactly the size they are requested at
+
+        :param svg_dir: directory containing the flags as <code>.svg
+        :param cache_dir: directory the rasterized flags are stored in, so later
+                          launches do not have to parse the SVG files again
+        """
+
+        self.__svg_dir = svg_dir
+        self.__cache_dir = cache_dir
+
+    def getSvgDir(self) -> str:
+        """Get the directory containing the SVG flags
+
+        :return: directory of the SVG flags
+        """
+
+        return self.__svg_dir
+
+    def getCacheDir(self) -> str:
+        """Get the directory the rasterized flags are stored in
+
+        :return: directory of the rasterized flags or None if they are not stored
+        """
+
+        return self.__cache_dir
+
+    def hasFlag(self, country_code: str) -> bool:
+        """Get whether there is an SVG flag for a country
+
+        :param country_code: country code of the flag
+        :return: whether the SVG flag exists
+        """
+
+        return os.path.exists(self.__get_svg_path(country_code))
+
+    def renderFlag(self, country_code: str, size: QSize) -> QImage:
+        """Rasterize a flag to fit a size, reading it from the
+        on-disk cache instead if it has been rasterized before
+
+        :param country_code: country code of the flag
+        :param size: size in pixels the flag has to fit in
+        :return: rasterized flag
+        """
+
+        svg_path = self.__get_svg_path(country_code)
+        cache_path = None
+        if self.__cache_dir is not None:
+            cache_path = os.path.join(self.__cache_dir, '{}-{}x{}.png'.format(country_code, size.width(), size.height()))
+            if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(svg_path):
+                image = QImage(cache_path)
+                if not image.isNull():
+                    return image
+
+        # QtSvg is only imported once an SVG flag is actually rasterized
+        from qtpy.QtSvg import QSvgRenderer
+
+        renderer = QSvgRenderer(svg_path)
+        flag_size = renderer.defaultSize().scaled(size, Qt.AspectRatioMode.KeepAspectRatio)
+        image = QImage(flag_size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        renderer.render(painter, QRectF(0, 0, flag_size.width(), flag_size.height()))
+        painter.end()
+
+        if cache_path is not None:
+            self.__store_image(image, cache_path)
+        return image
+
+    def __get_svg_path(self, country_code: str) -> str:
+        """Get the path of the SVG flag of a country
+
+        :param country_code: country code of the flag
+        :return: path of the SVG file
+        """
+
+        return os.path.join(self.__svg_dir, '{}.svg'.format(country_code))
+
+    def __store_image(self, image: QImage, cache_path: str):
+        """Store a rasterized flag in the on-disk cache, the file is replaced
+        at once so other processes never read a partially written image
+
+        :param image: rasterized flag
+        :param cache_path: path of the cached image
+        """
+
+        os.makedirs(self.__cache_dir, exist_ok=True)
+        temporary_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+        if image.save(temporary_path, 'PNG'):
+            os.replace(temporary_path, cache_path)
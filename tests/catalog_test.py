@@ -0,0 +1,55 @@
+import pytest
+from src.pyqtcountrypicker.catalog import CountryCatalog, get_country_catalog
+from src.pyqtcountrypicker.countries import countries
+from tests.import_time_test import get_import_times
+
+
+def test_catalog_import_is_qt_free():
+    """Test that the catalog can be used without importing Qt"""
+
+    import_times = get_import_times('from src.pyqtcountrypicker.catalog import get_country_catalog; '
+                                    'get_country_catalog().normalizeCodes(["DEU"])')
+    assert 'src.pyqtcountrypicker.catalog' in import_times
+    assert not any(module_name.startswith(('qtpy', 'PyQt', 'PySide', 'numpy')) for module_name in import_times)
+
+
+def test_normalize_code():
+    """Test normalizing codes in every format"""
+
+    country_catalog = get_country_catalog()
+    assert country_catalog is get_country_catalog()
+    assert country_catalog.getCountryCodes() == list(countries.keys())
+    assert country_catalog.normalizeCode('de') == 'de'
+    assert country_catalog.normalizeCode(' DEU ') == 'de'
+    assert country_catalog.normalizeCode('276') == 'de'
+    assert country_catalog.normalizeCode('SH-AC') == 'sh-ac'
+    assert country_catalog.normalizeCode('xyz') is None
+    assert country_catalog.normalizeCode(None) is None
+    assert country_catalog.isValidCode('Fra')
+    assert not country_catalog.isValidCode('')
+
+
+def test_batch():
+    """Test normalizing, validating and mapping lists of codes"""
+
+    country_catalog = CountryCatalog()
+    codes = ['de', 'FRA', '840', 'xyz']
+    assert country_catalog.normalizeCodes(codes) == ['de', 'fr', 'us', None]
+    assert country_catalog.validateCodes(codes) == [True, True, True, False]
+    assert country_catalog.mapCodes(codes, 'alpha3') == ['DEU', 'FRA', 'USA', None]
+    assert country_catalog.mapCodes(codes, 'numeric') == ['276', '250', '840', None]
+    assert country_catalog.mapCodes(codes, 'currency') == ['EUR', 'EUR', 'USD', None]
+    assert country_catalog.mapCodes(['sh-ac'], 'alpha3') == ['sh-ac']
+
+
+def test_batch_numpy():
+    """Test normalizing, validating and mapping NumPy arrays of codes"""
+
+    numpy = pytest.importorskip('numpy')
+
+    country_catalog = CountryCatalog()
+    codes = numpy.array([['de', 'FRA'], ['840', 'xyz']])
+    assert country_catalog.normalizeCodes(codes).tolist() == [['de', 'fr'], ['us', '']]
+    assert country_catalog.validateCodes(codes).tolist() == [[True, True], [True, False]]
+    assert country_catalog.mapCodes(codes, 'region').tolist() == [['Europe', 'Europe'], ['Americas', '']]
+    assert country_catalog.normalizeCodes(numpy.array([], dtype=str)).tolist() == []
@@ -0,0 +1,27 @@
+from PyQt6.QtCore import QLocale
+from src.pyqtcountrypicker.collation import get_name_collation
+
+
+def test_shared_name_collation():
+    """Test that collations and their keys are shared"""
+
+    name_collation = get_name_collation(QLocale('en_US'))
+    assert name_collation is get_name_collation(QLocale('en_US'))
+    assert name_collation.getSortKey('Réunion') is name_collation.getSortKey('Réunion')
+    assert name_collation.getLocale().name() == 'en_US'
+
+
+def test_c_locale_collation():
+    """Test that the C locale falls back to English collation"""
+
+    assert get_name_collation(QLocale.c()).getLocale().name() == 'en_US'
+
+
+def test_locale_aware_order():
+    """Test that accented names are sorted like their unaccented forms"""
+
+    name_collation = get_name_collation(QLocale('en_US'))
+    names = ['Rwanda', 'Romania', 'Réunion', 'Russia', 'Côte d\'Ivoire', 'Croatia', 'Curaçao', 'Cuba']
+    assert sorted(names, key=name_collation.getSortKey) == [
+        'Côte d\'Ivoire', 'Croatia', 'Cuba', 'Curaçao', 'Réunion', 'Romania', 'Russia', 'Rwanda'
+    ]
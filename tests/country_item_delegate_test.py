@@ -0,0 +1,70 @@
+from PyQt6.QtWidgets import QTableView, QStyleOptionViewItem
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
+from PyQt6.QtCore import QLocale
+from src.pyqtcountrypicker import CountryPicker
+from src.pyqtcountrypicker.country_item_delegate import CountryItemDelegate
+
+
+def create_table_view(qtbot, country_codes: list[str]) -> tuple[QTableView, CountryItemDelegate]:
+    """Create a table view showing country codes through a country item delegate
+
+    :param qtbot: qtbot fixture
+    :param country_codes: country codes of the rows
+    :return: table view and delegate
+    """
+
+    model = QStandardItemModel()
+    for country_code in country_codes:
+        model.appendRow(QStandardItem(country_code))
+
+    table_view = QTableView()
+    table_view.setModel(model)
+    qtbot.addWidget(table_view)
+    country_item_delegate = CountryItemDelegate(table_view)
+    table_view.setItemDelegate(country_item_delegate)
+    return table_view, country_item_delegate
+
+
+def get_style_option(country_item_delegate: CountryItemDelegate, index) -> QStyleOptionViewItem:
+    option = QStyleOptionViewItem()
+    country_item_delegate.initStyleOption(option, index)
+    return option
+
+
+def test_style_option(qtbot):
+    """Test that the items show the name and flag of their country"""
+
+    table_view, country_item_delegate = create_table_view(qtbot, ['de', 'FRA', '840', 'xyz'])
+    model = table_view.model()
+
+    option = get_style_option(country_item_delegate, model.index(0, 0))
+    assert option.text == 'Germany'
+    assert not option.icon.isNull()
+    assert get_style_option(country_item_delegate, model.index(1, 0)).text == 'France'
+    assert get_style_option(country_item_delegate, model.index(2, 0)).text == 'United States'
+    assert get_style_option(country_item_delegate, model.index(3, 0)).text == 'xyz'
+
+    country_item_delegate.setLocale(QLocale('de_DE'))
+    country_item_delegate.setCountryFlagsEnabled(False)
+    option = get_style_option(country_item_delegate, model.index(0, 0))
+    assert option.text == 'Deutschland'
+    assert option.icon.isNull()
+
+
+def test_editor(qtbot):
+    """Test editing an item with a country picker"""
+
+    table_view, country_item_delegate = create_table_view(qtbot, ['de'])
+    model = table_view.model()
+    country_item_delegate.setCountryCodeFormat('alpha3')
+
+    table_view.show()
+    table_view.edit(model.index(0, 0))
+    editor = table_view.indexWidget(model.index(0, 0))
+    assert isinstance(editor, CountryPicker)
+    assert editor.getCurrentCountry() == 'DEU'
+    assert model.index(0, 0).data() == 'de'
+
+    editor.setCurrentCountry('fr')
+    country_item_delegate.setModelData(editor, model, model.index(0, 0))
+    assert model.index(0, 0).data() == 'FRA'
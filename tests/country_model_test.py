@@ -0,0 +1,287 @@
+from PyQt6.QtCore import Qt, QLocale
+from PyQt6.QtGui import QIcon
+from src.pyqtcountrypicker.country_model import CountryModel, get_country_source_model
+from src.pyqtcountrypicker.countries import countries
+
+
+def test_model(qtmodeltester):
+    """Test the country model with the Qt model tester"""
+
+    country_model = CountryModel()
+    qtmodeltester.check(country_model)
+
+    country_model.setCountries(['de', 'us', 'fr'])
+    country_model.setCountryName('us', 'America')
+    country_model.setCountryFlagsEnabled(False)
+    qtmodeltester.check(country_model)
+
+
+def test_data(qtbot):
+    """Test the data of the rows"""
+
+    country_model = CountryModel()
+
+    assert country_model.rowCount() == len(countries)
+    index = country_model.index(country_model.getCountryRow('de'))
+    assert index.data(Qt.ItemDataRole.DisplayRole) == 'Germany'
+    assert index.data(Qt.ItemDataRole.UserRole) == 'de'
+    assert not index.data(Qt.ItemDataRole.DecorationRole).isNull()
+
+    country_model.setCountryFlagsEnabled(False)
+    assert index.data(Qt.ItemDataRole.DecorationRole) is None
+
+
+def test_set_countries_signals(qtbot):
+    """Test that changing the countries only inserts and removes rows"""
+
+    country_model = CountryModel()
+    country_model.setCountries(['de', 'fr', 'us'])
+
+    removed_rows = []
+    inserted_rows = []
+    country_model.rowsRemoved.connect(lambda parent, first, last: removed_rows.append((first, last)))
+    country_model.rowsInserted.connect(lambda parent, first, last: inserted_rows.append((first, last)))
+    country_model.modelReset.connect(lambda: inserted_rows.append('reset'))
+
+    country_model.setCountries(['at', 'de', 'us'])
+    assert removed_rows == [(0, 0)]
+    assert inserted_rows == [(0, 0)]
+    assert [country_model.index(row).data(Qt.ItemDataRole.UserRole) for row in range(3)] == ['at', 'de', 'us']
+
+
+def test_set_country_flag_signals(qtbot):
+    """Test that changing a flag only changes the affected row"""
+
+    country_model = CountryModel()
+    row = country_model.getCountryRow('de')
+
+    with qtbot.waitSignal(country_model.dataChanged) as blocker:
+        country_model.setCountryFlag('de', QIcon())
+    assert blocker.args[0].row() == row
+    assert blocker.args[1].row() == row
+
+
+def test_shared_source_model(qtbot):
+    """Test that all country models share one source model"""
+
+    country_model_1 = CountryModel()
+    country_model_2 = CountryModel()
+    assert country_model_1.sourceModel() is get_country_source_model()
+    assert country_model_2.sourceModel() is get_country_source_model()
+
+    # Names and available countries are kept per model
+    country_model_1.setCountries(['de', 'fr'])
+    country_model_1.setCountryName('de', 'Deutschland')
+    assert country_model_1.rowCount() == 2
+    assert country_model_2.rowCount() == len(countries)
+    assert country_model_1.getCountryName('de') == 'Deutschland'
+    assert country_model_2.getCountryName('de') == 'Germany'
+    assert get_country_source_model().getCountryCode(get_country_source_model().getCountryRow('de')) == 'de'
+
+    # Changes of the source model are forwarded to the mapped rows only
+    source_model = get_country_source_model()
+    source_index = source_model.index(source_model.getCountryRow('de'))
+    assert country_model_1.mapToSource(country_model_1.mapFromSource(source_index)) == source_index
+    with qtbot.waitSignal(country_model_1.dataChanged) as blocker:
+        source_model.dataChanged.emit(source_index, source_index, [Qt.ItemDataRole.DecorationRole])
+    assert blocker.args[0] == country_model_1.mapFromSource(source_index)
+
+
+def test_shared_default_rows(qtbot):
+    """Test that models sharing the default rows are changed independently"""
+
+    country_model_1 = CountryModel()
+    country_model_2 = CountryModel()
+
+    country_model_1.setCountryName('af', 'Zzz')
+    assert country_model_1.index(country_model_1.rowCount() - 1).data() == 'Zzz'
+    assert country_model_2.index(0).data() == 'Afghanistan'
+    assert country_model_2.getCountryRow('af') == 0
+
+    country_model_2.setCountries(['de'])
+    assert country_model_1.rowCount() == len(countries)
+    assert country_model_2.getCountries() == ['de']
+    assert CountryModel().getCountries() == list(countries.keys())
+
+
+def test_pinned_countries(qtbot):
+    """Test that pinned rows are shown above a separator and updated without a reset"""
+
+    country_model = CountryModel()
+    country_model.setCountries(['de', 'fr', 'it', 'us'])
+
+    model_signals = []
+    country_model.modelReset.connect(lambda: model_signals.append('reset'))
+    country_model.rowsInserted.connect(lambda parent, first, last: model_signals.append(('inserted', first, last)))
+    country_model.rowsRemoved.connect(lambda parent, first, last: model_signals.append(('removed', first, last)))
+    country_model.rowsMoved.connect(lambda *args: model_signals.append(('moved', args[1], args[4])))
+
+    country_model.setPinnedCountries(['it', 'de'])
+    assert model_signals == [('inserted', 0, 2)]
+    assert [country_model.index(row).data() for row in range(country_model.rowCount())] == \
+        ['Italy', 'Germany', None, 'France', 'Germany', 'Italy', 'United States']
+    assert country_model.index(2).data(Qt.ItemDataRole.AccessibleDescriptionRole) == 'separator'
+    assert country_model.flags(country_model.index(2)) == Qt.ItemFlag.NoItemFlags
+    assert country_model.index(0).data(Qt.ItemDataRole.UserRole) == 'it'
+    assert country_model.getCountryRow('de') == 4
+
+    model_signals.clear()
+    country_model.setPinnedCountries(['de', 'it'])
+    assert model_signals == [('moved', 1, 0)]
+    assert country_model.index(0).data() == 'Germany'
+
+    model_signals.clear()
+    country_model.setPinnedCountries(['us', 'de'])
+    assert model_signals == [('removed', 1, 1), ('inserted', 0, 0)]
+    assert country_model.getPinnedCountries() == ['us', 'de']
+
+    # Unavailable countries are not pinned
+    model_signals.clear()
+    country_model.setCountries(['de', 'fr', 'it'])
+    assert 'reset' not in model_signals
+    assert country_model.index(0).data() == 'Germany'
+    assert country_model.getCountryRow('de') == 3
+
+    country_model.setPinnedCountries([])
+    assert country_model.rowCount() == 3
+    assert country_model.getCountryRow('de') == 1
+
+
+def test_pinned_countries_model(qtmodeltester):
+    """Test the pinned rows with the model tester"""
+
+    country_model = CountryModel()
+    country_model.setPinnedCountries(['de', 'fr'])
+    qtmodeltester.check(country_model)
+
+
+def test_set_countries_incremental(qtbot):
+    """Test that only the rows of added and removed countries change"""
+
+    country_model = CountryModel()
+    country_model.setCountries(['de', 'fr', 'us', 'it'])
+
+    removed_rows = []
+    inserted_rows = []
+    country_model.rowsRemoved.connect(lambda parent, first, last: removed_rows.append((first, last)))
+    country_model.rowsInserted.connect(lambda parent, first, last: inserted_rows.append((first, last)))
+
+    # France, Germany, Italy, United States -> Austria, Belgium, Germany, Spain, United States
+    country_model.setCountries(['US', 'de', 'at', 'es', 'be'])
+    assert removed_rows == [(2, 2), (0, 0)]
+    assert inserted_rows == [(1, 1), (0, 1)]
+    rows = [country_model.index(row).data(Qt.ItemDataRole.UserRole) for row in range(country_model.rowCount())]
+    assert rows == ['at', 'be', 'de', 'es', 'us']
+
+    # Setting the same countries again does not change any rows
+    country_model.setCountries(['at', 'be', 'de', 'es', 'us', 'invalid'])
+    assert len(removed_rows) == 2
+    assert len(inserted_rows) == 2
+
+
+def test_set_country_name_moves_single_row(qtbot):
+    """Test that renaming a country only moves its row"""
+
+    country_model = CountryModel()
+    country_model.setCountries(['de', 'fr', 'us', 'it'])
+
+    moved_rows = []
+    country_model.rowsMoved.connect(lambda parent, start, end, destination, row: moved_rows.append((start, row)))
+    country_model.layoutChanged.connect(lambda: moved_rows.append('layout'))
+
+    # France, Germany, Italy, United States -> France, Italy, United States, Zermany
+    country_model.setCountryName('de', 'Zermany')
+    assert moved_rows == [(1, 4)]
+    rows = [country_model.index(row).data(Qt.ItemDataRole.UserRole) for row in range(country_model.rowCount())]
+    assert rows == ['fr', 'it', 'us', 'de']
+
+    # Renaming without changing the position does not move the row
+    with qtbot.waitSignal(country_model.dataChanged) as blocker:
+        country_model.setCountryName('us', 'USA')
+    assert blocker.args[0].row() == 2
+    assert moved_rows == [(1, 4)]
+
+    # Resetting moves only the renamed rows back
+    country_model.setCountryNames({'fr': 'Afrance', 'it': 'Italy'})
+    country_model.resetCountryNames()
+    rows = [country_model.index(row).data(Qt.ItemDataRole.UserRole) for row in range(country_model.rowCount())]
+    assert rows == ['fr', 'de', 'it', 'us']
+    assert 'layout' not in moved_rows
+
+
+def test_set_same_country_flag(qtbot):
+    """Test that setting an unchanged flag does not change any rows"""
+
+    country_model = CountryModel()
+    changed_rows = []
+    country_model.dataChanged.connect(lambda top_left, bottom_right, roles: changed_rows.append(top_left.row()))
+
+    country_model.setCountryFlags({'de': country_model.getCountryFlag('de'), 'fr': QIcon()})
+    assert changed_rows == [country_model.getCountryRow('fr')]
+
+
+def test_country_row_index(qtbot):
+    """Test that the row of every country stays correct through all changes"""
+
+    country_model = CountryModel()
+
+    def assert_row_index():
+        for row in range(country_model.rowCount()):
+            assert country_model.getCountryRow(country_model.index(row).data(Qt.ItemDataRole.UserRole)) == row
+
+    assert_row_index()
+    country_model.setCountries(['de', 'fr', 'us', 'it', 'gb', 'es'])
+    assert_row_index()
+    country_model.setCountryNames({'de': 'Zermany', 'us': 'America', 'es': 'Spain'})
+    assert_row_index()
+    country_model.setCountries(['de', 'us', 'at', 'be', 'nl'])
+    assert_row_index()
+    country_model.resetCountryNames()
+    assert_row_index()
+    assert country_model.getCountryRow('fr') == -1
+    assert country_model.getCountryRow('invalid') == -1
+    assert country_model.getCountryRow('DE') == country_model.getCountryRow('de')
+
+
+def test_locale_aware_sorting(qtbot):
+    """Test that the rows are sorted locale-aware, also after renaming"""
+
+    country_model = CountryModel()
+    country_model.setCountries(['ro', 're', 'rw', 'ru'])
+
+    rows = [country_model.index(row).data(Qt.ItemDataRole.UserRole) for row in range(country_model.rowCount())]
+    assert rows == ['re', 'ro', 'ru', 'rw']
+
+    country_model.setCountryName('rw', 'Ŕwanda')
+    country_model.setCountries(['ro', 're', 'rw', 'ru', 'ae'])
+    rows = [country_model.index(row).data(Qt.ItemDataRole.UserRole) for row in range(country_model.rowCount())]
+    assert rows == ['re', 'ro', 'ru', 'rw', 'ae']
+
+
+def test_set_locale(qtbot):
+    """Test switching the names and order to a locale in a single update"""
+
+    country_model = CountryModel()
+    country_model.setCountries(['de', 'fr', 'at', 'ch'])
+    country_model.setCountryName('ch', 'Confoederatio Helvetica')
+
+    model_signals = []
+    country_model.modelReset.connect(lambda: model_signals.append('reset'))
+    country_model.dataChanged.connect(lambda *args: model_signals.append('changed'))
+    country_model.rowsMoved.connect(lambda *args: model_signals.append('moved'))
+
+    country_model.setLocale(QLocale('de_DE'))
+    assert model_signals == ['reset']
+    assert country_model.getLocale().name() == 'de_DE'
+    assert [country_model.index(row).data() for row in range(country_model.rowCount())] == [
+        'Confoederatio Helvetica', 'Deutschland', 'Frankreich', 'Österreich'
+    ]
+    assert country_model.getCountryName('ch') == 'Confoederatio Helvetica'
+
+    country_model.resetCountryNames()
+    assert country_model.getCountryName('ch') == 'Schweiz'
+    assert country_model.hasCustomCountryNames()
+
+    country_model.setLocale(QLocale('en_US'))
+    assert country_model.getCountryNames() == countries
+    assert not country_model.hasCustomCountryNames()
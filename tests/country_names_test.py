@@ -0,0 +1,42 @@
+from PyQt6.QtCore import QLocale
+from src.pyqtcountrypicker.country_names import NameTables, build_name_tables, get_name_tables, get_country_names
+from src.pyqtcountrypicker.countries import countries
+
+
+def test_bundled_name_tables():
+    """Test that the bundled tables contain the names of every country"""
+
+    name_tables = get_name_tables()
+    assert 'de' in name_tables
+    assert 'en' not in name_tables
+    assert len(name_tables.getLocales()) >= 40
+
+    country_names = get_country_names(QLocale('de_DE'))
+    assert list(country_names.keys()) == list(countries.keys())
+    assert country_names['de'] == 'Deutschland'
+    assert country_names['us'] == 'Vereinigte Staaten'
+
+
+def test_locale_fallback():
+    """Test falling back to the language table and to the default names"""
+
+    assert get_country_names(QLocale('de_AT')) is get_country_names(QLocale('de_DE'))
+    assert get_country_names(QLocale('zh_TW'))['de'] == '德國'
+    assert get_country_names(QLocale('zh_CN'))['de'] == '德国'
+    assert get_country_names(QLocale('en_GB')) is countries
+    assert get_country_names(QLocale.c()) is countries
+
+
+def test_build_name_tables(tmp_path):
+    """Test building and reading name tables"""
+
+    tables_path = str(tmp_path / 'test.tables')
+    build_name_tables(['de', 'fr', 'sh-ac'], {
+        'de': {'de': 'Deutschland', 'fr': 'Frankreich'},
+        'fr': {'de': 'Allemagne', 'sh-ac': 'Île de l\'Ascension'}
+    }, tables_path)
+
+    name_tables = NameTables(tables_path)
+    assert name_tables.getLocales() == ['de', 'fr']
+    assert name_tables.getCountryNames('de') == {'de': 'Deutschland', 'fr': 'Frankreich'}
+    assert name_tables.getCountryNames('fr') == {'de': 'Allemagne', 'sh-ac': 'Île de l\'Ascension'}
@@ -1,4 +1,6 @@
-from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import QLineEdit, QListView, QStyleOptionViewItem
+from PyQt6.QtGui import QIcon, QImage, QColor, QPainter
+from PyQt6.QtCore import Qt, QModelIndex, QLocale, QSettings
 from src.pyqtcountrypicker import CountryPicker
 from src.pyqtcountrypicker.countries import countries
 
@@ -164,3 +166,422 @@ def test_invalid_country_codes(qtbot):
     country_picker.setCountryFlags({'abcd': QIcon()})
     assert country_flags == country_picker.getCountryFlags()
     assert country_picker.getCountryFlag('invalid').isNull()
+
+
+def test_shared_default_country_flags(qtbot):
+    """Test that the default country flags are shared between instances"""
+
+    country_picker_1 = CountryPicker()
+    country_picker_2 = CountryPicker()
+    qtbot.addWidget(country_picker_1)
+    qtbot.addWidget(country_picker_2)
+
+    assert country_picker_1.getCountryFlag('de') is country_picker_2.getCountryFlag('de')
+
+    # Overriding a flag must not affect other instances
+    new_icon = QIcon()
+    country_picker_1.setCountryFlag('de', new_icon)
+    assert country_picker_1.getCountryFlag('de') == new_icon
+    assert country_picker_2.getCountryFlag('de') is not new_icon
+    assert not country_picker_2.getCountryFlag('de').isNull()
+
+    # Resetting must restore the shared flag
+    country_picker_1.resetCountryFlags()
+    assert country_picker_1.getCountryFlag('de') is country_picker_2.getCountryFlag('de')
+
+
+def test_set_countries_keeps_selection(qtbot):
+    """Test that changing the available countries keeps the current country"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    country_picker.setCurrentCountry('de')
+
+    changed_countries = []
+    country_picker.countryChanged.connect(changed_countries.append)
+
+    country_picker.setCountries(['at', 'de', 'fr'])
+    country_picker.setCountries(['de', 'us', 'ro'])
+    assert country_picker.getCurrentCountry() == 'de'
+    assert country_picker.currentData() == 'de'
+    assert changed_countries == []
+
+    # Removing the current country selects the first country
+    country_picker.setCountries(['us', 'ro'])
+    assert country_picker.getCurrentCountry() == 'ro'
+    assert country_picker.currentData() == 'ro'
+    assert changed_countries == ['ro']
+
+
+def test_set_country_name_keeps_selection(qtbot):
+    """Test that renaming countries keeps the current country"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    country_picker.setCurrentCountry('de')
+
+    changed_countries = []
+    country_picker.countryChanged.connect(changed_countries.append)
+
+    country_picker.setCountryName('de', 'Zermany')
+    country_picker.setCountryName('af', 'Zafghanistan')
+    assert country_picker.currentData() == 'de'
+    assert country_picker.currentText() == 'Zermany'
+    assert country_picker.getCurrentCountry() == 'de'
+    assert changed_countries == []
+
+
+def test_set_current_country_duplicate_names(qtbot):
+    """Test selecting countries that have the same name"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+
+    country_picker.setCountryNames({'cg': 'Congo', 'cd': 'Congo'})
+    country_picker.setCurrentCountry('cd')
+    assert country_picker.currentData() == 'cd'
+    assert country_picker.getCurrentCountry() == 'cd'
+    country_picker.setCurrentCountry('cg')
+    assert country_picker.currentData() == 'cg'
+    assert country_picker.getCurrentCountry() == 'cg'
+
+
+def test_batch_update(qtbot):
+    """Test that a batch update applies all changes at once"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    country_model = country_picker.model()
+
+    model_signals = []
+    country_model.modelReset.connect(lambda: model_signals.append('reset'))
+    country_model.rowsInserted.connect(lambda *args: model_signals.append('inserted'))
+    country_model.rowsRemoved.connect(lambda *args: model_signals.append('removed'))
+    country_model.rowsMoved.connect(lambda *args: model_signals.append('moved'))
+    country_model.dataChanged.connect(lambda *args: model_signals.append('changed'))
+    changed_countries = []
+    country_picker.countryChanged.connect(changed_countries.append)
+
+    with country_picker.batchUpdate():
+        country_picker.setCountries(['de', 'us', 'fr'])
+        country_picker.setCountryNames({'us': 'America', 'de': 'Deutschland'})
+        country_picker.setCountryFlags({'fr': QIcon()})
+        country_picker.setCountryFlagsEnabled(False)
+        country_picker.setCurrentCountry('fr')
+        country_picker.setCurrentCountry('us')
+        assert model_signals == []
+        assert changed_countries == []
+
+    assert model_signals == ['reset']
+    assert changed_countries == ['us']
+    assert country_picker.getCurrentCountry() == 'us'
+    assert country_picker.currentData() == 'us'
+    assert [country_picker.itemText(i) for i in range(country_picker.count())] == ['America', 'Deutschland', 'France']
+    assert country_picker.itemIcon(0).isNull()
+
+
+def test_batch_update_without_row_changes(qtbot):
+    """Test that a batch update that keeps the rows only changes data"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    country_picker.setCurrentCountry('de')
+
+    model_signals = []
+    country_picker.model().modelReset.connect(lambda: model_signals.append('reset'))
+    country_picker.model().dataChanged.connect(lambda *args: model_signals.append('changed'))
+    changed_countries = []
+    country_picker.countryChanged.connect(changed_countries.append)
+
+    country_picker.beginUpdate()
+    country_picker.setCountryFlagsEnabled(False)
+    country_picker.setCountryName('de', 'Germany (DE)')
+    country_picker.setCurrentCountry('invalid')
+    country_picker.endUpdate()
+
+    assert model_signals == ['changed']
+    assert changed_countries == []
+    assert country_picker.currentText() == 'Germany (DE)'
+
+
+def test_find_countries(qtbot):
+    """Test finding the available countries by name, code and alias"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+
+    assert country_picker.findCountries('usa') == ['us']
+    assert country_picker.findCountries('Germ') == ['de']
+
+    country_picker.setCountryName('fr', 'Frankreich')
+    assert country_picker.findCountries('france') == []
+    assert country_picker.findCountries('frank') == ['fr']
+
+    country_picker.setCountries(['de', 'fr'])
+    assert country_picker.findCountries('usa') == []
+    assert country_picker.findCountries('deutsch') == ['de']
+
+    country_picker.resetCountryNames()
+    assert country_picker.findCountries('france') == ['fr']
+
+
+def test_search(qtbot):
+    """Test selecting a country by typing into the picker"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    country_picker.setSearchEnabled(True)
+    assert country_picker.isSearchEnabled()
+    assert country_picker.isEditable()
+
+    changed_countries = []
+    country_picker.countryChanged.connect(changed_countries.append)
+
+    country_picker.lineEdit().setFocus()
+    country_picker.lineEdit().clear()
+    qtbot.keyClicks(country_picker.lineEdit(), 'deutsch')
+    results = country_picker.completer().model()
+    assert results.rowCount() == 1
+    assert results.index(0, 0).data() == 'Germany'
+
+    country_picker.completer().activated[QModelIndex].emit(results.index(0, 0))
+    assert country_picker.getCurrentCountry() == 'de'
+    assert country_picker.lineEdit().text() == 'Germany'
+    assert changed_countries == ['de']
+    assert country_picker.count() == len(countries)
+
+    country_picker.setSearchEnabled(False)
+    assert not country_picker.isEditable()
+
+
+def test_search_editing_finished(qtbot):
+    """Test that the name of the current country is shown again after searching"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    country_picker.setSearchEnabled(True)
+    country_picker.setCurrentCountry('de')
+
+    country_picker.lineEdit().clear()
+    qtbot.keyClicks(country_picker.lineEdit(), 'xyz')
+    country_picker.lineEdit().editingFinished.emit()
+    assert country_picker.lineEdit().text() == 'Germany'
+    assert country_picker.getCurrentCountry() == 'de'
+
+
+def test_set_locale(qtbot):
+    """Test that switching the locale keeps the selection and translates the search"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    country_picker.setCurrentCountry('de')
+
+    changed_countries = []
+    country_picker.countryChanged.connect(changed_countries.append)
+
+    country_picker.setLocale(QLocale('fr_FR'))
+    assert country_picker.locale().name() == 'fr_FR'
+    assert country_picker.getCurrentCountry() == 'de'
+    assert country_picker.currentText() == 'Allemagne'
+    assert changed_countries == []
+    assert country_picker.findCountries('allem') == ['de']
+    assert country_picker.findCountries('usa') == ['us']
+
+
+def test_country_code_formats(qtbot):
+    """Test passing and returning country codes in every format"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+
+    changed_countries = []
+    country_picker.countryChanged.connect(changed_countries.append)
+
+    country_picker.setCountries(['DEU', '250', 'us'])
+    assert country_picker.getCountries() == ['de', 'fr', 'us']
+
+    country_picker.setCurrentCountry('DEU')
+    assert country_picker.getCurrentCountry() == 'de'
+    assert country_picker.getCountryName('276') == 'Germany'
+
+    country_picker.setCountryCodeFormat('alpha3')
+    assert country_picker.getCountryCodeFormat() == 'alpha3'
+    assert country_picker.getCurrentCountry() == 'DEU'
+    assert country_picker.getCountries() == ['DEU', 'FRA', 'USA']
+    assert country_picker.findCountries('usa') == ['USA']
+
+    country_picker.setCountryCodeFormat('numeric')
+    country_picker.setCountryName('FRA', 'Frankreich')
+    assert country_picker.getCountryNames()['250'] == 'Frankreich'
+    country_picker.setCurrentCountry('us')
+    assert country_picker.getCurrentCountry() == '840'
+    assert changed_countries == ['fr', 'de', '840']
+
+
+def test_phone_mode(qtbot):
+    """Test selecting the country of a phone number while it is typed"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    phone_number_edit = QLineEdit()
+    qtbot.addWidget(phone_number_edit)
+
+    country_picker.setPhoneModeEnabled(True)
+    assert country_picker.isPhoneModeEnabled()
+    country_picker.setCurrentCountry('de')
+    assert country_picker.currentText() == 'Germany (+49)'
+
+    country_picker.setPhoneNumberEdit(phone_number_edit)
+    assert country_picker.getPhoneNumberEdit() == phone_number_edit
+    qtbot.keyClicks(phone_number_edit, '+1')
+    assert country_picker.getCurrentCountry() == 'us'
+    qtbot.keyClicks(phone_number_edit, '204')
+    assert country_picker.getCurrentCountry() == 'ca'
+    qtbot.keyClicks(phone_number_edit, '5')
+    assert country_picker.getCurrentCountry() == 'ca'
+
+    # The current country is kept while the prefix is shared with it
+    phone_number_edit.clear()
+    qtbot.keyClicks(phone_number_edit, '+1')
+    assert country_picker.getCurrentCountry() == 'ca'
+
+    country_picker.setCountries(['de', 'fr'])
+    assert not country_picker.selectCountryByPhoneNumber('+1 204')
+    assert country_picker.selectCountryByPhoneNumber('+33')
+    assert country_picker.getCurrentCountry() == 'fr'
+
+    country_picker.setPhoneNumberEdit(None)
+    qtbot.keyClicks(phone_number_edit, '+49')
+    assert country_picker.getCurrentCountry() == 'fr'
+
+    country_picker.setPhoneModeEnabled(False)
+    assert country_picker.currentText() == 'France'
+
+
+def test_popup_view(qtbot):
+    """Test that the dropdown keeps the default view with uniform row sizes"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    country_picker.show()
+
+    view = country_picker.view()
+    assert view.uniformItemSizes()
+    assert view.layoutMode() == QListView.LayoutMode.Batched
+    assert view.itemDelegate() is country_picker.itemDelegate()
+
+    country_picker.showPopup()
+    assert view.isVisible()
+    country_picker.hidePopup()
+
+
+def test_popup_separator(qtbot):
+    """Test that the separator below the recently selected countries is drawn as a line"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    country_picker.setRecentCountriesEnabled(True)
+    country_picker.setRecentCountries(['de'])
+    assert country_picker.model().index(1, 0).data(Qt.ItemDataRole.AccessibleDescriptionRole) == 'separator'
+
+    # The separator row only contains a line, so its middle column has more than the background color
+    image = QImage(200, 20, QImage.Format.Format_ARGB32)
+    image.fill(QColor('white'))
+    option = QStyleOptionViewItem()
+    option.initFrom(country_picker.view())
+    option.rect = image.rect()
+    painter = QPainter(image)
+    country_picker.view().itemDelegate().paint(painter, option, country_picker.model().index(1, 0))
+    painter.end()
+    assert len({image.pixel(100, y) for y in range(image.height())}) > 1
+
+
+def test_recent_countries(qtbot, tmp_path):
+    """Test pinning the recently selected countries and storing them in the settings"""
+
+    settings = QSettings(str(tmp_path / 'settings.ini'), QSettings.Format.IniFormat)
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    country_picker.setRecentCountriesSettings(settings)
+    country_picker.setRecentCountriesLimit(2)
+    country_picker.setRecentCountriesEnabled(True)
+    assert country_picker.isRecentCountriesEnabled()
+
+    changed_countries = []
+    country_picker.countryChanged.connect(changed_countries.append)
+
+    country_picker.setCurrentCountry('de')
+    country_picker.setCurrentCountry('fr')
+    country_picker.setCurrentCountry('it')
+    assert country_picker.getRecentCountries() == ['it', 'fr']
+    assert [country_picker.itemText(row) for row in range(3)] == ['Italy', 'France', '']
+    assert settings.value('recentCountries') == 'it,fr'
+
+    # Picking a pinned country moves it to the top
+    country_picker.setCurrentIndex(1)
+    assert country_picker.getCurrentCountry() == 'fr'
+    assert country_picker.getRecentCountries() == ['fr', 'it']
+    assert country_picker.currentText() == 'France'
+    assert changed_countries == ['de', 'fr', 'it', 'fr']
+
+    # Recent countries are restored from the settings
+    other_country_picker = CountryPicker()
+    qtbot.addWidget(other_country_picker)
+    other_country_picker.setRecentCountriesSettings(settings)
+    other_country_picker.setRecentCountriesEnabled(True)
+    assert other_country_picker.getRecentCountries() == ['fr', 'it']
+    assert other_country_picker.itemText(0) == 'France'
+
+    # Stored codes in other formats or cases are normalized and unknown codes are dropped
+    settings.setValue('recentCountries', 'DEU, fr,xyz,,FR,276')
+    other_country_picker = CountryPicker()
+    qtbot.addWidget(other_country_picker)
+    other_country_picker.setRecentCountriesSettings(settings)
+    other_country_picker.setRecentCountriesEnabled(True)
+    assert other_country_picker.getRecentCountries() == ['de', 'fr']
+
+    country_picker.setRecentCountriesEnabled(False)
+    assert country_picker.getRecentCountries() == []
+    assert country_picker.itemText(0) == 'Afghanistan'
+
+
+def test_recent_countries_selection(qtbot, qtmodeltester):
+    """Test that picking a pinned country selects its row among the other
+    countries, so changing the pinned countries keeps the selection"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    country_picker.setRecentCountriesEnabled(True)
+    country_picker.setRecentCountries(['de', 'fr'])
+    qtmodeltester.check(country_picker.model())
+
+    changed_countries = []
+    country_picker.countryChanged.connect(changed_countries.append)
+
+    country_picker.setCurrentIndex(0)
+    assert country_picker.getCurrentCountry() == 'de'
+    assert country_picker.currentIndex() == country_picker.model().getCountryRow('de') > 2
+    assert changed_countries == ['de']
+
+    country_picker.setRecentCountries(['us'])
+    assert country_picker.getCurrentCountry() == 'de'
+    assert country_picker.currentIndex() == country_picker.model().getCountryRow('de')
+    assert changed_countries == ['de']
+
+    country_picker.setRecentCountries(['de', 'fr'])
+    country_picker.setCurrentIndex(1)
+    assert country_picker.getCurrentCountry() == 'fr'
+    assert country_picker.getRecentCountries() == ['fr', 'de']
+
+    country_picker.setRecentCountriesEnabled(False)
+    assert country_picker.getCurrentCountry() == 'fr'
+    assert country_picker.currentIndex() == country_picker.model().getCountryRow('fr')
+    assert changed_countries == ['de', 'fr']
+
+    # Without the current country, the first country below the pinned ones is selected
+    country_picker.setRecentCountriesEnabled(True)
+    country_picker.setCountries(['fr', 'it'])
+    country_picker.setCountries(['it', 'es'])
+    assert country_picker.currentIndex() == country_picker.model().getRowOffset()
+    assert country_picker.getCurrentCountry() == 'it'
+    assert country_picker.model().getRowOffset() > 0
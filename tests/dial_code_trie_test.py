@@ -0,0 +1,29 @@
+from src.pyqtcountrypicker.dial_code_trie import DialCodeTrie, get_dial_code_trie
+
+
+def test_match():
+    """Test matching the longest dialing prefix of phone numbers"""
+
+    dial_code_trie = get_dial_code_trie()
+    assert dial_code_trie is get_dial_code_trie()
+    assert dial_code_trie.match('+49 30 123456') == ('de',)
+    assert dial_code_trie.match('0033 1 23') == ('fr',)
+    assert dial_code_trie.match('+1 (204) 555-0100') == ('ca',)
+    assert dial_code_trie.match('+1 876 555 0100') == ('jm',)
+    assert dial_code_trie.match('+1 212 555 0100')[0] == 'us'
+    assert dial_code_trie.match('+7 701')[0] == 'kz'
+    assert dial_code_trie.match('+7 495')[0] == 'ru'
+    assert dial_code_trie.match('+4') == ()
+    assert dial_code_trie.match('') == ()
+
+
+def test_custom_prefixes():
+    """Test matching custom prefixes"""
+
+    dial_code_trie = DialCodeTrie({'1': ('us', 'ca'), '1204': ('ca',)})
+    assert dial_code_trie.match('+1') == ('us', 'ca')
+    assert dial_code_trie.match('+120') == ('us', 'ca')
+    assert dial_code_trie.match('+1204') == ('ca',)
+
+    dial_code_trie.addPrefix('44', ('gb',))
+    assert dial_code_trie.match('+44 20') == ('gb',)
@@ -0,0 +1,39 @@
+import os
+import pytest
+from src.pyqtcountrypicker.flag_atlas import FlagAtlas, build_flag_atlas, DEFAULT_SOURCE_DIR
+from src.pyqtcountrypicker.countries import countries
+
+
+def test_flag_atlas_up_to_date():
+    """Test that the bundled atlas contains the current flag images"""
+
+    flag_atlas = FlagAtlas()
+    assert flag_atlas.getCountryCodes() == list(countries.keys())
+
+    for country_code in countries.keys():
+        with open(os.path.join(DEFAULT_SOURCE_DIR, '{}.png'.format(country_code)), 'rb') as file:
+            assert flag_atlas.getFlagData(country_code) == file.read()
+        assert flag_atlas.getFlagSize(country_code) == (200, 150)
+
+
+def test_build_flag_atlas(tmp_path):
+    """Test building and reading an atlas"""
+
+    atlas_path = str(tmp_path / 'test.atlas')
+    build_flag_atlas(['de', 'sh-ac'], atlas_path=atlas_path)
+
+    flag_atlas = FlagAtlas(atlas_path)
+    assert flag_atlas.getCountryCodes() == ['de', 'sh-ac']
+    assert 'sh-ac' in flag_atlas
+    assert 'us' not in flag_atlas
+    assert flag_atlas.getFlagData('sh-ac')[:8] == b'\x89PNG\r\n\x1a\n'
+
+
+def test_invalid_flag_atlas(tmp_path):
+    """Test opening a file that is not a flag atlas"""
+
+    atlas_path = tmp_path / 'invalid.atlas'
+    atlas_path.write_bytes(b'not an atlas')
+
+    with pytest.raises(ValueError):
+        FlagAtlas(str(atlas_path))
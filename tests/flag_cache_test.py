@@ -0,0 +1,136 @@
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QIcon
+from src.pyqtcountrypicker import CountryPicker
+from src.pyqtcountrypicker import flag_cache
+from src.pyqtcountrypicker.countries import countries
+
+
+def test_default_country_flags_are_shared():
+    """Test that the default country flags are only created once"""
+
+    country_flags = flag_cache.get_default_country_flags()
+    assert country_flags is flag_cache.get_default_country_flags()
+    assert list(country_flags.keys()) == list(countries.keys())
+
+
+def test_country_flags_loaded_on_demand(qtbot, monkeypatch):
+    """Test that flags are only decoded when they are painted"""
+
+    loaded_flags = []
+    load_flag_pixmap = flag_cache._load_flag_pixmap
+
+    def record_flag_pixmap(country_code):
+        loaded_flags.append(country_code)
+        return load_flag_pixmap(country_code)
+
+    monkeypatch.setattr(flag_cache, '_default_country_flags', None)
+    monkeypatch.setattr(flag_cache, '_flag_pixmap_cache', None)
+    monkeypatch.setattr(flag_cache, '_load_flag_pixmap', record_flag_pixmap)
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    assert loaded_flags == []
+    assert not country_picker.getCountryFlag('de').isNull()
+    assert loaded_flags == []
+
+    # Painting a flag loads only that flag and only once
+    pixmap = country_picker.getCountryFlag('de').pixmap(40, 30)
+    assert pixmap.width() == 40
+    assert pixmap.height() == 30
+    country_picker.getCountryFlag('de').pixmap(20, 15)
+    assert loaded_flags == ['de']
+
+    # Showing the closed picker only needs the flag of the current country
+    country_picker.show()
+    country_picker.grab()
+    assert set(loaded_flags) == {'de', 'af'}
+
+
+def test_disabled_country_flag(qtbot):
+    """Test painting a country flag in disabled mode"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+
+    pixmap = country_picker.getCountryFlag('de').pixmap(40, 30, QIcon.Mode.Disabled)
+    assert not pixmap.isNull()
+
+
+def test_flag_pixmap_cache(qtbot, monkeypatch):
+    """Test that scaled flags are cached by size and device pixel ratio"""
+
+    loaded_flags = []
+    load_flag_pixmap = flag_cache._load_flag_pixmap
+
+    def record_flag_pixmap(country_code):
+        loaded_flags.append(country_code)
+        return load_flag_pixmap(country_code)
+
+    monkeypatch.setattr(flag_cache, '_load_flag_pixmap', record_flag_pixmap)
+    pixmap_cache = flag_cache.FlagPixmapCache(max_size=3)
+
+    pixmap = pixmap_cache.getPixmap('de', QSize(20, 15), 2.0, QIcon.Mode.Normal)
+    assert pixmap.size() == QSize(40, 30)
+    assert pixmap.devicePixelRatio() == 2.0
+    assert pixmap_cache.getPixmap('de', QSize(20, 15), 2.0, QIcon.Mode.Normal).cacheKey() == pixmap.cacheKey()
+    assert pixmap_cache.getPixmap('de', QSize(20, 15), 1.0, QIcon.Mode.Normal).size() == QSize(20, 15)
+    assert len(pixmap_cache) == 3
+    assert loaded_flags == ['de']
+
+    # Flags are never scaled up and the least recently used pixmaps are evicted
+    assert pixmap_cache.getPixmap('de', QSize(400, 300), 1.0, QIcon.Mode.Normal).size() == QSize(200, 150)
+    assert len(pixmap_cache) == 3
+    assert pixmap_cache.getPixmap('de', QSize(20, 15), 2.0, QIcon.Mode.Normal).cacheKey() != pixmap.cacheKey()
+
+    pixmap_cache.setMaxSize(1)
+    assert len(pixmap_cache) == 1
+    pixmap_cache.clear()
+    assert len(pixmap_cache) == 0
+
+
+def test_flag_pixmap_cache_is_shared(qtbot):
+    """Test that painting flags fills the shared pixmap cache"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+
+    pixmap_cache = flag_cache.get_flag_pixmap_cache()
+    assert pixmap_cache is flag_cache.get_flag_pixmap_cache()
+
+    pixmap_cache.clear()
+    country_picker.getCountryFlag('fr').pixmap(32, 24)
+    cached_pixmap_count = len(pixmap_cache)
+    CountryPicker().getCountryFlag('fr').pixmap(32, 24)
+    assert len(pixmap_cache) == cached_pixmap_count
+
+
+def test_async_flag_loading(qtbot, monkeypatch):
+    """Test decoding flags in the background with placeholders until they are loaded"""
+
+    monkeypatch.setattr(flag_cache, '_flag_pixmap_cache', None)
+    flag_cache.set_async_flag_loading(True)
+    try:
+        country_picker = CountryPicker()
+        qtbot.addWidget(country_picker)
+        country_picker.setCountries(['de', 'fr', 'us'])
+        assert flag_cache.is_async_flag_loading()
+
+        changed_rows = []
+        country_picker.model().dataChanged.connect(
+            lambda top_left, bottom_right, roles: changed_rows.append((top_left.row(), bottom_right.row())))
+
+        # The placeholder has the size of the flag and is shown until the flag is loaded
+        flag_loader = flag_cache.get_flag_loader()
+        with qtbot.waitSignal(flag_loader.flagLoaded) as blocker:
+            placeholder = country_picker.getCountryFlag('fr').pixmap(40, 30)
+            assert placeholder.size() == QSize(40, 30)
+            assert placeholder.toImage().pixelColor(20, 15).alpha() == flag_cache.PLACEHOLDER_COLOR.alpha()
+            assert flag_loader.isLoading('fr')
+        assert blocker.args == ['fr']
+        assert not flag_loader.isLoading('fr')
+        assert changed_rows == [(0, 0)]
+
+        pixmap = country_picker.getCountryFlag('fr').pixmap(40, 30)
+        assert pixmap.toImage().pixelColor(5, 15).alpha() == 255
+    finally:
+        flag_cache.set_async_flag_loading(False)
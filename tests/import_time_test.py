@@ -0,0 +1,56 @@
+import os
+import sys
+import subprocess
+import pytest
+
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def get_import_times(statement: str) -> dict[str, int]:
+    """Run a statement in a fresh interpreter with -X importtime
+
+    :param statement: statement to run
+    :return: dict containing the cumulative import time in microseconds by module name
+    """
+
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            capture_output=True, text=True, check=True, cwd=REPOSITORY_DIR)
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_time, cumulative_time, module_name = line[len('import time:'):].split('|')
+        import_times[module_name.strip()] = int(cumulative_time)
+    return import_times
+
+
+def test_package_import_is_lazy():
+    """Test that importing the package neither imports Qt nor loads country data"""
+
+    import_times = get_import_times('import src.pyqtcountrypicker')
+
+    assert 'src.pyqtcountrypicker' in import_times
+    assert not any(module_name.startswith(('qtpy', 'PyQt', 'PySide')) for module_name in import_times)
+    assert 'src.pyqtcountrypicker.countries' not in import_times
+
+
+def test_package_import_time():
+    """Test that importing the package costs a fraction of importing the picker"""
+
+    package_time = get_import_times('import src.pyqtcountrypicker')['src.pyqtcountrypicker']
+    picker_time = get_import_times('import src.pyqtcountrypicker.country_picker')['src.pyqtcountrypicker.country_picker']
+    assert package_time * 5 < picker_time
+
+
+def test_lazy_attributes():
+    """Test accessing the lazily imported attributes"""
+
+    import src.pyqtcountrypicker as pyqtcountrypicker
+    from src.pyqtcountrypicker.country_picker import CountryPicker
+
+    assert pyqtcountrypicker.CountryPicker is CountryPicker
+    assert pyqtcountrypicker.countries.countries['de'] == 'Germany'
+    assert 'CountryPicker' in dir(pyqtcountrypicker)
+    with pytest.raises(AttributeError):
+        pyqtcountrypicker.Unknown
@@ -0,0 +1,89 @@
+from PyQt6.QtCore import QLocale
+from src.pyqtcountrypicker import CountryPicker
+from src.pyqtcountrypicker import flag_cache
+from src.pyqtcountrypicker.instrumentation import (TimingHistogram, enable_instrumentation,
+                                                   disable_instrumentation, get_instrumentation)
+
+
+def test_timing_histogram():
+    """Test counting durations by bucket"""
+
+    histogram = TimingHistogram([0.001, 0.01])
+    for duration in [0.0005, 0.001, 0.005, 0.5]:
+        histogram.record(duration)
+
+    assert histogram.getBuckets() == [(0.001, 2), (0.01, 1), (float('inf'), 1)]
+    assert histogram.getCount() == 4
+    assert histogram.getMax() == 0.5
+    assert abs(histogram.getMean() - 0.126625) < 1e-9
+
+
+def test_instrumentation_is_opt_in(qtbot):
+    """Test that nothing is recorded while instrumentation is turned off"""
+
+    assert get_instrumentation() is None
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+    country_picker.setCountries(['de', 'fr'])
+    assert get_instrumentation() is None
+
+
+def test_model_instrumentation(qtbot):
+    """Test the counters and timings of the model"""
+
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+
+    instrumentation = enable_instrumentation()
+    try:
+        assert enable_instrumentation() is instrumentation
+        recorded_timings = []
+        instrumentation.timingRecorded.connect(lambda name, duration: recorded_timings.append(name))
+
+        country_picker.setCountries(['de', 'fr', 'us'])
+        country_picker.setCountries(['de', 'fr', 'it', 'es'])
+        country_picker.setCountryName('de', 'Zzz')
+        with country_picker.batchUpdate():
+            country_picker.setCountries(['at', 'ch'])
+        country_picker.setLocale(QLocale('de_DE'))
+
+        assert instrumentation.getCounter('model.rows_inserted') == 2
+        assert instrumentation.getCounter('model.rows_removed') == len(country_picker.getCountryNames()) - 3 + 1
+        assert instrumentation.getCounter('model.rows_moved') == 1
+        assert instrumentation.getCounter('model.resets') == 1
+        assert instrumentation.getHistogram('model.set_countries').getCount() == 2
+        assert instrumentation.getHistogram('model.reset').getCount() == 1
+        assert 'model.set_locale' in instrumentation.getHistograms()
+        assert recorded_timings.count('model.set_country_names') == 1
+    finally:
+        disable_instrumentation()
+
+
+def test_flag_instrumentation(qtbot, monkeypatch):
+    """Test the counters and timings of the flag cache"""
+
+    monkeypatch.setattr(flag_cache, '_flag_pixmap_cache', None)
+    country_picker = CountryPicker()
+    qtbot.addWidget(country_picker)
+
+    instrumentation = enable_instrumentation()
+    try:
+        incremented_counters = []
+        instrumentation.counterIncremented.connect(lambda name, count: incremented_counters.append(name))
+
+        country_picker.getCountryFlag('de').pixmap(40, 30)
+        country_picker.getCountryFlag('de').pixmap(40, 30)
+        country_picker.getCountryFlag('de').pixmap(20, 15)
+
+        assert instrumentation.getCounters() == {
+            'flags.cache_hits': 1,
+            'flags.cache_misses': 2,
+            'flags.decoded': 1
+        }
+        assert instrumentation.getHistogram('flags.decode').getCount() == 1
+        assert incremented_counters.count('flags.cache_misses') == 2
+
+        instrumentation.reset()
+        assert instrumentation.getCounters() == {}
+    finally:
+        disable_instrumentation()
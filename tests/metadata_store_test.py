@@ -0,0 +1,85 @@
+from src.pyqtcountrypicker.catalog import get_country_catalog
+from src.pyqtcountrypicker.countries import countries
+from src.pyqtcountrypicker.metadata_store import CountryMetadataStore, get_metadata_store
+
+
+def test_columns_match_countries():
+    """Test that the metadata has a row for every country"""
+
+    metadata_store = CountryMetadataStore()
+    assert metadata_store.getColumnNames() == ['alpha2', 'alpha3', 'numeric', 'dial_code', 'currency', 'region']
+    assert all(metadata_store.findCountry(country_code) == country_code for country_code in countries)
+
+
+def test_find_country():
+    """Test finding countries by code in every format"""
+
+    metadata_store = CountryMetadataStore()
+    assert metadata_store.findCountry('de') == 'de'
+    assert metadata_store.findCountry('DEU') == 'de'
+    assert metadata_store.findCountry('276') == 'de'
+    assert metadata_store.findCountry('XKX') == 'xk'
+    assert metadata_store.findCountry('xyz') is None
+    assert metadata_store.findCountry(None) is None
+
+
+def test_normalized_lookups():
+    """Test that every lookup by code normalizes the code like the catalog"""
+
+    metadata_store = CountryMetadataStore()
+    country_catalog = get_country_catalog()
+    for code in [' DEU ', ' de', 'Fra', '\t840\n', 'sh-AC', ' xyz ', '']:
+        assert metadata_store.findCountry(code) == country_catalog.normalizeCode(code)
+    assert metadata_store.getCountry(' deu ') is metadata_store.getCountry('de')
+    assert metadata_store.getMetadata(' de')['currency'] == country_catalog.getValue(' de', 'currency') == 'EUR'
+    assert metadata_store.convertCode(' Fra ', 'numeric') == '250'
+    assert metadata_store.getValue('usa ', 'dial_code') == '1'
+
+
+def test_convert_code():
+    """Test converting codes between the formats"""
+
+    metadata_store = CountryMetadataStore()
+    assert metadata_store.convertCode('gb', 'alpha3') == 'GBR'
+    assert metadata_store.convertCode('GBR', 'numeric') == '826'
+    assert metadata_store.convertCode('004', 'alpha2') == 'af'
+    assert metadata_store.convertCode('sh-ac', 'numeric') == 'sh-ac'
+    assert metadata_store.convertCode('xyz', 'alpha3') is None
+
+
+def test_metadata():
+    """Test getting the metadata of a country"""
+
+    metadata_store = CountryMetadataStore()
+    assert metadata_store.getMetadata('FRA') == {
+        'alpha2': 'fr', 'alpha3': 'FRA', 'numeric': '250', 'dial_code': '33', 'currency': 'EUR', 'region': 'Europe'
+    }
+    assert metadata_store.getValue('jp', 'currency') == 'JPY'
+    assert metadata_store.getValue('xyz', 'currency') is None
+
+
+def test_countries_by_value():
+    """Test getting the countries sharing a value"""
+
+    metadata_store = get_metadata_store()
+    assert metadata_store is get_metadata_store()
+    assert {'us', 'ca', 'jm'} <= set(metadata_store.getCountriesByDialCode('+1'))
+    assert metadata_store.getCountriesByDialCode('49') == ['de']
+    assert {'de', 'fr', 'it'} <= set(metadata_store.getCountriesByCurrency('eur'))
+    assert 'br' in metadata_store.getCountriesByRegion('Americas')
+    assert metadata_store.getCountriesByRegion('Atlantis') == []
+
+
+def test_country_records():
+    """Test that the country records are shared and their strings interned"""
+
+    metadata_store = CountryMetadataStore()
+    country = metadata_store.getCountry('DEU')
+    assert country is metadata_store.getCountry('de')
+    assert country is metadata_store.getCountries()[list(countries.keys()).index('de')]
+    assert (country.getCode(), country.getName(), country.getAlpha3Code(), country.getNumericCode()) == \
+        ('de', 'Germany', 'DEU', '276')
+    assert (country.getDialCode(), country.getCurrency(), country.getRegion()) == ('49', 'EUR', 'Europe')
+    assert country.getRegion() is metadata_store.getCountry('fr').getRegion()
+    assert metadata_store.getCountry('xyz') is None
+    assert not hasattr(country, '__dict__')
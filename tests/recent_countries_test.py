@@ -0,0 +1,33 @@
+from src.pyqtcountrypicker.recent_countries import RecentCountries
+
+
+def test_most_recent_first():
+    """Test that recently selected countries are kept most recent first"""
+
+    recent_countries = RecentCountries(3)
+    recent_countries.add('de')
+    recent_countries.add('fr')
+    recent_countries.add('it')
+    assert recent_countries.getCountries() == ['it', 'fr', 'de']
+
+    recent_countries.add('de')
+    assert recent_countries.getCountries() == ['de', 'it', 'fr']
+    assert 'fr' in recent_countries
+
+
+def test_max_size():
+    """Test that the least recently selected countries are forgotten"""
+
+    recent_countries = RecentCountries(2)
+    recent_countries.setCountries(['de', 'fr', 'it'])
+    assert recent_countries.getCountries() == ['de', 'fr']
+
+    recent_countries.add('us')
+    assert recent_countries.getCountries() == ['us', 'de']
+
+    recent_countries.setMaxSize(1)
+    assert recent_countries.getCountries() == ['us']
+    assert recent_countries.getMaxSize() == 1
+
+    recent_countries.clear()
+    assert len(recent_countries) == 0
@@ -0,0 +1,36 @@
+from src.pyqtcountrypicker.search_index import CountrySearchIndex, fold_text
+
+
+def test_fold_text():
+    """Test folding accents, case and punctuation"""
+
+    assert fold_text('  Côte d\'Ivoire ') == 'cote d ivoire'
+    assert fold_text('ÅLAND Islands') == 'aland islands'
+
+
+def test_search_ranking():
+    """Test that exact code and alias matches come before prefix matches"""
+
+    search_index = CountrySearchIndex()
+    assert search_index.search('usa')[0] == 'us'
+    assert search_index.search('uk')[0] == 'gb'
+    assert search_index.search('de')[0] == 'de'
+    assert search_index.search('germ') == ['de']
+    assert search_index.search('cote') == ['ci']
+    assert search_index.search('united states')[0] == 'us'
+    assert search_index.search('xyz') == []
+    assert search_index.search('') == []
+    assert len(search_index.search('a', limit=5)) == 5
+
+
+def test_incremental_rename():
+    """Test that renaming a country only reindexes its words"""
+
+    search_index = CountrySearchIndex({'de': 'Germany', 'fr': 'France'}, {})
+    search_index.setCountryName('fr', 'Frankreich')
+    search_index.setCountryNames({'de': 'Deutschland', 'xx': 'Unknown'})
+    assert search_index.search('france') == []
+    assert search_index.search('frank') == ['fr']
+    assert search_index.search('germany') == []
+    assert search_index.search('deutsch') == ['de']
+    assert search_index.search('unknown') == []
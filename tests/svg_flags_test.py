@@ -0,0 +1,74 @@
+import os
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QIcon
+from src.pyqtcountrypicker import flag_cache
+from src.pyqtcountrypicker.svg_flags import SvgFlagRenderer
+
+
+# Simplified flag of France with a 3:2 aspect ratio
+FRANCE_SVG = '''<svg xmlns="http://www.w3.org/2000/svg" width="90" height="60" viewBox="0 0 3 2">
+<rect width="1" height="2" x="0" fill="#002654"/>
+<rect width="1" height="2" x="1" fill="#ffffff"/>
+<rect width="1" height="2" x="2" fill="#ce1126"/>
+</svg>'''
+
+
+def write_svg_flags(svg_dir: str):
+    """Write the SVG flags used by the tests
+
+    :param svg_dir: directory to write the flags to
+    """
+
+    os.makedirs(svg_dir, exist_ok=True)
+    with open(os.path.join(svg_dir, 'fr.svg'), 'w') as file:
+        file.write(FRANCE_SVG)
+
+
+def test_render_svg_flag(qtbot, tmp_path):
+    """Test rasterizing a flag at the requested size"""
+
+    write_svg_flags(str(tmp_path))
+    svg_flag_renderer = SvgFlagRenderer(str(tmp_path))
+    assert svg_flag_renderer.hasFlag('fr')
+    assert not svg_flag_renderer.hasFlag('de')
+
+    image = svg_flag_renderer.renderFlag('fr', QSize(600, 600))
+    assert image.size() == QSize(600, 400)
+    assert image.pixelColor(50, 200).name() == '#002654'
+    assert image.pixelColor(550, 200).name() == '#ce1126'
+
+
+def test_svg_flag_disk_cache(qtbot, tmp_path):
+    """Test that rasterized flags are read from the disk cache on later launches"""
+
+    svg_dir = str(tmp_path / 'svg')
+    cache_dir = str(tmp_path / 'cache')
+    write_svg_flags(svg_dir)
+    SvgFlagRenderer(svg_dir, cache_dir).renderFlag('fr', QSize(120, 80))
+    assert os.listdir(cache_dir) == ['fr-120x80.png']
+
+    # The broken SVG file is never parsed, since its rasterized flag is newer
+    svg_path = os.path.join(svg_dir, 'fr.svg')
+    with open(svg_path, 'w') as file:
+        file.write('broken')
+    os.utime(svg_path, (0, 0))
+    image = SvgFlagRenderer(svg_dir, cache_dir).renderFlag('fr', QSize(120, 80))
+    assert image.size() == QSize(120, 80)
+    assert image.pixelColor(10, 40).name() == '#002654'
+
+
+def test_svg_flag_icons(qtbot, tmp_path):
+    """Test that flag icons use the SVG flags at sizes beyond the bundled flags"""
+
+    write_svg_flags(str(tmp_path))
+    flag_cache.set_svg_flag_dir(str(tmp_path))
+    try:
+        country_flags = flag_cache.get_default_country_flags()
+        assert country_flags['fr'].pixmap(QSize(600, 400)).size() == QSize(600, 400)
+        assert country_flags['fr'].pixmap(QSize(600, 400), QIcon.Mode.Disabled).size() == QSize(600, 400)
+        assert not country_flags['de'].pixmap(QSize(600, 450)).isNull()
+    finally:
+        flag_cache.set_svg_flag_dir(None)
+
+    assert flag_cache.get_svg_flag_renderer() is None
+    assert country_flags['fr'].pixmap(QSize(600, 400)).size() == QSize(200, 150)